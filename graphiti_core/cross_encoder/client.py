@@ -14,8 +14,18 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import typing
 from abc import ABC, abstractmethod
 
+from graphiti_core.utils.concurrency import ConcurrencyPool, pooled
+from graphiti_core.utils.rate_limiter import RateLimiter, rate_limited
+
+
+def _estimate_rank_tokens(
+    query: str, passages: list[str], *args: typing.Any, **kwargs: typing.Any
+) -> int:
+    return (len(query) * len(passages) + sum(len(passage) for passage in passages)) // 4 + 1
+
 
 class CrossEncoderClient(ABC):
     """
@@ -24,6 +34,17 @@ class CrossEncoderClient(ABC):
     It allows for different implementations of cross-encoder models to be used interchangeably.
     """
 
+    # Shared per client class and endpoint unless set on the instance, see utils.rate_limiter
+    rate_limiter: RateLimiter | None = None
+    # Default LLM pool unless set on the instance, see utils.concurrency
+    concurrency_pool: ConcurrencyPool | None = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Every provider request goes through the rate limiter of the client
+        if 'rank' in cls.__dict__:
+            cls.rank = rate_limited(pooled(cls.__dict__['rank'], 'llm'), _estimate_rank_tokens)  # type: ignore[method-assign]
+
     @abstractmethod
     async def rank(self, query: str, passages: list[str]) -> list[tuple[str, float]]:
         """
@@ -19,7 +19,12 @@ import logging
 from abc import ABC, abstractmethod
 from collections.abc import Coroutine
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from graphiti_core.utils.concurrency import ConcurrencyPool, pooled
+
+if TYPE_CHECKING:
+    from graphiti_core.search.search_cache import SearchCache
 
 logger = logging.getLogger(__name__)
 
@@ -61,11 +66,39 @@ class GraphDriver(ABC):
         ''  # Neo4j (default) syntax does not require a prefix for fulltext queries
     )
     _database: str
+    # Optional search result cache; writes made through the driver invalidate it per group_id
+    search_cache: 'SearchCache | None' = None
+    # Default database pool unless set on the instance, see utils.concurrency
+    concurrency_pool: ConcurrencyPool | None = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Every query holds a slot of the database pool while it runs
+        for name in ('execute_query', 'execute_batch'):
+            if name in cls.__dict__:
+                setattr(cls, name, pooled(cls.__dict__[name], 'db'))
 
     @abstractmethod
     def execute_query(self, cypher_query_: str, **kwargs: Any) -> Coroutine:
         raise NotImplementedError()
 
+    async def execute_batch(
+        self, statements: list[tuple[str, dict[str, Any]]]
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Execute several statements and return the records of each, in order.
+
+        Backends that can send multiple statements in one round-trip override this; the default
+        runs the statements sequentially through `execute_query`.
+        """
+        results: list[list[dict[str, Any]]] = []
+        for query, params in statements:
+            result = await self.execute_query(query, **params)
+            records = result[0] if result else []
+            results.append(list(records))
+
+        return results
+
     @abstractmethod
     def session(self, database: str | None = None) -> GraphDriverSession:
         raise NotImplementedError()
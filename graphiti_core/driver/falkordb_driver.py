@@ -14,10 +14,11 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import asyncio
 import logging
 import os
 import re
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 from urllib.parse import urlparse
 
 from pydantic import BaseModel, Field, field_validator
@@ -25,10 +26,12 @@ from pydantic import BaseModel, Field, field_validator
 if TYPE_CHECKING:
     from falkordb import Graph as FalkorGraph
     from falkordb.asyncio import FalkorDB
+    from falkordb.asyncio.query_result import QueryResult
 else:
     try:
         from falkordb import Graph as FalkorGraph
         from falkordb.asyncio import FalkorDB
+        from falkordb.asyncio.query_result import QueryResult
     except ImportError:
         # If falkordb is not installed, raise an ImportError
         raise ImportError(
@@ -54,6 +57,8 @@ class FalkorDBConfig(BaseModel):
     - FALKORDB_DATABASE: Database number (default: 0)
     - FALKORDB_PASSWORD: Authentication password (optional)
     - FALKORDB_CONNECTION_STRING: Alternative Redis-style connection string
+    - FALKORDB_MAX_CONNECTIONS: Maximum size of the async connection pool (optional)
+    - FALKORDB_AUTO_PIPELINE: Pipeline concurrently issued queries (default: false)
 
     Connection String Format:
     redis://[:password@]host:port/db
@@ -66,6 +71,13 @@ class FalkorDBConfig(BaseModel):
     connection_string: str | None = Field(
         default=None, description="Redis-style connection string"
     )
+    max_connections: int | None = Field(
+        default=None, description="Maximum size of the async connection pool"
+    )
+    auto_pipeline: bool = Field(
+        default=False,
+        description="Coalesce concurrently issued queries into a single Redis pipeline",
+    )
 
     @classmethod
     def from_env(cls) -> "FalkorDBConfig":
@@ -79,8 +91,18 @@ class FalkorDBConfig(BaseModel):
         """
         connection_string = os.getenv("FALKORDB_CONNECTION_STRING")
 
+        # Pool and pipelining settings apply to both configuration styles
+        max_connections = os.getenv("FALKORDB_MAX_CONNECTIONS")
+        pool_settings: dict[str, Any] = {
+            "max_connections": int(max_connections) if max_connections else None,
+            "auto_pipeline": os.getenv("FALKORDB_AUTO_PIPELINE", "false").lower()
+            in ("1", "true", "yes"),
+        }
+
         if connection_string:
-            return cls.from_connection_string(connection_string)
+            return cls.from_connection_string(connection_string).model_copy(
+                update=pool_settings
+            )
 
         # Use individual environment variables with defaults
         return cls(
@@ -88,6 +110,7 @@ class FalkorDBConfig(BaseModel):
             port=int(os.getenv("FALKORDB_PORT", "6379")),
             database=int(os.getenv("FALKORDB_DATABASE", "0")),
             password=os.getenv("FALKORDB_PASSWORD"),
+            **pool_settings,
         )
 
     @classmethod
@@ -160,6 +183,14 @@ class FalkorDBConfig(BaseModel):
             raise ValueError(f"Database number must be non-negative, got: {v}")
         return v
 
+    @field_validator("max_connections")
+    @classmethod
+    def validate_max_connections(cls, v: int | None) -> int | None:
+        """Validate connection pool size is positive."""
+        if v is not None and v < 1:
+            raise ValueError(f"max_connections must be at least 1, got: {v}")
+        return v
+
     @field_validator("connection_string")
     @classmethod
     def validate_connection_string(cls, v: str | None) -> str | None:
@@ -218,6 +249,9 @@ class FalkorDBConfig(BaseModel):
         if self.password:
             kwargs["password"] = self.password
 
+        if self.max_connections is not None:
+            kwargs["max_connections"] = self.max_connections
+
         return kwargs
 
     def get_database_name(self) -> str:
@@ -234,6 +268,68 @@ class FalkorDBConfig(BaseModel):
         return str(self.database)
 
 
+def _queue_graph_query(pipeline: Any, graph: FalkorGraph, query: str, params: dict[str, Any]):
+    # Mirrors AsyncGraph.query: parameters are sent as a CYPHER header in front of the query
+    pipeline.execute_command(
+        "GRAPH.QUERY",
+        graph.name,
+        graph._build_params_header(params) + query,
+        "--compact",
+    )
+
+
+class _QueryPipeline:
+    """Coalesces queries issued in the same event loop tick into a single Redis pipeline.
+
+    Independent queries that are started concurrently (e.g. the edge, node, episode and
+    community searches gathered by `search`) share one network round-trip instead of
+    each waiting on its own connection.
+    """
+
+    def __init__(self, connection: Any):
+        self.connection = connection
+        self._pending: list[tuple[FalkorGraph, str, dict[str, Any], asyncio.Future]] = []
+        self._flush_task: asyncio.Task | None = None
+
+    async def query(self, graph: FalkorGraph, query: str, params: dict[str, Any]) -> Any:
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending.append((graph, query, params, future))
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush())
+
+        response = await future
+        result = QueryResult(graph)
+        await result.parse(response)
+        return result
+
+    async def _flush(self):
+        # Yield once so that queries started concurrently with the first one join this batch
+        await asyncio.sleep(0)
+        pending, self._pending = self._pending, []
+        self._flush_task = None
+
+        pipeline = self.connection.pipeline(transaction=False)
+        for graph, query, params, _ in pending:
+            _queue_graph_query(pipeline, graph, query, params)
+
+        try:
+            responses = await pipeline.execute(raise_on_error=False)
+        except Exception as e:
+            for *_, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (*_, future), response in zip(pending, responses, strict=True):
+            if future.done():
+                # The caller was cancelled while the pipeline was in flight
+                continue
+            if isinstance(response, Exception):
+                future.set_exception(response)
+            else:
+                future.set_result(response)
+
+
 class FalkorDriverSession(GraphDriverSession):
     provider = GraphProvider.FALKORDB
 
@@ -281,6 +377,8 @@ class FalkorDriver(GraphDriver):
         falkor_db: FalkorDB | None = None,
         database: str | None = None,
         config: FalkorDBConfig | None = None,
+        max_connections: int | None = None,
+        auto_pipeline: bool | None = None,
     ):
         """
         Initialize the FalkorDB driver.
@@ -302,6 +400,9 @@ class FalkorDriver(GraphDriver):
             falkor_db: Pre-configured FalkorDB instance to use directly
             database: Database name/number (overrides config and environment)
             config: FalkorDBConfig instance with connection parameters
+            max_connections: Maximum size of the async connection pool (overrides config and environment)
+            auto_pipeline: Coalesce concurrently issued queries into a single Redis pipeline
+                (overrides config and environment)
         """
         super().__init__()
 
@@ -310,6 +411,7 @@ class FalkorDriver(GraphDriver):
             self.client = falkor_db
             # Use provided database or default
             self._database = database or "default_db"
+            self.auto_pipeline = bool(auto_pipeline)
         else:
             # Determine configuration in order of precedence
             if config is None:
@@ -333,6 +435,12 @@ class FalkorDriver(GraphDriver):
             if username is not None and "password" not in connection_params:
                 # Support legacy username parameter by setting it as password if password not provided
                 connection_params["password"] = username
+            if max_connections is not None:
+                connection_params["max_connections"] = max_connections
+
+            self.auto_pipeline = (
+                config.auto_pipeline if auto_pipeline is None else auto_pipeline
+            )
 
             # Initialize the FalkorDB client
             self.client = FalkorDB(**connection_params)
@@ -343,22 +451,42 @@ class FalkorDriver(GraphDriver):
             else:
                 self._database = config.get_database_name()
 
+        # Graph handles are cheap but stateless wrappers; cache one per graph name
+        self._graphs: dict[str, FalkorGraph] = {}
+
+        self._query_pipeline: _QueryPipeline | None = None
+        if self.auto_pipeline:
+            connection = getattr(self.client, "connection", None)
+            if hasattr(connection, "pipeline"):
+                self._query_pipeline = _QueryPipeline(connection)
+            else:
+                logger.warning(
+                    "FalkorDB connection does not support pipelining; auto_pipeline disabled"
+                )
+
         self.fulltext_syntax = "@"  # FalkorDB uses a redisearch-like syntax for fulltext queries see https://redis.io/docs/latest/develop/ai/search-and-query/query/full-text/
 
     def _get_graph(self, graph_name: str | None) -> FalkorGraph:
         # FalkorDB requires a non-None database name for multi-tenant graphs; the default is "default_db"
         if graph_name is None:
             graph_name = self._database
-        return self.client.select_graph(graph_name)
+        graph = self._graphs.get(graph_name)
+        if graph is None:
+            graph = self.client.select_graph(graph_name)
+            self._graphs[graph_name] = graph
+        return graph
 
     async def execute_query(self, cypher_query_, **kwargs: Any):
         graph = self._get_graph(self._database)
 
         # Convert datetime objects to ISO strings (FalkorDB does not support datetime objects directly)
-        params = convert_datetimes_to_strings(dict(kwargs))
+        params = cast(dict[str, Any], convert_datetimes_to_strings(dict(kwargs)))
 
         try:
-            result = await graph.query(cypher_query_, params)  # type: ignore[reportUnknownArgumentType]
+            if self._query_pipeline is not None:
+                result = await self._query_pipeline.query(graph, cypher_query_, params)
+            else:
+                result = await graph.query(cypher_query_, params)  # type: ignore[reportUnknownArgumentType]
         except Exception as e:
             if "already indexed" in str(e):
                 # check if index already exists
@@ -369,6 +497,46 @@ class FalkorDriver(GraphDriver):
             )
             raise
 
+        records, header = self._result_to_records(result)
+
+        return records, header, None
+
+    async def execute_batch(
+        self, statements: list[tuple[str, dict[str, Any]]]
+    ) -> list[list[dict[str, Any]]]:
+        """Send all statements in a single Redis pipeline (one network round-trip)."""
+        connection = getattr(self.client, "connection", None)
+        if not statements or not hasattr(connection, "pipeline"):
+            return await super().execute_batch(statements)
+
+        graph = self._get_graph(self._database)
+        pipeline = connection.pipeline(transaction=False)  # type: ignore[union-attr]
+        for query, params in statements:
+            _queue_graph_query(
+                pipeline, graph, query, cast(dict[str, Any], convert_datetimes_to_strings(dict(params)))
+            )
+
+        responses = await pipeline.execute(raise_on_error=False)
+
+        results: list[list[dict[str, Any]]] = []
+        for (query, _), response in zip(statements, responses, strict=True):
+            if isinstance(response, Exception):
+                if "already indexed" in str(response):
+                    logger.info(f"Index already exists: {response}")
+                    results.append([])
+                    continue
+                logger.error(f"Error executing FalkorDB query: {response}\n{query}")
+                raise response
+
+            result = QueryResult(graph)
+            await result.parse(response)
+            records, _ = self._result_to_records(result)
+            results.append(records)
+
+        return results
+
+    @staticmethod
+    def _result_to_records(result: Any) -> tuple[list[dict[str, Any]], list[str]]:
         # Convert the result header to a list of strings
         header = [h[1] for h in result.header]
 
@@ -384,7 +552,7 @@ class FalkorDriver(GraphDriver):
                     record[field_name] = None
             records.append(record)
 
-        return records, header, None
+        return records, header
 
     def session(self, database: str | None = None) -> GraphDriverSession:
         return FalkorDriverSession(self._get_graph(database))
@@ -408,6 +576,10 @@ class FalkorDriver(GraphDriver):
         Returns a shallow copy of this driver with a different default database.
         Reuses the same connection (e.g. FalkorDB, Neo4j).
         """
-        cloned = FalkorDriver(falkor_db=self.client, database=database)
+        cloned = FalkorDriver(
+            falkor_db=self.client, database=database, auto_pipeline=self.auto_pipeline
+        )
+        # Cache keys include the database, so clones can share the search cache
+        cloned.search_cache = self.search_cache
 
         return cloned
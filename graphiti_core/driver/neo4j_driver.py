@@ -53,6 +53,25 @@ class Neo4jDriver(GraphDriver):
 
         return result
 
+    async def execute_batch(
+        self, statements: list[tuple[str, dict[str, Any]]]
+    ) -> list[list[dict[str, Any]]]:
+        # Run all statements in a single write transaction (one commit, one connection checkout)
+        async def _run_batch(tx) -> list[list[dict[str, Any]]]:
+            results = []
+            for query, params in statements:
+                params = {k: v for k, v in params.items() if k not in ('database_', 'routing_')}
+                result = await tx.run(query, parameters=params)
+                results.append(await result.data())
+            return results
+
+        try:
+            async with self.client.session(database=self._database) as session:
+                return await session.execute_write(_run_batch)
+        except Exception as e:
+            logger.error(f'Error executing Neo4j batch of {len(statements)} statements: {e}')
+            raise
+
     def session(self, database: str | None = None) -> GraphDriverSession:
         _database = database or self._database
         return self.client.session(database=_database)  # type: ignore
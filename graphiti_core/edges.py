@@ -38,6 +38,7 @@ from graphiti_core.models.edges.edge_db_queries import (
     get_entity_edge_save_query,
 )
 from graphiti_core.nodes import Node
+from graphiti_core.search.search_cache import invalidate_search_cache
 
 logger = logging.getLogger(__name__)
 
@@ -54,19 +55,23 @@ class Edge(BaseModel, ABC):
 
     async def delete(self, driver: GraphDriver):
         if driver.provider == GraphProvider.KUZU:
-            await driver.execute_query(
-                """
-                MATCH (n)-[e:MENTIONS|HAS_MEMBER {uuid: $uuid}]->(m)
-                DELETE e
-                """,
-                uuid=self.uuid,
-            )
-            await driver.execute_query(
-                """
-                MATCH (e:RelatesToNode_ {uuid: $uuid})
-                DETACH DELETE e
-                """,
-                uuid=self.uuid,
+            await driver.execute_batch(
+                [
+                    (
+                        """
+                        MATCH (n)-[e:MENTIONS|HAS_MEMBER {uuid: $uuid}]->(m)
+                        DELETE e
+                        """,
+                        {'uuid': self.uuid},
+                    ),
+                    (
+                        """
+                        MATCH (e:RelatesToNode_ {uuid: $uuid})
+                        DETACH DELETE e
+                        """,
+                        {'uuid': self.uuid},
+                    ),
+                ]
             )
         else:
             await driver.execute_query(
@@ -77,26 +82,31 @@ class Edge(BaseModel, ABC):
                 uuid=self.uuid,
             )
 
+        invalidate_search_cache(driver, [self.group_id])
         logger.debug(f'Deleted Edge: {self.uuid}')
 
     @classmethod
     async def delete_by_uuids(cls, driver: GraphDriver, uuids: list[str]):
         if driver.provider == GraphProvider.KUZU:
-            await driver.execute_query(
-                """
-                MATCH (n)-[e:MENTIONS|HAS_MEMBER]->(m)
-                WHERE e.uuid IN $uuids
-                DELETE e
-                """,
-                uuids=uuids,
-            )
-            await driver.execute_query(
-                """
-                MATCH (e:RelatesToNode_)
-                WHERE e.uuid IN $uuids
-                DETACH DELETE e
-                """,
-                uuids=uuids,
+            await driver.execute_batch(
+                [
+                    (
+                        """
+                        MATCH (n)-[e:MENTIONS|HAS_MEMBER]->(m)
+                        WHERE e.uuid IN $uuids
+                        DELETE e
+                        """,
+                        {'uuids': uuids},
+                    ),
+                    (
+                        """
+                        MATCH (e:RelatesToNode_)
+                        WHERE e.uuid IN $uuids
+                        DETACH DELETE e
+                        """,
+                        {'uuids': uuids},
+                    ),
+                ]
             )
         else:
             await driver.execute_query(
@@ -108,6 +118,8 @@ class Edge(BaseModel, ABC):
                 uuids=uuids,
             )
 
+        # The group_ids of the deleted edges are unknown here
+        invalidate_search_cache(driver)
         logger.debug(f'Deleted Edges: {uuids}')
 
     def __hash__(self):
@@ -133,6 +145,7 @@ class EpisodicEdge(Edge):
             created_at=self.created_at,
         )
 
+        invalidate_search_cache(driver, [self.group_id])
         logger.debug(f'Saved edge to Graph: {self.uuid}')
 
         return result
@@ -306,6 +319,7 @@ class EntityEdge(Edge):
                 edge_data=edge_data,
             )
 
+        invalidate_search_cache(driver, [self.group_id])
         logger.debug(f'Saved edge to Graph: {self.uuid}')
 
         return result
@@ -454,6 +468,7 @@ class CommunityEdge(Edge):
             created_at=self.created_at,
         )
 
+        invalidate_search_cache(driver, [self.group_id])
         logger.debug(f'Saved edge to Graph: {self.uuid}')
 
         return result
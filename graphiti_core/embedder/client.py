@@ -14,11 +14,15 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import typing
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
 
 from pydantic import BaseModel, Field
 
+from graphiti_core.utils.concurrency import ConcurrencyPool, pooled
+from graphiti_core.utils.rate_limiter import RateLimiter, rate_limited
+
 EMBEDDING_DIM = 1024
 
 
@@ -26,7 +30,31 @@ class EmbedderConfig(BaseModel):
     embedding_dim: int = Field(default=EMBEDDING_DIM, frozen=True)
 
 
+def _estimate_input_tokens(input_data: typing.Any, *args: typing.Any, **kwargs: typing.Any) -> int:
+    if isinstance(input_data, str):
+        return len(input_data) // 4 + 1
+    if not isinstance(input_data, list | tuple):
+        return 1
+    return sum(len(item) // 4 + 1 if isinstance(item, str) else 1 for item in input_data)
+
+
 class EmbedderClient(ABC):
+    # Shared per client class and endpoint unless set on the instance, see utils.rate_limiter
+    rate_limiter: RateLimiter | None = None
+    # Default embedder pool unless set on the instance, see utils.concurrency
+    concurrency_pool: ConcurrencyPool | None = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Every provider request goes through the rate limiter of the client
+        for name in ('create', 'create_batch'):
+            if name in cls.__dict__:
+                setattr(
+                    cls,
+                    name,
+                    rate_limited(pooled(cls.__dict__[name], 'embedder'), _estimate_input_tokens),
+                )
+
     @abstractmethod
     async def create(
         self, input_data: str | list[str] | Iterable[int] | Iterable[Iterable[int]]
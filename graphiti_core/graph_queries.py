@@ -5,9 +5,45 @@ This module provides database-agnostic query generation for Neo4j and FalkorDB,
 supporting index creation, fulltext search, and bulk operations.
 """
 
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any, TypeVar
+
 from typing_extensions import LiteralString
 
 from graphiti_core.driver.driver import GraphProvider
+from graphiti_core.embedder.client import EMBEDDING_DIM
+
+QUERY_TEMPLATE_CACHE_SIZE = 1024
+
+T = TypeVar('T', bound=Callable)
+
+# Registry of memoized query template builders, keyed by qualified function name
+_query_template_registry: dict[str, Callable] = {}
+
+
+def query_template(func: T) -> T:
+    """
+    Memoize a query template builder.
+
+    Builders must be pure functions of hashable arguments (provider, filter fragments, index
+    names, ...) that return query text only; parameter values are always passed separately so
+    every (builder, provider, filter-shape) combination maps to one stable query string. This
+    avoids rebuilding the same Cypher on every call and lets the database reuse its plan cache.
+    """
+    cached = lru_cache(maxsize=QUERY_TEMPLATE_CACHE_SIZE)(func)
+    _query_template_registry[f'{func.__module__}.{func.__qualname__}'] = cached
+    return cached  # type: ignore[return-value]
+
+
+def query_template_cache_info() -> dict[str, Any]:
+    return {name: builder.cache_info() for name, builder in _query_template_registry.items()}  # type: ignore[attr-defined]
+
+
+def clear_query_template_cache():
+    for builder in _query_template_registry.values():
+        builder.cache_clear()  # type: ignore[attr-defined]
+
 
 # Mapping from Neo4j fulltext index names to FalkorDB node labels
 NEO4J_TO_FALKORDB_MAPPING = {
@@ -98,6 +134,48 @@ def get_fulltext_indices(provider: GraphProvider) -> list[LiteralString]:
     ]
 
 
+def get_vector_indices(
+    provider: GraphProvider, embedding_dim: int = EMBEDDING_DIM
+) -> list[LiteralString]:
+    if provider == GraphProvider.FALKORDB:
+        options = f"OPTIONS {{dimension: {embedding_dim}, similarityFunction: 'cosine'}}"
+        return [
+            f'CREATE VECTOR INDEX FOR (n:Entity) ON (n.name_embedding) {options}',  # type: ignore[list-item]
+            f'CREATE VECTOR INDEX FOR (n:Community) ON (n.name_embedding) {options}',  # type: ignore[list-item]
+            f'CREATE VECTOR INDEX FOR ()-[e:RELATES_TO]-() ON (e.fact_embedding) {options}',  # type: ignore[list-item]
+        ]
+
+    # Neo4j vector indexes are created per group by `build_dynamic_indexes`. Kuzu vector indexes
+    # require fixed-size array columns that can no longer be updated with SET once indexed.
+    return []
+
+
+@query_template
+def get_vector_index_query(label: str, attribute: str, provider: GraphProvider) -> str:
+    """
+    Approximate nearest neighbour lookup against a native vector index.
+
+    Yields the matched element and its normalized cosine similarity as `score`. Only FalkorDB
+    is supported; `$vector_k` controls how many neighbours are fetched before filtering.
+    """
+    if provider != GraphProvider.FALKORDB:
+        raise ValueError(f'Native vector index queries are not supported for {provider}')
+
+    if label == 'RELATES_TO':
+        return (
+            f"CALL db.idx.vector.queryRelationships('{label}', '{attribute}', $vector_k, "
+            'vecf32($search_vector)) YIELD relationship, score AS distance '
+            'WITH relationship, (2 - distance) / 2 AS score'
+        )
+
+    return (
+        f"CALL db.idx.vector.queryNodes('{label}', '{attribute}', $vector_k, "
+        'vecf32($search_vector)) YIELD node, score AS distance '
+        'WITH node, (2 - distance) / 2 AS score'
+    )
+
+
+@query_template
 def get_nodes_query(name: str, query: str, limit: int, provider: GraphProvider) -> str:
     if provider == GraphProvider.FALKORDB:
         label = NEO4J_TO_FALKORDB_MAPPING[name]
@@ -110,6 +188,7 @@ def get_nodes_query(name: str, query: str, limit: int, provider: GraphProvider)
     return f'CALL db.index.fulltext.queryNodes("{name}", {query}, {{limit: $limit}})'
 
 
+@query_template
 def get_vector_cosine_func_query(vec1, vec2, provider: GraphProvider) -> str:
     if provider == GraphProvider.FALKORDB:
         # FalkorDB uses a different syntax for regular cosine similarity and Neo4j uses normalized cosine similarity
@@ -121,13 +200,16 @@ def get_vector_cosine_func_query(vec1, vec2, provider: GraphProvider) -> str:
     return f'vector.similarity.cosine({vec1}, {vec2})'
 
 
-def get_relationships_query(name: str, limit: int, provider: GraphProvider) -> str:
+@query_template
+def get_relationships_query(
+    name: str, limit: int, provider: GraphProvider, query: str = '$query'
+) -> str:
     if provider == GraphProvider.FALKORDB:
         label = NEO4J_TO_FALKORDB_MAPPING[name]
-        return f"CALL db.idx.fulltext.queryRelationships('{label}', $query)"
+        return f"CALL db.idx.fulltext.queryRelationships('{label}', {query})"
 
     if provider == GraphProvider.KUZU:
         label = INDEX_TO_LABEL_KUZU_MAPPING[name]
-        return f"CALL QUERY_FTS_INDEX('{label}', '{name}', cast($query AS STRING), TOP := $limit)"
+        return f"CALL QUERY_FTS_INDEX('{label}', '{name}', cast({query} AS STRING), TOP := $limit)"
 
-    return f'CALL db.index.fulltext.queryRelationships("{name}", $query, {{limit: $limit}})'
+    return f'CALL db.index.fulltext.queryRelationships("{name}", {query}, {{limit: $limit}})'
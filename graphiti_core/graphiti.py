@@ -15,6 +15,7 @@ limitations under the License.
 """
 
 import logging
+from collections.abc import AsyncIterator
 from datetime import datetime
 from time import time
 
@@ -34,6 +35,7 @@ from graphiti_core.edges import (
     create_entity_edge_embeddings,
 )
 from graphiti_core.embedder import EmbedderClient, OpenAIEmbedder
+from graphiti_core.embedder.client import EMBEDDING_DIM
 from graphiti_core.graphiti_types import GraphitiClients
 from graphiti_core.helpers import (
     get_default_group_id,
@@ -47,10 +49,10 @@ from graphiti_core.nodes import (
     EntityNode,
     EpisodeType,
     EpisodicNode,
-    Node,
     create_entity_node_embeddings,
 )
-from graphiti_core.search.search import SearchConfig, search
+from graphiti_core.search.search import SearchConfig, search, search_batch
+from graphiti_core.search.search_cache import SearchCache
 from graphiti_core.search.search_config import DEFAULT_SEARCH_LIMIT, SearchResults
 from graphiti_core.search.search_config_recipes import (
     COMBINED_HYBRID_SEARCH_CROSS_ENCODER,
@@ -58,6 +60,13 @@ from graphiti_core.search.search_config_recipes import (
     EDGE_HYBRID_SEARCH_RRF,
 )
 from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.search.search_pagination import (
+    DEFAULT_MAX_PAGINATED_RESULTS,
+    SearchPage,
+    SearchSessionCache,
+    search_page,
+    search_pages,
+)
 from graphiti_core.search.search_utils import (
     RELEVANT_SCHEMA_LIMIT,
     get_edge_invalidation_candidates,
@@ -74,6 +83,7 @@ from graphiti_core.utils.bulk_utils import (
     resolve_edge_pointers,
     retrieve_previous_episodes_bulk,
 )
+from graphiti_core.utils.concurrency import ConcurrencyPools
 from graphiti_core.utils.datetime_utils import utc_now
 from graphiti_core.utils.maintenance.community_operations import (
     build_communities,
@@ -89,16 +99,18 @@ from graphiti_core.utils.maintenance.edge_operations import (
 )
 from graphiti_core.utils.maintenance.graph_data_operations import (
     EPISODE_WINDOW_LEN,
-    build_dynamic_indexes,
     build_indices_and_constraints,
+    ensure_dynamic_indexes,
     retrieve_episodes,
 )
 from graphiti_core.utils.maintenance.node_operations import (
     extract_attributes_from_nodes,
     extract_nodes,
+    extract_nodes_and_edges,
     resolve_extracted_nodes,
 )
 from graphiti_core.utils.ontology_utils.entity_types_utils import validate_entity_types
+from graphiti_core.utils.rate_limiter import Priority, request_priority
 
 logger = logging.getLogger(__name__)
 
@@ -128,6 +140,8 @@ class Graphiti:
         graph_driver: GraphDriver | None = None,
         max_coroutines: int | None = None,
         ensure_ascii: bool = False,
+        search_cache: SearchCache | None = None,
+        concurrency_pools: ConcurrencyPools | None = None,
         **kwargs,
     ):
         """
@@ -167,6 +181,12 @@ class Graphiti:
             Whether to escape non-ASCII characters in JSON serialization for prompts. Defaults to False.
             Set as False to preserve non-ASCII characters (e.g., Korean, Japanese, Chinese) in their
             original form, making them readable in LLM logs and improving model understanding.
+        search_cache : SearchCache | None, optional
+            A cache for search results, attached to the graph driver. Entries expire after the cache TTL
+            and are invalidated per group_id by writes made through the driver. Disabled by default.
+        concurrency_pools : ConcurrencyPools | None, optional
+            Pools bounding the in-flight database, LLM and embedder calls of this instance. If not
+            provided, the process-wide pools of graphiti_core.utils.concurrency are shared.
         **kwargs
             Additional configuration parameters passed through to the database driver.
 
@@ -187,6 +207,8 @@ class Graphiti:
         - FALKORDB_DATABASE: Database number (default: 0)
         - FALKORDB_PASSWORD: Authentication password (optional)
         - FALKORDB_CONNECTION_STRING: Redis-style connection string (optional)
+        - FALKORDB_MAX_CONNECTIONS: Connection pool size (optional)
+        - FALKORDB_AUTO_PIPELINE: Pipeline concurrently issued queries (default: false)
 
         The OpenAI API key is expected to be set in the environment variables.
         Make sure to set the OPENAI_API_KEY environment variable before initializing
@@ -228,6 +250,10 @@ class Graphiti:
                 else:
                     raise
 
+        if search_cache is not None:
+            self.driver.search_cache = search_cache
+        self.search_sessions = SearchSessionCache()
+
         self.store_raw_episode_content = store_raw_episode_content
         self.max_coroutines = max_coroutines
         self.ensure_ascii = ensure_ascii
@@ -244,6 +270,13 @@ class Graphiti:
         else:
             self.cross_encoder = OpenAIRerankerClient()
 
+        if concurrency_pools is not None:
+            self.driver.concurrency_pool = concurrency_pools.db
+            self.llm_client.concurrency_pool = concurrency_pools.llm
+            self.embedder.concurrency_pool = concurrency_pools.embedder
+            self.cross_encoder.concurrency_pool = concurrency_pools.llm
+        self.concurrency_pools = concurrency_pools
+
         self.clients = GraphitiClients(
             driver=self.driver,
             llm_client=self.llm_client,
@@ -339,6 +372,10 @@ class Graphiti:
         """
         await self.driver.close()
 
+    def _embedding_dim(self) -> int:
+        embedder_config = getattr(self.embedder, 'config', None)
+        return getattr(embedder_config, 'embedding_dim', EMBEDDING_DIM)
+
     async def build_indices_and_constraints(self, delete_existing: bool = False):
         """
         Build indices and constraints in the Neo4j database.
@@ -372,7 +409,7 @@ class Graphiti:
         Caution: Running this method on a large existing database may take some time
         and could impact database performance during execution.
         """
-        await build_indices_and_constraints(self.driver, delete_existing)
+        await build_indices_and_constraints(self.driver, delete_existing, self._embedding_dim())
 
     async def retrieve_episodes(
         self,
@@ -423,6 +460,7 @@ class Graphiti:
         previous_episode_uuids: list[str] | None = None,
         edge_types: dict[str, type[BaseModel]] | None = None,
         edge_type_map: dict[tuple[str, str], list[str]] | None = None,
+        combined_extraction: bool = False,
     ) -> AddEpisodeResults:
         """
         Process an episode and update the graph.
@@ -457,6 +495,10 @@ class Graphiti:
         previous_episode_uuids : list[str] | None
             Optional.  list of episode uuids to use as the previous episodes. If this is not provided,
             the most recent episodes by created_at date will be used.
+        combined_extraction : bool
+            Optional. Extract entities and facts together in a single LLM call instead of extracting
+            facts once the entities are known, saving a round-trip on the critical path of the episode.
+            Reflexion passes are skipped in this mode. Defaults to False.
 
         Returns
         -------
@@ -489,7 +531,7 @@ class Graphiti:
 
             validate_excluded_entity_types(excluded_entity_types, entity_types)
             validate_group_id(group_id)
-            await build_dynamic_indexes(self.driver, group_id)
+            ensure_dynamic_indexes(self.driver, group_id, embedding_dim=self._embedding_dim())
 
             previous_episodes = (
                 await self.retrieve_episodes(
@@ -524,36 +566,55 @@ class Graphiti:
                 else {('Entity', 'Entity'): []}
             )
 
-            # Extract entities as nodes
-
-            extracted_nodes = await extract_nodes(
-                self.clients,
-                episode,
-                previous_episodes,
-                entity_types,
-                excluded_entity_types,
-            )
-
-            # Extract edges and resolve nodes
-            (nodes, uuid_map, node_duplicates), extracted_edges = await semaphore_gather(
-                resolve_extracted_nodes(
+            if combined_extraction:
+                # Extract entities and edges together, then resolve nodes
+                extracted_nodes, extracted_edges = await extract_nodes_and_edges(
+                    self.clients,
+                    episode,
+                    previous_episodes,
+                    edge_type_map or edge_type_map_default,
+                    group_id,
+                    entity_types,
+                    excluded_entity_types,
+                    edge_types,
+                )
+                nodes, uuid_map, node_duplicates = await resolve_extracted_nodes(
                     self.clients,
                     extracted_nodes,
                     episode,
                     previous_episodes,
                     entity_types,
-                ),
-                extract_edges(
+                )
+            else:
+                # Extract entities as nodes
+                extracted_nodes = await extract_nodes(
                     self.clients,
                     episode,
-                    extracted_nodes,
                     previous_episodes,
-                    edge_type_map or edge_type_map_default,
-                    group_id,
-                    edge_types,
-                ),
-                max_coroutines=self.max_coroutines,
-            )
+                    entity_types,
+                    excluded_entity_types,
+                )
+
+                # Extract edges and resolve nodes
+                (nodes, uuid_map, node_duplicates), extracted_edges = await semaphore_gather(
+                    resolve_extracted_nodes(
+                        self.clients,
+                        extracted_nodes,
+                        episode,
+                        previous_episodes,
+                        entity_types,
+                    ),
+                    extract_edges(
+                        self.clients,
+                        episode,
+                        extracted_nodes,
+                        previous_episodes,
+                        edge_type_map or edge_type_map_default,
+                        group_id,
+                        edge_types,
+                    ),
+                    max_coroutines=self.max_coroutines,
+                )
 
             edges = resolve_edge_pointers(extracted_edges, uuid_map)
 
@@ -986,16 +1047,17 @@ class Graphiti:
         )
         search_config.limit = num_results
 
-        edges = (
-            await search(
-                self.clients,
-                query,
-                group_ids,
-                search_config,
-                search_filter if search_filter is not None else SearchFilters(),
-                center_node_uuid,
-            )
-        ).edges
+        with request_priority(Priority.search):
+            edges = (
+                await search(
+                    self.clients,
+                    query,
+                    group_ids,
+                    search_config,
+                    search_filter if search_filter is not None else SearchFilters(),
+                    center_node_uuid,
+                )
+            ).edges
 
         return edges
 
@@ -1034,14 +1096,103 @@ class Graphiti:
         For different config recipes refer to search/search_config_recipes.
         """
 
-        return await search(
+        with request_priority(Priority.search):
+            return await search(
+                self.clients,
+                query,
+                group_ids,
+                config,
+                search_filter if search_filter is not None else SearchFilters(),
+                center_node_uuid,
+                bfs_origin_node_uuids,
+            )
+
+    async def search_batch(
+        self,
+        queries: list[str],
+        config: SearchConfig = COMBINED_HYBRID_SEARCH_CROSS_ENCODER,
+        group_ids: list[str] | None = None,
+        center_node_uuid: str | None = None,
+        bfs_origin_node_uuids: list[str] | None = None,
+        search_filter: SearchFilters | None = None,
+    ) -> list[SearchResults]:
+        """Run search_ for several queries at once and return the SearchResults of each query, in order.
+
+        All queries are embedded in one call and, on Neo4j and FalkorDB, each BM25 and cosine similarity
+        search of edges and nodes runs as a single query for the whole batch.
+        """
+
+        with request_priority(Priority.search):
+            return await search_batch(
+                self.clients,
+                queries,
+                group_ids,
+                config,
+                search_filter if search_filter is not None else SearchFilters(),
+                center_node_uuid,
+                bfs_origin_node_uuids,
+            )
+
+    async def search_page(
+        self,
+        query: str,
+        config: SearchConfig = COMBINED_HYBRID_SEARCH_CROSS_ENCODER,
+        group_ids: list[str] | None = None,
+        center_node_uuid: str | None = None,
+        bfs_origin_node_uuids: list[str] | None = None,
+        search_filter: SearchFilters | None = None,
+        page_size: int | None = None,
+        max_results: int = DEFAULT_MAX_PAGINATED_RESULTS,
+        cursor: str | None = None,
+    ) -> SearchPage:
+        """Return one page of search_ results in score order.
+
+        The results are ranked once, up to max_results per layer, and kept for a short time so that the
+        page behind the returned cursor is served without searching again. Pass the same arguments and
+        the cursor of the previous page to continue; page_size defaults to config.limit.
+        """
+
+        with request_priority(Priority.search):
+            return await search_page(
+                self.clients,
+                self.search_sessions,
+                query,
+                group_ids,
+                config,
+                search_filter if search_filter is not None else SearchFilters(),
+                center_node_uuid,
+                bfs_origin_node_uuids,
+                page_size,
+                max_results,
+                cursor,
+            )
+
+    def search_pages(
+        self,
+        query: str,
+        config: SearchConfig = COMBINED_HYBRID_SEARCH_CROSS_ENCODER,
+        group_ids: list[str] | None = None,
+        center_node_uuid: str | None = None,
+        bfs_origin_node_uuids: list[str] | None = None,
+        search_filter: SearchFilters | None = None,
+        page_size: int | None = None,
+        max_results: int = DEFAULT_MAX_PAGINATED_RESULTS,
+        cursor: str | None = None,
+    ) -> AsyncIterator[SearchPage]:
+        """Iterate over the pages of search_ results in score order, see search_page."""
+
+        return search_pages(
             self.clients,
+            self.search_sessions,
             query,
             group_ids,
             config,
             search_filter if search_filter is not None else SearchFilters(),
             center_node_uuid,
             bfs_origin_node_uuids,
+            page_size,
+            max_results,
+            cursor,
         )
 
     async def get_nodes_and_edges_by_episode(self, episode_uuids: list[str]) -> SearchResults:
@@ -1059,12 +1210,14 @@ class Graphiti:
         return SearchResults(edges=edges, nodes=nodes)
 
     async def add_triplet(self, source_node: EntityNode, edge: EntityEdge, target_node: EntityNode):
+        embedding_tasks = []
         if source_node.name_embedding is None:
-            await source_node.generate_name_embedding(self.embedder)
+            embedding_tasks.append(source_node.generate_name_embedding(self.embedder))
         if target_node.name_embedding is None:
-            await target_node.generate_name_embedding(self.embedder)
+            embedding_tasks.append(target_node.generate_name_embedding(self.embedder))
         if edge.fact_embedding is None:
-            await edge.generate_embedding(self.embedder)
+            embedding_tasks.append(edge.generate_embedding(self.embedder))
+        await semaphore_gather(*embedding_tasks)
 
         nodes, uuid_map, _ = await resolve_extracted_nodes(
             self.clients,
@@ -1073,10 +1226,12 @@ class Graphiti:
 
         updated_edge = resolve_edge_pointers([edge], uuid_map)[0]
 
-        related_edges = (await get_relevant_edges(self.driver, [updated_edge], SearchFilters()))[0]
-        existing_edges = (
-            await get_edge_invalidation_candidates(self.driver, [updated_edge], SearchFilters())
-        )[0]
+        related_edges_list, existing_edges_list = await semaphore_gather(
+            get_relevant_edges(self.driver, [updated_edge], SearchFilters()),
+            get_edge_invalidation_candidates(self.driver, [updated_edge], SearchFilters()),
+        )
+        related_edges = related_edges_list[0]
+        existing_edges = existing_edges_list[0]
 
         resolved_edge, invalidated_edges, _ = await resolve_extracted_edge(
             self.llm_client,
@@ -1120,15 +1275,20 @@ class Graphiti:
         nodes = await get_mentioned_nodes(self.driver, [episode])
         # We should delete all nodes that are only mentioned in the deleted episode
         nodes_to_delete: list[EntityNode] = []
-        for node in nodes:
-            query: LiteralString = 'MATCH (e:Episodic)-[:MENTIONS]->(n:Entity {uuid: $uuid}) RETURN count(*) AS episode_count'
-            records, _, _ = await self.driver.execute_query(query, uuid=node.uuid, routing_='r')
-
-            for record in records:
-                if record['episode_count'] == 1:
-                    nodes_to_delete.append(node)
+        if nodes:
+            # Count the mentioning episodes of every candidate node in a single query
+            query: LiteralString = """
+                MATCH (e:Episodic)-[:MENTIONS]->(n:Entity)
+                WHERE n.uuid IN $uuids
+                RETURN n.uuid AS uuid, count(*) AS episode_count
+                """
+            records, _, _ = await self.driver.execute_query(
+                query, uuids=[node.uuid for node in nodes], routing_='r'
+            )
+            episode_counts = {record['uuid']: record['episode_count'] for record in records}
+            nodes_to_delete = [node for node in nodes if episode_counts.get(node.uuid) == 1]
 
         await Edge.delete_by_uuids(self.driver, [edge.uuid for edge in edges_to_delete])
-        await Node.delete_by_uuids(self.driver, [node.uuid for node in nodes_to_delete])
+        await EntityNode.delete_by_uuids(self.driver, [node.uuid for node in nodes_to_delete])
 
         await episode.delete(self.driver)
@@ -59,41 +59,38 @@ def get_default_group_id(provider: GraphProvider) -> str:
         return ''
 
 
+# + - && || ! ( ) { } [ ] ^ " ~ * ? : \ /
+LUCENE_ESCAPE_MAP = str.maketrans(
+    {
+        '+': r'\+',
+        '-': r'\-',
+        '&': r'\&',
+        '|': r'\|',
+        '!': r'\!',
+        '(': r'\(',
+        ')': r'\)',
+        '{': r'\{',
+        '}': r'\}',
+        '[': r'\[',
+        ']': r'\]',
+        '^': r'\^',
+        '"': r'\"',
+        '~': r'\~',
+        '*': r'\*',
+        '?': r'\?',
+        ':': r'\:',
+        '\\': r'\\',
+        '/': r'\/',
+    }
+)
+LUCENE_OPERATOR_PATTERN = re.compile(r'\b(AND|OR|NOT)\b')
+
+
 def lucene_sanitize(query: str) -> str:
-    # Escape special characters from a query before passing into Lucene
-    # + - && || ! ( ) { } [ ] ^ " ~ * ? : \ /
-    escape_map = str.maketrans(
-        {
-            '+': r'\+',
-            '-': r'\-',
-            '&': r'\&',
-            '|': r'\|',
-            '!': r'\!',
-            '(': r'\(',
-            ')': r'\)',
-            '{': r'\{',
-            '}': r'\}',
-            '[': r'\[',
-            ']': r'\]',
-            '^': r'\^',
-            '"': r'\"',
-            '~': r'\~',
-            '*': r'\*',
-            '?': r'\?',
-            ':': r'\:',
-            '\\': r'\\',
-            '/': r'\/',
-            'O': r'\O',
-            'R': r'\R',
-            'N': r'\N',
-            'T': r'\T',
-            'A': r'\A',
-            'D': r'\D',
-        }
-    )
-
-    sanitized = query.translate(escape_map)
-    return sanitized
+    # Escape special characters and the AND, OR and NOT operators from a query before passing
+    # into Lucene
+    sanitized = query.translate(LUCENE_ESCAPE_MAP)
+    return LUCENE_OPERATOR_PATTERN.sub(r'\\\1', sanitized)
 
 
 def normalize_l2(embedding: list[float]) -> NDArray:
@@ -107,13 +104,41 @@ async def semaphore_gather(
     *coroutines: Coroutine,
     max_coroutines: int | None = None,
 ) -> list[Any]:
+    """
+    Run the coroutines concurrently, at most max_coroutines at a time, and return their results
+    in order.
+
+    When one coroutine fails, the others are cancelled and its exception is raised. Database, LLM
+    and embedder calls are additionally bounded by the shared pools of utils.concurrency, which
+    also apply across nested gathers.
+    """
     semaphore = asyncio.Semaphore(max_coroutines or SEMAPHORE_LIMIT)
 
     async def _wrap_coroutine(coroutine):
         async with semaphore:
             return await coroutine
 
-    return await asyncio.gather(*(_wrap_coroutine(coroutine) for coroutine in coroutines))
+    tasks = [asyncio.ensure_future(_wrap_coroutine(coroutine)) for coroutine in coroutines]
+    if not tasks:
+        return []
+
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
+        # Retrieve the exception of every failed task, also of siblings that failed alongside the
+        # first or while being cancelled, so that asyncio does not log them as never retrieved
+        exceptions = [task.exception() for task in tasks if not task.cancelled()]
+
+    for exception in exceptions:
+        if exception is not None:
+            raise exception
+
+    return [task.result() for task in tasks]
 
 
 def validate_group_id(group_id: str) -> bool:
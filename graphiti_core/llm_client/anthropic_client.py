@@ -24,7 +24,7 @@ from typing import TYPE_CHECKING, Literal
 from pydantic import BaseModel, ValidationError
 
 from ..prompts.models import Message
-from .client import LLMClient
+from .client import LLMClient, usage_tokens
 from .config import DEFAULT_MAX_TOKENS, LLMConfig, ModelSize
 from .errors import RateLimitError, RefusalError
 
@@ -177,6 +177,19 @@ class AnthropicClient(LLMClient):
         tool_choice_cast = typing.cast(ToolChoiceParam, tool_choice)
         return tool_list_cast, tool_choice_cast
 
+    def _record_prompt_cache_usage(self, usage: typing.Any):
+        if usage is None:
+            return
+
+        cached_tokens = usage_tokens(usage, 'cache_read_input_tokens')
+        cache_write_tokens = usage_tokens(usage, 'cache_creation_input_tokens')
+        # input_tokens only counts the tokens after the last cache breakpoint
+        self.prompt_cache_stats.record(
+            usage_tokens(usage, 'input_tokens') + cached_tokens + cache_write_tokens,
+            cached_tokens,
+            cache_write_tokens,
+        )
+
     async def _generate_response(
         self,
         messages: list[Message],
@@ -215,7 +228,15 @@ class AnthropicClient(LLMClient):
             # Create the appropriate tool based on whether response_model is provided
             tools, tool_choice = self._create_tool(response_model)
             result = await self.client.messages.create(
-                system=system_message.content,
+                # The tools and system prompt are static per prompt type, so they are cached as a
+                # prefix; providers ignore the marker below their minimum cacheable length
+                system=[
+                    {
+                        'type': 'text',
+                        'text': system_message.content,
+                        'cache_control': {'type': 'ephemeral'},
+                    }
+                ],
                 max_tokens=max_creation_tokens,
                 temperature=self.temperature,
                 messages=user_messages_cast,
@@ -223,6 +244,7 @@ class AnthropicClient(LLMClient):
                 tools=tools,
                 tool_choice=tool_choice,
             )
+            self._record_prompt_cache_usage(getattr(result, 'usage', None))
 
             # Extract the tool output from the response
             for content_item in result.content:
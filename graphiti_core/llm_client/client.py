@@ -17,15 +17,24 @@ limitations under the License.
 import hashlib
 import json
 import logging
+import re
 import typing
 from abc import ABC, abstractmethod
 
 import httpx
 from diskcache import Cache
 from pydantic import BaseModel
-from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
+from tenacity import (
+    RetryCallState,
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
 
 from ..prompts.models import Message
+from ..utils.concurrency import ConcurrencyPool, pooled
+from ..utils.rate_limiter import RateLimiter, is_rate_limit_error, rate_limited
 from .config import DEFAULT_MAX_TOKENS, LLMConfig, ModelSize
 from .errors import RateLimitError
 
@@ -39,6 +48,11 @@ MULTILINGUAL_EXTRACTION_RESPONSES = (
 logger = logging.getLogger(__name__)
 
 
+def response_format_instructions(response_model: type[BaseModel]) -> str:
+    serialized_model = json.dumps(response_model.model_json_schema())
+    return f'\n\nRespond with a JSON object in the following format:\n\n{serialized_model}'
+
+
 def is_server_or_retry_error(exception):
     if isinstance(exception, RateLimitError | json.decoder.JSONDecodeError):
         return True
@@ -48,7 +62,86 @@ def is_server_or_retry_error(exception):
     )
 
 
+_server_error_wait = wait_random_exponential(multiplier=10, min=5, max=120)
+
+
+def retry_wait(retry_state: RetryCallState) -> float:
+    # The rate limiter already pauses for the retry-after delay of a rate limit error
+    exception = retry_state.outcome.exception() if retry_state.outcome is not None else None
+    if exception is not None and is_rate_limit_error(exception):
+        return 0
+    return _server_error_wait(retry_state)
+
+
+class PromptCacheStats:
+    """Input tokens served from the provider's prompt cache, as reported in response usage."""
+
+    def __init__(self):
+        self.requests = 0
+        self.cache_hits = 0
+        self.input_tokens = 0
+        self.cached_tokens = 0
+        self.cache_write_tokens = 0
+
+    def record(self, input_tokens: int, cached_tokens: int = 0, cache_write_tokens: int = 0):
+        """Record one request; input_tokens includes the cached and cache write tokens."""
+        self.requests += 1
+        if cached_tokens > 0:
+            self.cache_hits += 1
+        self.input_tokens += input_tokens
+        self.cached_tokens += cached_tokens
+        self.cache_write_tokens += cache_write_tokens
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of input tokens read from the cache."""
+        return self.cached_tokens / self.input_tokens if self.input_tokens else 0.0
+
+    @property
+    def request_hit_rate(self) -> float:
+        """Share of requests that read a cached prefix."""
+        return self.cache_hits / self.requests if self.requests else 0.0
+
+    def reset(self):
+        self.requests = self.cache_hits = 0
+        self.input_tokens = self.cached_tokens = self.cache_write_tokens = 0
+
+
+def usage_tokens(usage: typing.Any, *path: str) -> int:
+    """Read a token count from a provider usage object, or 0 when it is not reported."""
+    value = usage
+    for name in path:
+        value = getattr(value, name, None)
+    return value if isinstance(value, int) else 0
+
+
+# Invalid unicode (lone surrogates), zero-width characters and control characters except
+# newlines, returns and tabs, removed from every message in a single pass
+_UNSAFE_CHARACTERS = re.compile(
+    '[\x00-\x08\x0b\x0c\x0e-\x1f\u200b-\u200d\u2060\ufeff\ud800-\udfff]'
+)
+
+
+def _estimate_request_tokens(
+    messages: list[Message], *args: typing.Any, **kwargs: typing.Any
+) -> int:
+    return sum(len(message.content) for message in messages) // 4 + 1
+
+
 class LLMClient(ABC):
+    # Shared per client class and endpoint unless set on the instance, see utils.rate_limiter
+    rate_limiter: RateLimiter | None = None
+    # Default LLM pool unless set on the instance, see utils.concurrency
+    concurrency_pool: ConcurrencyPool | None = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Every provider request goes through the rate limiter of the client
+        if '_generate_response' in cls.__dict__:
+            cls._generate_response = rate_limited(  # type: ignore[method-assign]
+                pooled(cls.__dict__['_generate_response'], 'llm'), _estimate_request_tokens
+            )
+
     def __init__(self, config: LLMConfig | None, cache: bool = False):
         if config is None:
             config = LLMConfig()
@@ -60,6 +153,7 @@ class LLMClient(ABC):
         self.max_tokens = config.max_tokens
         self.cache_enabled = cache
         self.cache_dir = None
+        self.prompt_cache_stats = PromptCacheStats()
 
         # Only create the cache directory if caching is enabled
         if self.cache_enabled:
@@ -74,22 +168,13 @@ class LLMClient(ABC):
         Returns:
             Cleaned string safe for LLM processing
         """
-        # Clean any invalid Unicode
-        cleaned = input.encode('utf-8', errors='ignore').decode('utf-8')
-
-        # Remove zero-width characters and other invisible unicode
-        zero_width = '\u200b\u200c\u200d\ufeff\u2060'
-        for char in zero_width:
-            cleaned = cleaned.replace(char, '')
-
-        # Remove control characters except newlines, returns, and tabs
-        cleaned = ''.join(char for char in cleaned if ord(char) >= 32 or char in '\n\r\t')
-
-        return cleaned
+        if _UNSAFE_CHARACTERS.search(input) is None:
+            return input
+        return _UNSAFE_CHARACTERS.sub('', input)
 
     @retry(
         stop=stop_after_attempt(4),
-        wait=wait_random_exponential(multiplier=10, min=5, max=120),
+        wait=retry_wait,
         retry=retry_if_exception(is_server_or_retry_error),
         after=lambda retry_state: logger.warning(
             f'Retrying {retry_state.fn.__name__ if retry_state.fn else "function"} after {retry_state.attempt_number} attempts...'
@@ -136,17 +221,14 @@ class LLMClient(ABC):
         if max_tokens is None:
             max_tokens = self.max_tokens
 
-        if response_model is not None:
-            serialized_model = json.dumps(response_model.model_json_schema())
-            messages[
-                -1
-            ].content += (
-                f'\n\nRespond with a JSON object in the following format:\n\n{serialized_model}'
-            )
-
         # Add multilingual extraction instructions
         messages[0].content += MULTILINGUAL_EXTRACTION_RESPONSES
 
+        # The schema goes in the system message, so that the static instructions form a prefix
+        # that providers can cache across calls
+        if response_model is not None:
+            messages[0].content += response_format_instructions(response_model)
+
         if self.cache_enabled and self.cache_dir is not None:
             cache_key = self._get_cache_key(messages)
 
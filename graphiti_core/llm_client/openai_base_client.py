@@ -25,7 +25,7 @@ from openai.types.chat import ChatCompletionMessageParam
 from pydantic import BaseModel
 
 from ..prompts.models import Message
-from .client import MULTILINGUAL_EXTRACTION_RESPONSES, LLMClient
+from .client import MULTILINGUAL_EXTRACTION_RESPONSES, LLMClient, PromptCacheStats, usage_tokens
 from .config import DEFAULT_MAX_TOKENS, LLMConfig, ModelSize
 from .errors import RateLimitError, RefusalError
 
@@ -37,6 +37,26 @@ DEFAULT_REASONING = 'minimal'
 DEFAULT_VERBOSITY = 'low'
 
 
+def record_prompt_cache_usage(stats: PromptCacheStats, usage: Any):
+    """
+    Record the cached input tokens of an OpenAI response. OpenAI caches prompt prefixes of at
+    least 1024 tokens automatically; Responses and Chat Completions report them differently.
+    """
+    if usage is None:
+        return
+
+    if usage_tokens(usage, 'input_tokens'):
+        stats.record(
+            usage_tokens(usage, 'input_tokens'),
+            usage_tokens(usage, 'input_tokens_details', 'cached_tokens'),
+        )
+    elif usage_tokens(usage, 'prompt_tokens'):
+        stats.record(
+            usage_tokens(usage, 'prompt_tokens'),
+            usage_tokens(usage, 'prompt_tokens_details', 'cached_tokens'),
+        )
+
+
 class BaseOpenAIClient(LLMClient):
     """
     Base client class for OpenAI-compatible APIs (OpenAI and Azure OpenAI).
@@ -151,6 +171,7 @@ class BaseOpenAIClient(LLMClient):
                     reasoning=self.reasoning,
                     verbosity=self.verbosity,
                 )
+                record_prompt_cache_usage(self.prompt_cache_stats, getattr(response, 'usage', None))
                 return self._handle_structured_response(response)
             else:
                 response = await self._create_completion(
@@ -159,6 +180,7 @@ class BaseOpenAIClient(LLMClient):
                     temperature=self.temperature,
                     max_tokens=max_tokens or self.max_tokens,
                 )
+                record_prompt_cache_usage(self.prompt_cache_stats, getattr(response, 'usage', None))
                 return self._handle_json_response(response)
 
         except openai.LengthFinishReasonError as e:
@@ -25,9 +25,10 @@ from openai.types.chat import ChatCompletionMessageParam
 from pydantic import BaseModel
 
 from ..prompts.models import Message
-from .client import MULTILINGUAL_EXTRACTION_RESPONSES, LLMClient
+from .client import MULTILINGUAL_EXTRACTION_RESPONSES, LLMClient, response_format_instructions
 from .config import DEFAULT_MAX_TOKENS, LLMConfig, ModelSize
 from .errors import RateLimitError, RefusalError
+from .openai_base_client import record_prompt_cache_usage
 
 logger = logging.getLogger(__name__)
 
@@ -106,6 +107,7 @@ class OpenAIGenericClient(LLMClient):
                 max_tokens=self.max_tokens,
                 response_format={'type': 'json_object'},
             )
+            record_prompt_cache_usage(self.prompt_cache_stats, getattr(response, 'usage', None))
             result = response.choices[0].message.content or ''
             return json.loads(result)
         except openai.RateLimitError as e:
@@ -127,17 +129,12 @@ class OpenAIGenericClient(LLMClient):
         retry_count = 0
         last_error = None
 
-        if response_model is not None:
-            serialized_model = json.dumps(response_model.model_json_schema())
-            messages[
-                -1
-            ].content += (
-                f'\n\nRespond with a JSON object in the following format:\n\n{serialized_model}'
-            )
-
         # Add multilingual extraction instructions
         messages[0].content += MULTILINGUAL_EXTRACTION_RESPONSES
 
+        if response_model is not None:
+            messages[0].content += response_format_instructions(response_model)
+
         while retry_count <= self.MAX_RETRIES:
             try:
                 response = await self._generate_response(
@@ -15,6 +15,7 @@ limitations under the License.
 """
 
 from graphiti_core.driver.driver import GraphProvider
+from graphiti_core.graph_queries import query_template
 
 EPISODIC_EDGE_SAVE = """
     MATCH (episode:Episodic {uuid: $episode_uuid})
@@ -68,6 +69,7 @@ def get_entity_edge_save_query(provider: GraphProvider) -> str:
                 MATCH (target:Entity {uuid: $edge_data.target_uuid})
                 MERGE (source)-[e:RELATES_TO {uuid: $edge_data.uuid}]->(target)
                 SET e = $edge_data
+                SET e.fact_embedding = vecf32($edge_data.fact_embedding)
                 RETURN e.uuid AS uuid
             """
         case GraphProvider.NEPTUNE:
@@ -163,6 +165,7 @@ def get_entity_edge_save_bulk_query(provider: GraphProvider) -> str:
             """
 
 
+@query_template
 def get_entity_edge_return_query(provider: GraphProvider) -> str:
     # `fact_embedding` is not returned by default and must be manually loaded using `load_fact_embedding()`.
 
@@ -17,6 +17,7 @@ limitations under the License.
 from typing import Any
 
 from graphiti_core.driver.driver import GraphProvider
+from graphiti_core.graph_queries import query_template
 
 
 def get_episode_node_save_query(provider: GraphProvider) -> str:
@@ -135,6 +136,7 @@ def get_entity_node_save_query(provider: GraphProvider, labels: str) -> str:
                 MERGE (n:Entity {{uuid: $entity_data.uuid}})
                 SET n:{labels}
                 SET n = $entity_data
+                SET n.name_embedding = vecf32($entity_data.name_embedding)
                 RETURN n.uuid AS uuid
             """
         case GraphProvider.KUZU:
@@ -234,6 +236,19 @@ def get_entity_node_save_bulk_query(provider: GraphProvider, nodes: list[dict])
             """
 
 
+# Number of episodes that mention an entity, stored on the node so that the episode mentions
+# reranker is a property lookup. Entity saves overwrite all properties, so the count is
+# recomputed from the MENTIONS edges of the saved nodes rather than incremented.
+ENTITY_NODE_MENTION_COUNT_UPDATE = """
+    UNWIND $node_uuids AS node_uuid
+    MATCH (n:Entity {uuid: node_uuid})
+    OPTIONAL MATCH (episode:Episodic)-[:MENTIONS]->(n)
+    WITH n, count(episode) AS mention_count
+    SET n.mention_count = mention_count
+"""
+
+
+@query_template
 def get_entity_node_return_query(provider: GraphProvider) -> str:
     # `name_embedding` is not returned by default and must be loaded manually using `load_name_embedding()`.
     if provider == GraphProvider.KUZU:
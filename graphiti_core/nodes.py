@@ -33,6 +33,7 @@ from graphiti_core.helpers import parse_db_date
 from graphiti_core.models.nodes.node_db_queries import (
     COMMUNITY_NODE_RETURN,
     COMMUNITY_NODE_RETURN_NEPTUNE,
+    ENTITY_NODE_MENTION_COUNT_UPDATE,
     EPISODIC_NODE_RETURN,
     EPISODIC_NODE_RETURN_NEPTUNE,
     get_community_node_save_query,
@@ -40,6 +41,7 @@ from graphiti_core.models.nodes.node_db_queries import (
     get_entity_node_save_query,
     get_episode_node_save_query,
 )
+from graphiti_core.search.search_cache import invalidate_search_cache
 from graphiti_core.utils.datetime_utils import utc_now
 
 logger = logging.getLogger(__name__)
@@ -102,40 +104,52 @@ class Node(BaseModel, ABC):
                     uuid=self.uuid,
                 )
             case GraphProvider.KUZU:
-                for label in ['Episodic', 'Community']:
-                    await driver.execute_query(
+                statements: list[tuple[str, dict[str, Any]]] = [
+                    (
                         f"""
                         MATCH (n:{label} {{uuid: $uuid}})
                         DETACH DELETE n
                         """,
-                        uuid=self.uuid,
+                        {'uuid': self.uuid},
                     )
+                    for label in ['Episodic', 'Community']
+                ]
                 # Entity edges are actually nodes in Kuzu, so simple `DETACH DELETE` will not work.
                 # Explicitly delete the "edge" nodes first, then the entity node.
-                await driver.execute_query(
-                    """
-                    MATCH (n:Entity {uuid: $uuid})-[:RELATES_TO]->(e:RelatesToNode_)
-                    DETACH DELETE e
-                    """,
-                    uuid=self.uuid,
-                )
-                await driver.execute_query(
-                    """
-                    MATCH (n:Entity {uuid: $uuid})
-                    DETACH DELETE n
-                    """,
-                    uuid=self.uuid,
+                statements.append(
+                    (
+                        """
+                        MATCH (n:Entity {uuid: $uuid})-[:RELATES_TO]->(e:RelatesToNode_)
+                        DETACH DELETE e
+                        """,
+                        {'uuid': self.uuid},
+                    )
                 )
-            case _:  # FalkorDB, Neptune
-                for label in ['Entity', 'Episodic', 'Community']:
-                    await driver.execute_query(
-                        f"""
-                        MATCH (n:{label} {{uuid: $uuid}})
+                statements.append(
+                    (
+                        """
+                        MATCH (n:Entity {uuid: $uuid})
                         DETACH DELETE n
                         """,
-                        uuid=self.uuid,
+                        {'uuid': self.uuid},
                     )
+                )
+                await driver.execute_batch(statements)
+            case _:  # FalkorDB, Neptune
+                await driver.execute_batch(
+                    [
+                        (
+                            f"""
+                            MATCH (n:{label} {{uuid: $uuid}})
+                            DETACH DELETE n
+                            """,
+                            {'uuid': self.uuid},
+                        )
+                        for label in ['Entity', 'Episodic', 'Community']
+                    ]
+                )
 
+        invalidate_search_cache(driver, [self.group_id])
         logger.debug(f'Deleted Node: {self.uuid}')
 
     def __hash__(self):
@@ -163,81 +177,112 @@ class Node(BaseModel, ABC):
                         batch_size=batch_size,
                     )
             case GraphProvider.KUZU:
-                for label in ['Episodic', 'Community']:
-                    await driver.execute_query(
+                statements: list[tuple[str, dict[str, Any]]] = [
+                    (
                         f"""
                         MATCH (n:{label} {{group_id: $group_id}})
                         DETACH DELETE n
                         """,
-                        group_id=group_id,
+                        {'group_id': group_id},
                     )
+                    for label in ['Episodic', 'Community']
+                ]
                 # Entity edges are actually nodes in Kuzu, so simple `DETACH DELETE` will not work.
                 # Explicitly delete the "edge" nodes first, then the entity node.
-                await driver.execute_query(
-                    """
-                    MATCH (n:Entity {group_id: $group_id})-[:RELATES_TO]->(e:RelatesToNode_)
-                    DETACH DELETE e
-                    """,
-                    group_id=group_id,
-                )
-                await driver.execute_query(
-                    """
-                    MATCH (n:Entity {group_id: $group_id})
-                    DETACH DELETE n
-                    """,
-                    group_id=group_id,
+                statements.append(
+                    (
+                        """
+                        MATCH (n:Entity {group_id: $group_id})-[:RELATES_TO]->(e:RelatesToNode_)
+                        DETACH DELETE e
+                        """,
+                        {'group_id': group_id},
+                    )
                 )
-            case _:  # FalkorDB, Neptune
-                for label in ['Entity', 'Episodic', 'Community']:
-                    await driver.execute_query(
-                        f"""
-                        MATCH (n:{label} {{group_id: $group_id}})
+                statements.append(
+                    (
+                        """
+                        MATCH (n:Entity {group_id: $group_id})
                         DETACH DELETE n
                         """,
-                        group_id=group_id,
+                        {'group_id': group_id},
                     )
+                )
+                await driver.execute_batch(statements)
+            case _:  # FalkorDB, Neptune
+                await driver.execute_batch(
+                    [
+                        (
+                            f"""
+                            MATCH (n:{label} {{group_id: $group_id}})
+                            DETACH DELETE n
+                            """,
+                            {'group_id': group_id},
+                        )
+                        for label in ['Entity', 'Episodic', 'Community']
+                    ]
+                )
+
+        invalidate_search_cache(driver, [group_id])
 
     @classmethod
     async def delete_by_uuids(cls, driver: GraphDriver, uuids: list[str], batch_size: int = 100):
+        # Only deleted episodes change the mention counts of the entities they mention
+        mentioned_node_uuids = (
+            await get_mentioned_node_uuids(driver, uuids)
+            if not issubclass(cls, EntityNode | CommunityNode)
+            else []
+        )
+
         match driver.provider:
             case GraphProvider.FALKORDB:
-                for label in ['Entity', 'Episodic', 'Community']:
-                    await driver.execute_query(
-                        f"""
-                        MATCH (n:{label})
-                        WHERE n.uuid IN $uuids
-                        DETACH DELETE n
-                        """,
-                        uuids=uuids,
-                    )
+                await driver.execute_batch(
+                    [
+                        (
+                            f"""
+                            MATCH (n:{label})
+                            WHERE n.uuid IN $uuids
+                            DETACH DELETE n
+                            """,
+                            {'uuids': uuids},
+                        )
+                        for label in ['Entity', 'Episodic', 'Community']
+                    ]
+                )
             case GraphProvider.KUZU:
-                for label in ['Episodic', 'Community']:
-                    await driver.execute_query(
+                statements: list[tuple[str, dict[str, Any]]] = [
+                    (
                         f"""
                         MATCH (n:{label})
                         WHERE n.uuid IN $uuids
                         DETACH DELETE n
                         """,
-                        uuids=uuids,
+                        {'uuids': uuids},
                     )
+                    for label in ['Episodic', 'Community']
+                ]
                 # Entity edges are actually nodes in Kuzu, so simple `DETACH DELETE` will not work.
                 # Explicitly delete the "edge" nodes first, then the entity node.
-                await driver.execute_query(
-                    """
-                    MATCH (n:Entity)-[:RELATES_TO]->(e:RelatesToNode_)
-                    WHERE n.uuid IN $uuids
-                    DETACH DELETE e
-                    """,
-                    uuids=uuids,
+                statements.append(
+                    (
+                        """
+                        MATCH (n:Entity)-[:RELATES_TO]->(e:RelatesToNode_)
+                        WHERE n.uuid IN $uuids
+                        DETACH DELETE e
+                        """,
+                        {'uuids': uuids},
+                    )
                 )
-                await driver.execute_query(
-                    """
-                    MATCH (n:Entity)
-                    WHERE n.uuid IN $uuids
-                    DETACH DELETE n
-                    """,
-                    uuids=uuids,
+                statements.append(
+                    (
+                        """
+                        MATCH (n:Entity)
+                        WHERE n.uuid IN $uuids
+                        DETACH DELETE n
+                        """,
+                        {'uuids': uuids},
+                    )
                 )
+                await driver.execute_batch(statements)
             case _:  # Neo4J, Neptune
                 async with driver.session() as session:
                     await session.run(
@@ -253,6 +298,11 @@ class Node(BaseModel, ABC):
                         batch_size=batch_size,
                     )
 
+        await update_mention_counts(driver, mentioned_node_uuids)
+
+        # The group_ids of the deleted nodes are unknown here
+        invalidate_search_cache(driver)
+
     @classmethod
     async def get_by_uuid(cls, driver: GraphDriver, uuid: str): ...
 
@@ -272,6 +322,11 @@ class EpisodicNode(Node):
         default_factory=list,
     )
 
+    async def delete(self, driver: GraphDriver):
+        mentioned_node_uuids = await get_mentioned_node_uuids(driver, [self.uuid])
+        await super().delete(driver)
+        await update_mention_counts(driver, mentioned_node_uuids)
+
     async def save(self, driver: GraphDriver):
         if driver.provider == GraphProvider.NEPTUNE:
             driver.save_to_aoss(  # pyright: ignore reportAttributeAccessIssue
@@ -306,6 +361,7 @@ class EpisodicNode(Node):
             get_episode_node_save_query(driver.provider), **episode_args
         )
 
+        invalidate_search_cache(driver, [self.group_id])
         logger.debug(f'Saved Node to Graph: {self.uuid}')
 
         return result
@@ -481,6 +537,7 @@ class EntityNode(Node):
                 entity_data=entity_data,
             )
 
+        invalidate_search_cache(driver, [self.group_id])
         logger.debug(f'Saved Node to Graph: {self.uuid}')
 
         return result
@@ -586,6 +643,7 @@ class CommunityNode(Node):
             created_at=self.created_at,
         )
 
+        invalidate_search_cache(driver, [self.group_id])
         logger.debug(f'Saved Node to Graph: {self.uuid}')
 
         return result
@@ -707,6 +765,32 @@ class CommunityNode(Node):
 
 
 # Node helpers
+async def get_mentioned_node_uuids(driver: GraphDriver, episode_uuids: list[str]) -> list[str]:
+    # Kuzu has no mention_count column, so there is nothing to recompute
+    if driver.provider == GraphProvider.KUZU or not episode_uuids:
+        return []
+
+    records, _, _ = await driver.execute_query(
+        """
+        MATCH (episode:Episodic)-[:MENTIONS]->(n:Entity)
+        WHERE episode.uuid IN $episode_uuids
+        RETURN DISTINCT n.uuid AS uuid
+        """,
+        episode_uuids=episode_uuids,
+        routing_='r',
+    )
+
+    return [record['uuid'] for record in records]
+
+
+async def update_mention_counts(driver: GraphDriver, node_uuids: list[str]):
+    """Recompute the stored mention_count of entity nodes from their MENTIONS edges."""
+    if not node_uuids:
+        return
+
+    await driver.execute_query(ENTITY_NODE_MENTION_COUNT_UPDATE, node_uuids=node_uuids)
+
+
 def get_episodic_node_from_record(record: Any) -> EpisodicNode:
     created_at = parse_db_date(record['created_at'])
     valid_at = parse_db_date(record['valid_at'])
@@ -741,6 +825,7 @@ def get_entity_node_from_record(record: Any, provider: GraphProvider) -> EntityN
         attributes.pop('summary', None)
         attributes.pop('created_at', None)
         attributes.pop('labels', None)
+        attributes.pop('mention_count', None)
 
     labels = record.get('labels', [])
     group_id = record.get('group_id')
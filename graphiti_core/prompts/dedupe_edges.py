@@ -34,6 +34,14 @@ class EdgeDuplicate(BaseModel):
     fact_type: str = Field(..., description='One of the provided fact types or DEFAULT')
 
 
+class EdgeResolution(EdgeDuplicate):
+    id: int = Field(..., description='integer id of the new fact')
+
+
+class EdgeResolutions(BaseModel):
+    edge_resolutions: list[EdgeResolution] = Field(..., description='List of resolved new facts')
+
+
 class UniqueFact(BaseModel):
     uuid: str = Field(..., description='unique identifier of the fact')
     fact: str = Field(..., description='fact of a unique edge')
@@ -47,12 +55,14 @@ class Prompt(Protocol):
     edge: PromptVersion
     edge_list: PromptVersion
     resolve_edge: PromptVersion
+    resolve_edges: PromptVersion
 
 
 class Versions(TypedDict):
     edge: PromptFunction
     edge_list: PromptFunction
     resolve_edge: PromptFunction
+    resolve_edges: PromptFunction
 
 
 def edge(context: dict[str, Any]) -> list[Message]:
@@ -160,4 +170,56 @@ def resolve_edge(context: dict[str, Any]) -> list[Message]:
     ]
 
 
-versions: Versions = {'edge': edge, 'edge_list': edge_list, 'resolve_edge': resolve_edge}
+def resolve_edges(context: dict[str, Any]) -> list[Message]:
+    return [
+        Message(
+            role='system',
+            content='You are a helpful assistant that de-duplicates facts from fact lists and determines which existing '
+            'facts are contradicted by new facts.',
+        ),
+        Message(
+            role='user',
+            content=f"""
+        Each of the following NEW FACTS is represented as a JSON object with the following structure:
+        {{
+            id: integer id of the new fact,
+            fact: "the new fact",
+            existing_facts: [{{idx: integer index of the existing fact, fact: "existing fact"}}],
+            invalidation_candidates: [{{idx: integer index of the candidate fact, fact: "candidate fact"}}],
+            fact_types: [{{fact_type_name: "name of the fact type", fact_type_description: "description of the fact type"}}]
+        }}
+
+        <NEW FACTS>
+        {to_prompt_json(context['new_edges'], ensure_ascii=context.get('ensure_ascii', True), indent=2)}
+        </NEW FACTS>
+
+        Task:
+        Your response will be a list called edge_resolutions which contains one entry for each of the NEW FACTS,
+        with the id of the new fact as id. Resolve each new fact only against its own existing_facts,
+        invalidation_candidates and fact_types.
+
+        If the new fact represents identical factual information of one or more of its existing_facts, return the idx
+        of the duplicate facts as duplicate_facts. Facts with similar information that contain key differences should
+        not be marked as duplicates. If the new fact is not a duplicate of any of its existing_facts, return an empty list.
+
+        Given its fact_types, determine if the new fact should be classified as one of these types.
+        Return the fact type as fact_type or DEFAULT if the new fact is not one of its fact_types.
+
+        Based on its invalidation_candidates, determine which of them the new fact contradicts.
+        Return a list containing all idx's of the candidates that are contradicted by the new fact as contradicted_facts.
+        If there are no contradicted facts, return an empty list.
+
+        Guidelines:
+        1. Some facts may be very similar but will have key differences, particularly around numeric values in the facts.
+            Do not mark these facts as duplicates.
+        """,
+        ),
+    ]
+
+
+versions: Versions = {
+    'edge': edge,
+    'edge_list': edge_list,
+    'resolve_edge': resolve_edge,
+    'resolve_edges': resolve_edges,
+}
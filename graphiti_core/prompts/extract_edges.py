@@ -18,6 +18,7 @@ from typing import Any, Protocol, TypedDict
 
 from pydantic import BaseModel, Field
 
+from .extract_nodes import ExtractedEntity
 from .models import Message, PromptFunction, PromptVersion
 from .prompt_helpers import to_prompt_json
 
@@ -41,18 +42,29 @@ class ExtractedEdges(BaseModel):
     edges: list[Edge]
 
 
+class ExtractedEntitiesAndEdges(BaseModel):
+    extracted_entities: list[ExtractedEntity] = Field(..., description='List of extracted entities')
+    edges: list[Edge] = Field(
+        ...,
+        description='Facts between the extracted entities, identified by their position in '
+        'extracted_entities, starting at 0.',
+    )
+
+
 class MissingFacts(BaseModel):
     missing_facts: list[str] = Field(..., description="facts that weren't extracted")
 
 
 class Prompt(Protocol):
     edge: PromptVersion
+    entities_and_edges: PromptVersion
     reflexion: PromptVersion
     extract_attributes: PromptVersion
 
 
 class Versions(TypedDict):
     edge: PromptFunction
+    entities_and_edges: PromptFunction
     reflexion: PromptFunction
     extract_attributes: PromptFunction
 
@@ -128,6 +140,77 @@ You may use information from the PREVIOUS MESSAGES only to disambiguate referenc
     ]
 
 
+def entities_and_edges(context: dict[str, Any]) -> list[Message]:
+    return [
+        Message(
+            role='system',
+            content='You are an expert knowledge graph builder that extracts entities and the fact '
+            'triples between them from text in a single pass. '
+            '1. Extracted fact triples should also be extracted with relevant date information.'
+            '2. Treat the CURRENT TIME as the time the CURRENT MESSAGE was sent. All temporal information should be extracted relative to this time.',
+        ),
+        Message(
+            role='user',
+            content=f"""
+<ENTITY TYPES>
+{context['entity_types']}
+</ENTITY TYPES>
+
+<FACT TYPES>
+{context['edge_types']}
+</FACT TYPES>
+
+<SOURCE DESCRIPTION>
+{context['source_description']}
+</SOURCE DESCRIPTION>
+
+<PREVIOUS_MESSAGES>
+{to_prompt_json([ep for ep in context['previous_episodes']], ensure_ascii=context.get('ensure_ascii', False), indent=2)}
+</PREVIOUS_MESSAGES>
+
+<CURRENT_MESSAGE>
+{context['episode_content']}
+</CURRENT_MESSAGE>
+
+<REFERENCE_TIME>
+{context['reference_time']}  # ISO 8601 (UTC); used to resolve relative time mentions
+</REFERENCE_TIME>
+
+# TASK
+First extract the entities mentioned explicitly or implicitly in the CURRENT MESSAGE, then extract
+all factual relationships between those entities.
+
+# ENTITY RULES
+
+1. For conversational messages, always extract the speaker (the part before the colon `:` in each dialogue line) as the first entity.
+2. Extract significant entities, concepts, or actors; exclude entities mentioned only in the PREVIOUS MESSAGES.
+3. Disambiguate pronouns to the names of the entities they refer to, and do not extract pronouns as entities.
+4. Do NOT extract entities representing relationships, actions, dates, times or other temporal information.
+5. Use the descriptions in ENTITY TYPES to classify each entity and assign its `entity_type_id`.
+6. Be explicit and unambiguous in naming entities (e.g., use full names when available).
+
+# FACT RULES
+
+1. `source_entity_id` and `target_entity_id` are the positions of the entities in your `extracted_entities` list, starting at 0.
+2. Each fact must involve two **distinct** extracted entities and be clearly stated or unambiguously implied in the CURRENT MESSAGE.
+3. Use a SCREAMING_SNAKE_CASE string as the `relation_type` (e.g., FOUNDED, WORKS_AT); prefer the FACT TYPES when they apply.
+4. Do not emit duplicate or semantically redundant facts.
+5. The `fact` should quote or closely paraphrase the original source sentence(s), using entity names rather than pronouns.
+6. Use `REFERENCE_TIME` to resolve vague or relative temporal expressions (e.g., "last week").
+
+# DATETIME RULES
+
+- Use ISO 8601 with “Z” suffix (UTC) (e.g., 2025-04-30T00:00:00Z).
+- If the fact is ongoing (present tense), set `valid_at` to REFERENCE_TIME.
+- If a change/termination is expressed, set `invalid_at` to the relevant timestamp.
+- Leave both fields `null` if no explicit or resolvable time is stated.
+- If only a date is mentioned (no time), assume 00:00:00.
+- If only a year is mentioned, use January 1st at 00:00:00.
+        """,
+        ),
+    ]
+
+
 def reflexion(context: dict[str, Any]) -> list[Message]:
     sys_prompt = """You are an AI assistant that determines which facts have not been extracted from the given context"""
 
@@ -190,6 +273,7 @@ def extract_attributes(context: dict[str, Any]) -> list[Message]:
 
 versions: Versions = {
     'edge': edge,
+    'entities_and_edges': entities_and_edges,
     'reflexion': reflexion,
     'extract_attributes': extract_attributes,
 }
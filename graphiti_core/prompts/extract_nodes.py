@@ -67,6 +67,7 @@ class Prompt(Protocol):
     classify_nodes: PromptVersion
     extract_attributes: PromptVersion
     extract_summary: PromptVersion
+    extract_attributes_and_summaries: PromptVersion
 
 
 class Versions(TypedDict):
@@ -77,6 +78,7 @@ class Versions(TypedDict):
     classify_nodes: PromptFunction
     extract_attributes: PromptFunction
     extract_summary: PromptFunction
+    extract_attributes_and_summaries: PromptFunction
 
 
 def extract_message(context: dict[str, Any]) -> list[Message]:
@@ -309,6 +311,49 @@ def extract_summary(context: dict[str, Any]) -> list[Message]:
     ]
 
 
+def extract_attributes_and_summaries(context: dict[str, Any]) -> list[Message]:
+    return [
+        Message(
+            role='system',
+            content='You are a helpful assistant that extracts entity properties and summaries from the provided text.',
+        ),
+        Message(
+            role='user',
+            content=f"""
+
+        <MESSAGES>
+        {to_prompt_json(context['previous_episodes'], ensure_ascii=context.get('ensure_ascii', True), indent=2)}
+        {to_prompt_json(context['episode_content'], ensure_ascii=context.get('ensure_ascii', True), indent=2)}
+        </MESSAGES>
+
+        Each of the following ENTITIES is represented as a JSON object with the following structure:
+        {{
+            id: integer id of the entity,
+            name: "name of the entity",
+            summary: "existing summary of the entity",
+            entity_types: ["ontological classification of the entity"],
+            attributes: {{existing attribute values of the entity}}
+        }}
+
+        <ENTITIES>
+        {to_prompt_json(context['entities'], ensure_ascii=context.get('ensure_ascii', True), indent=2)}
+        </ENTITIES>
+
+        Given the above MESSAGES, for each of the ENTITIES update its summary and its attributes based on the
+        information provided in MESSAGES. Use the provided attribute descriptions to better understand how each
+        attribute should be determined.
+
+        Guidelines:
+        1. Do not hallucinate entity summary information or property values if they cannot be found in the current context.
+        2. Only use the provided MESSAGES and ENTITIES to set summaries and attribute values.
+        3. The summary should combine relevant information about the entity from the MESSAGES with the relevant
+            information from its existing summary. Summaries must be no longer than 250 words.
+        4. Return the summary and attributes of the entity with id N as entity_N, and return one entry for each entity.
+        """,
+        ),
+    ]
+
+
 versions: Versions = {
     'extract_message': extract_message,
     'extract_json': extract_json,
@@ -317,4 +362,5 @@ versions: Versions = {
     'extract_summary': extract_summary,
     'classify_nodes': classify_nodes,
     'extract_attributes': extract_attributes,
+    'extract_attributes_and_summaries': extract_attributes_and_summaries,
 }
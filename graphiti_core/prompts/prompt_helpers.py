@@ -22,3 +22,8 @@ def to_prompt_json(data: Any, ensure_ascii: bool = True, indent: int = 2) -> str
         in LLM logs and improving model understanding.
     """
     return json.dumps(data, ensure_ascii=ensure_ascii, indent=indent)
+
+
+def estimate_tokens(data: Any) -> int:
+    """Rough number of tokens of data serialized for a prompt, at about four characters per token."""
+    return len(to_prompt_json(data)) // 4 + 1
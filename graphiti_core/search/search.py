@@ -16,12 +16,16 @@ limitations under the License.
 
 import logging
 from collections import defaultdict
+from collections.abc import Awaitable, Callable, Coroutine, Hashable
 from time import time
+from typing import Any, TypeVar
+
+import numpy as np
+from numpy.typing import NDArray
 
 from graphiti_core.cross_encoder.client import CrossEncoderClient
 from graphiti_core.driver.driver import GraphDriver
 from graphiti_core.edges import EntityEdge
-from graphiti_core.embedder.client import EMBEDDING_DIM
 from graphiti_core.errors import SearchRerankerError
 from graphiti_core.graphiti_types import GraphitiClients
 from graphiti_core.helpers import semaphore_gather
@@ -43,27 +47,54 @@ from graphiti_core.search.search_config import (
     SearchResults,
 )
 from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.search.search_plan import SearchPlan, SearchScope, SearchStep, build_search_plan
 from graphiti_core.search.search_utils import (
+    BATCH_SEARCH_PROVIDERS,
+    EdgeSearchCandidate,
+    SearchCandidate,
+    comb_mnz,
+    comb_sum,
     community_fulltext_search,
     community_similarity_search,
     edge_bfs_search,
+    edge_bfs_search_candidates,
     edge_fulltext_search,
+    edge_fulltext_search_batch_candidates,
+    edge_fulltext_search_candidates,
     edge_similarity_search,
+    edge_similarity_search_batch_candidates,
+    edge_similarity_search_candidates,
     episode_fulltext_search,
     episode_mentions_reranker,
     get_embeddings_for_communities,
     get_embeddings_for_edges,
     get_embeddings_for_nodes,
+    linear_combination,
     maximal_marginal_relevance,
     node_bfs_search,
+    node_bfs_search_candidates,
     node_distance_reranker,
     node_fulltext_search,
+    node_fulltext_search_batch_candidates,
+    node_fulltext_search_candidates,
     node_similarity_search,
+    node_similarity_search_batch_candidates,
+    node_similarity_search_candidates,
     rrf,
 )
 
 logger = logging.getLogger(__name__)
 
+SearchRecord = TypeVar('SearchRecord', EntityEdge, EntityNode)
+
+# Score-aware fusion rerankers, by reranker value. They need the scores of the search methods,
+# which only search candidates carry, so their searches always return candidates.
+SCORE_FUSION_RERANKERS: dict[str, Callable[..., tuple[list[str], list[float]]]] = {
+    EdgeReranker.comb_sum.value: comb_sum,
+    EdgeReranker.comb_mnz.value: comb_mnz,
+    EdgeReranker.linear.value: linear_combination,
+}
+
 
 async def search(
     clients: GraphitiClients,
@@ -79,92 +110,319 @@ async def search(
 
     driver = clients.driver
     embedder = clients.embedder
-    cross_encoder = clients.cross_encoder
 
     if query.strip() == '':
         return SearchResults()
 
-    if (
-        config.edge_config
-        and EdgeSearchMethod.cosine_similarity in config.edge_config.search_methods
-        or config.edge_config
-        and EdgeReranker.mmr == config.edge_config.reranker
-        or config.node_config
-        and NodeSearchMethod.cosine_similarity in config.node_config.search_methods
-        or config.node_config
-        and NodeReranker.mmr == config.node_config.reranker
-        or (
-            config.community_config
-            and CommunitySearchMethod.cosine_similarity in config.community_config.search_methods
+    # if group_ids is empty, set it to None
+    group_ids = group_ids if group_ids and group_ids != [''] else None
+
+    # Searches with a caller supplied query vector are not cached
+    search_cache = driver.search_cache if query_vector is None else None
+    cache_key = None
+    cache_generation = None
+    if search_cache is not None:
+        cache_key = search_cache.make_key(
+            query,
+            group_ids,
+            config,
+            search_filter,
+            center_node_uuid,
+            bfs_origin_node_uuids,
+            getattr(driver, '_database', None),
         )
-        or (config.community_config and CommunityReranker.mmr == config.community_config.reranker)
-    ):
+        cache_generation = search_cache.generation(group_ids)
+        cached_results = search_cache.get(cache_key)
+        if cached_results is not None:
+            logger.debug(f'search cache hit for query {query}')
+            return cached_results
+
+    plan = build_search_plan(config, bfs_origin_node_uuids, center_node_uuid)
+    logger.debug(f'search plan for query {query}:\n{plan.describe()}')
+
+    search_vector: list[float] = []
+    if plan.embed_query:
         search_vector = (
             query_vector
             if query_vector is not None
             else await embedder.create(input_data=[query.replace('\n', ' ')])
         )
-    else:
-        search_vector = [0.0] * EMBEDDING_DIM
 
-    # if group_ids is empty, set it to None
+    results = await _search_with_plan(
+        clients,
+        plan,
+        query,
+        search_vector,
+        group_ids,
+        config,
+        search_filter,
+        center_node_uuid,
+        bfs_origin_node_uuids,
+    )
+
+    if search_cache is not None and cache_key is not None:
+        search_cache.set(cache_key, group_ids, results, cache_generation)
+
+    latency = (time() - start) * 1000
+
+    logger.debug(f'search returned context for query {query} in {latency} ms')
+
+    return results
+
+
+async def search_batch(
+    clients: GraphitiClients,
+    queries: list[str],
+    group_ids: list[str] | None,
+    config: SearchConfig,
+    search_filter: SearchFilters,
+    center_node_uuid: str | None = None,
+    bfs_origin_node_uuids: list[str] | None = None,
+) -> list[SearchResults]:
+    """
+    Run the same search for several queries and return the results of each query, in order.
+
+    The queries are embedded with a single create_batch call. On Neo4j and FalkorDB the BM25 and
+    cosine similarity searches of edges and nodes run as one UNWIND query per search method for all
+    queries; the remaining steps and the reranking run per query.
+    """
+    start = time()
+
+    driver = clients.driver
     group_ids = group_ids if group_ids and group_ids != [''] else None
+    plan = build_search_plan(config, bfs_origin_node_uuids, center_node_uuid)
+
+    search_cache = driver.search_cache
+    cache_generation = search_cache.generation(group_ids) if search_cache is not None else None
+    results: dict[str, SearchResults] = {}
+    cache_keys: dict[str, Hashable] = {}
+    for query in queries:
+        if query.strip() == '':
+            results[query] = SearchResults()
+        elif search_cache is not None and query not in cache_keys:
+            cache_keys[query] = search_cache.make_key(
+                query,
+                group_ids,
+                config,
+                search_filter,
+                center_node_uuid,
+                bfs_origin_node_uuids,
+                getattr(driver, '_database', None),
+            )
+            cached_results = search_cache.get(cache_keys[query])
+            if cached_results is not None:
+                results[query] = cached_results
+
+    pending_queries = list(dict.fromkeys(query for query in queries if query not in results))
+    if pending_queries:
+        search_vectors: list[list[float]] = [[] for _ in pending_queries]
+        if plan.embed_query:
+            search_vectors = await clients.embedder.create_batch(
+                [query.replace('\n', ' ') for query in pending_queries]
+            )
+
+        step_results = await _search_steps_batch(
+            driver, plan, pending_queries, search_vectors, group_ids, config, search_filter
+        )
+        pending_results = await semaphore_gather(
+            *[
+                _search_with_plan(
+                    clients,
+                    plan,
+                    query,
+                    search_vector,
+                    group_ids,
+                    config,
+                    search_filter,
+                    center_node_uuid,
+                    bfs_origin_node_uuids,
+                    query_step_results,
+                )
+                for query, search_vector, query_step_results in zip(
+                    pending_queries, search_vectors, step_results, strict=True
+                )
+            ]
+        )
+        for query, query_results in zip(pending_queries, pending_results, strict=True):
+            results[query] = query_results
+            if search_cache is not None:
+                search_cache.set(cache_keys[query], group_ids, query_results, cache_generation)
+
+    latency = (time() - start) * 1000
+
+    logger.debug(f'search_batch returned context for {len(queries)} queries in {latency} ms')
+
+    return [results[query] for query in queries]
+
+
+async def _search_steps_batch(
+    driver: GraphDriver,
+    plan: SearchPlan,
+    queries: list[str],
+    search_vectors: list[list[float]],
+    group_ids: list[str] | None,
+    config: SearchConfig,
+    search_filter: SearchFilters,
+) -> list[dict[tuple[SearchScope, str], list[Any]]]:
+    """
+    Run the stage 0 BM25 and cosine similarity steps of edges and nodes for all queries at once,
+    and return the results of each query by (scope, method).
+    """
+    step_results: list[dict[tuple[SearchScope, str], list[Any]]] = [{} for _ in queries]
+    if driver.provider not in BATCH_SEARCH_PROVIDERS or len(queries) < 2:
+        return step_results
+
+    limit = 2 * config.limit
+    batched_steps: list[SearchStep] = []
+    batched_searches: list[Coroutine[Any, Any, list[list[Any]]]] = []
+    # Cosine searches over a vector index (use_local_indexes) stay per query so that they take the
+    # same index path as search(); steps that are not batched run as part of each query's plan
+    for step in plan.stage(0):
+        if step.scope == SearchScope.edge and config.edge_config is not None:
+            edge_config = config.edge_config
+            if step.method == EdgeSearchMethod.bm25.value:
+                batched_searches.append(
+                    edge_fulltext_search_batch_candidates(
+                        driver, queries, search_filter, group_ids, limit
+                    )
+                )
+            elif (
+                step.method == EdgeSearchMethod.cosine_similarity.value
+                and not edge_config.use_local_indexes
+            ):
+                batched_searches.append(
+                    edge_similarity_search_batch_candidates(
+                        driver,
+                        search_vectors,
+                        search_filter,
+                        group_ids,
+                        limit,
+                        edge_config.sim_min_score,
+                        with_embeddings=edge_config.reranker == EdgeReranker.mmr,
+                    )
+                )
+            else:
+                continue
+        elif step.scope == SearchScope.node and config.node_config is not None:
+            node_config = config.node_config
+            if step.method == NodeSearchMethod.bm25.value:
+                batched_searches.append(
+                    node_fulltext_search_batch_candidates(
+                        driver,
+                        queries,
+                        search_filter,
+                        group_ids,
+                        limit,
+                        node_config.use_local_indexes,
+                    )
+                )
+            elif (
+                step.method == NodeSearchMethod.cosine_similarity.value
+                and not node_config.use_local_indexes
+            ):
+                batched_searches.append(
+                    node_similarity_search_batch_candidates(
+                        driver,
+                        search_vectors,
+                        search_filter,
+                        group_ids,
+                        limit,
+                        node_config.sim_min_score,
+                        with_embeddings=node_config.reranker == NodeReranker.mmr,
+                    )
+                )
+            else:
+                continue
+        else:
+            continue
+
+        batched_steps.append(step)
+
+    for step, results in zip(batched_steps, await semaphore_gather(*batched_searches), strict=True):
+        for query_step_results, query_results in zip(step_results, results, strict=True):
+            query_step_results[(step.scope, step.method)] = query_results
+
+    return step_results
+
+
+async def _search_with_plan(
+    clients: GraphitiClients,
+    plan: SearchPlan,
+    query: str,
+    search_vector: list[float],
+    group_ids: list[str] | None,
+    config: SearchConfig,
+    search_filter: SearchFilters,
+    center_node_uuid: str | None = None,
+    bfs_origin_node_uuids: list[str] | None = None,
+    step_results: dict[tuple[SearchScope, str], list[Any]] | None = None,
+) -> SearchResults:
+    driver = clients.driver
+    cross_encoder = clients.cross_encoder
+
+    candidates = await execute_search_plan(
+        driver,
+        plan,
+        query,
+        search_vector,
+        group_ids,
+        config,
+        search_filter,
+        bfs_origin_node_uuids,
+        step_results,
+    )
+
     (
         (edges, edge_reranker_scores),
         (nodes, node_reranker_scores),
         (episodes, episode_reranker_scores),
         (communities, community_reranker_scores),
     ) = await semaphore_gather(
-        edge_search(
+        rerank_edges(
             driver,
             cross_encoder,
             query,
             search_vector,
-            group_ids,
             config.edge_config,
-            search_filter,
+            candidates.get(SearchScope.edge, []),
             center_node_uuid,
-            bfs_origin_node_uuids,
             config.limit,
             config.reranker_min_score,
+            plan.methods(SearchScope.edge),
         ),
-        node_search(
+        rerank_nodes(
             driver,
             cross_encoder,
             query,
             search_vector,
-            group_ids,
             config.node_config,
-            search_filter,
+            candidates.get(SearchScope.node, []),
             center_node_uuid,
-            bfs_origin_node_uuids,
             config.limit,
             config.reranker_min_score,
+            plan.methods(SearchScope.node),
         ),
-        episode_search(
-            driver,
+        rerank_episodes(
             cross_encoder,
             query,
-            search_vector,
-            group_ids,
             config.episode_config,
-            search_filter,
+            candidates.get(SearchScope.episode, []),
             config.limit,
             config.reranker_min_score,
         ),
-        community_search(
+        rerank_communities(
             driver,
             cross_encoder,
             query,
             search_vector,
-            group_ids,
             config.community_config,
+            candidates.get(SearchScope.community, []),
             config.limit,
             config.reranker_min_score,
         ),
     )
 
-    results = SearchResults(
+    return SearchResults(
         edges=edges,
         edge_reranker_scores=edge_reranker_scores,
         nodes=nodes,
@@ -175,89 +433,349 @@ async def search(
         community_reranker_scores=community_reranker_scores,
     )
 
-    latency = (time() - start) * 1000
 
-    logger.debug(f'search returned context for query {query} in {latency} ms')
+def _bfs_seed_uuids(step: SearchStep, candidates: dict[SearchScope, list[list[Any]]]) -> list[str]:
+    for seed_scope in step.seed_scopes:
+        results = candidates.get(seed_scope, [])
+        if seed_scope == SearchScope.edge:
+            # Edge BFS expands from the source nodes of the edges, node BFS from both endpoints
+            uuids = [
+                uuid
+                for result in results
+                for edge in result
+                for uuid in (
+                    [edge.source_node_uuid]
+                    if step.scope == SearchScope.edge
+                    else [edge.source_node_uuid, edge.target_node_uuid]
+                )
+            ]
+        else:
+            uuids = [node.uuid for result in results for node in result]
 
-    return results
+        if uuids:
+            return list(dict.fromkeys(uuids))
 
+    return []
 
-async def edge_search(
+
+def _search_step(
     driver: GraphDriver,
-    cross_encoder: CrossEncoderClient,
+    step: SearchStep,
     query: str,
     query_vector: list[float],
     group_ids: list[str] | None,
-    config: EdgeSearchConfig | None,
+    config: SearchConfig,
     search_filter: SearchFilters,
-    center_node_uuid: str | None = None,
-    bfs_origin_node_uuids: list[str] | None = None,
-    limit=DEFAULT_SEARCH_LIMIT,
-    reranker_min_score: float = 0,
-) -> tuple[list[EntityEdge], list[float]]:
-    if config is None:
-        return [], []
+    bfs_origin_node_uuids: list[str] | None,
+) -> Coroutine[Any, Any, list[Any]]:
+    limit = 2 * config.limit
 
-    # Build search tasks based on configured search methods
-    search_tasks = []
-    if EdgeSearchMethod.bm25 in config.search_methods:
-        search_tasks.append(
-            edge_fulltext_search(driver, query, search_filter, group_ids, 2 * limit)
+    if step.scope == SearchScope.edge and config.edge_config is not None:
+        edge_config = config.edge_config
+        use_candidates = (
+            edge_config.two_phase or edge_config.reranker.value in SCORE_FUSION_RERANKERS
         )
-    if EdgeSearchMethod.cosine_similarity in config.search_methods:
-        search_tasks.append(
-            edge_similarity_search(
+        if step.method == EdgeSearchMethod.bm25.value:
+            fulltext_search = (
+                edge_fulltext_search_candidates if use_candidates else edge_fulltext_search
+            )
+            return fulltext_search(driver, query, search_filter, group_ids, limit)
+        if step.method == EdgeSearchMethod.cosine_similarity.value:
+            similarity_search = (
+                edge_similarity_search_candidates if use_candidates else edge_similarity_search
+            )
+            return similarity_search(
                 driver,
                 query_vector,
                 None,
                 None,
                 search_filter,
                 group_ids,
-                2 * limit,
-                config.sim_min_score,
+                limit,
+                edge_config.sim_min_score,
+                edge_config.use_local_indexes,
+                with_embeddings=edge_config.reranker == EdgeReranker.mmr,
             )
+        bfs_search = edge_bfs_search_candidates if use_candidates else edge_bfs_search
+        return bfs_search(
+            driver,
+            bfs_origin_node_uuids,
+            edge_config.bfs_max_depth,
+            search_filter,
+            group_ids,
+            limit,
         )
-    if EdgeSearchMethod.bfs in config.search_methods:
-        search_tasks.append(
-            edge_bfs_search(
+
+    if step.scope == SearchScope.node and config.node_config is not None:
+        node_config = config.node_config
+        use_candidates = (
+            node_config.two_phase or node_config.reranker.value in SCORE_FUSION_RERANKERS
+        )
+        if step.method == NodeSearchMethod.bm25.value:
+            fulltext_search = (
+                node_fulltext_search_candidates if use_candidates else node_fulltext_search
+            )
+            return fulltext_search(
+                driver, query, search_filter, group_ids, limit, node_config.use_local_indexes
+            )
+        if step.method == NodeSearchMethod.cosine_similarity.value:
+            similarity_search = (
+                node_similarity_search_candidates if use_candidates else node_similarity_search
+            )
+            return similarity_search(
                 driver,
-                bfs_origin_node_uuids,
-                config.bfs_max_depth,
+                query_vector,
                 search_filter,
                 group_ids,
-                2 * limit,
+                limit,
+                node_config.sim_min_score,
+                node_config.use_local_indexes,
+                with_embeddings=node_config.reranker == NodeReranker.mmr,
             )
+        bfs_search = node_bfs_search_candidates if use_candidates else node_bfs_search
+        return bfs_search(
+            driver,
+            bfs_origin_node_uuids,
+            search_filter,
+            node_config.bfs_max_depth,
+            group_ids,
+            limit,
+        )
+
+    if step.scope == SearchScope.episode and config.episode_config is not None:
+        return episode_fulltext_search(
+            driver,
+            query,
+            search_filter,
+            group_ids,
+            limit,
+            config.episode_config.use_local_indexes,
         )
 
-    # Execute only the configured search methods
-    search_results: list[list[EntityEdge]] = []
-    if search_tasks:
-        search_results = list(await semaphore_gather(*search_tasks))
+    if step.scope == SearchScope.community and config.community_config is not None:
+        if step.method == CommunitySearchMethod.bm25.value:
+            return community_fulltext_search(driver, query, group_ids, limit)
+        return community_similarity_search(
+            driver,
+            query_vector,
+            group_ids,
+            limit,
+            config.community_config.sim_min_score,
+            config.community_config.use_local_indexes,
+        )
 
-    if EdgeSearchMethod.bfs in config.search_methods and bfs_origin_node_uuids is None:
-        source_node_uuids = [edge.source_node_uuid for result in search_results for edge in result]
-        search_results.append(
-            await edge_bfs_search(
-                driver,
-                source_node_uuids,
-                config.bfs_max_depth,
-                search_filter,
-                group_ids,
-                2 * limit,
-            )
+    raise ValueError(f'Search step {step} does not match the search config')
+
+
+async def execute_search_plan(
+    driver: GraphDriver,
+    plan: SearchPlan,
+    query: str,
+    query_vector: list[float],
+    group_ids: list[str] | None,
+    config: SearchConfig,
+    search_filter: SearchFilters,
+    bfs_origin_node_uuids: list[str] | None = None,
+    step_results: dict[tuple[SearchScope, str], list[Any]] | None = None,
+) -> dict[SearchScope, list[list[Any]]]:
+    """
+    Run the candidate queries of a search plan and return their results per scope, in step order.
+    Steps whose (scope, method) is in step_results, e.g. from a batched search, are not run again.
+    """
+    step_results = step_results or {}
+    candidates: dict[SearchScope, list[list[Any]]] = {scope: [] for scope in plan.scopes()}
+
+    for stage in (0, 1):
+        steps = plan.stage(stage)
+        pending_steps = [step for step in steps if (step.scope, step.method) not in step_results]
+
+        results = await semaphore_gather(
+            *[
+                _search_step(
+                    driver,
+                    step,
+                    query,
+                    query_vector,
+                    group_ids,
+                    config,
+                    search_filter,
+                    bfs_origin_node_uuids if stage == 0 else _bfs_seed_uuids(step, candidates),
+                )
+                for step in pending_steps
+            ]
         )
+        step_results = step_results | {
+            (step.scope, step.method): result
+            for step, result in zip(pending_steps, results, strict=True)
+        }
+        for step in steps:
+            candidates[step.scope].append(step_results[(step.scope, step.method)])
+
+    return candidates
+
+
+def _fusion_weights(
+    method_weights: dict[Any, float], search_methods: list[str] | None
+) -> list[float] | None:
+    if not method_weights or search_methods is None:
+        return None
+
+    weights = {method.value: weight for method, weight in method_weights.items()}
+    return [weights.get(method, 1.0) for method in search_methods]
+
+
+def _scored_uuids(search_results: list[list[Any]]) -> list[list[tuple[str, float | None]]]:
+    # Full records carry no search score; the fusion scores their lists by rank
+    return [
+        [(item.uuid, getattr(item, 'score', None)) for item in result] for result in search_results
+    ]
+
+
+async def _load_search_results(
+    driver: GraphDriver,
+    record_type: type[SearchRecord],
+    uuid_map: dict[str, Any],
+    uuids: list[str],
+) -> list[SearchRecord]:
+    """
+    Return the full records for uuids, in order, loading the ones that are still search candidates
+    with a single get_by_uuids call. Records that no longer exist are skipped.
+    """
+    missing_uuids = [uuid for uuid in uuids if not isinstance(uuid_map.get(uuid), record_type)]
+    if missing_uuids:
+        for record in await record_type.get_by_uuids(driver, missing_uuids):
+            uuid_map[record.uuid] = record
+
+    return [uuid_map[uuid] for uuid in uuids if isinstance(uuid_map.get(uuid), record_type)]
+
+
+def _loaded_scores(records: list[Any], uuids: list[str], scores: list[float]) -> list[float]:
+    """Return the reranker scores of the loaded records, in their order."""
+    score_map = dict(zip(uuids, scores, strict=True))
+    return [score_map[record.uuid] for record in records]
+
+
+async def _get_mmr_embeddings(
+    driver: GraphDriver,
+    search_results: list[list[Any]],
+    uuid_map: dict[str, Any],
+    embedding_attribute: str,
+    get_embeddings: Callable[[GraphDriver, list[Any]], Awaitable[dict[str, list[float]]]],
+) -> dict[str, NDArray[np.float32]]:
+    """
+    Collect the embeddings returned by the similarity search and fetch only the missing ones, i.e.
+    those of candidates found by BM25 or BFS alone.
+    """
+    embeddings: dict[str, NDArray[np.float32]] = {}
+    for result in search_results:
+        for item in result:
+            if isinstance(item, SearchCandidate | EdgeSearchCandidate):
+                embedding = item.embedding
+            else:
+                embedding = getattr(item, embedding_attribute)
+                # Embeddings are not returned with the search results
+                setattr(item, embedding_attribute, None)
+
+            if embedding is not None:
+                embeddings[item.uuid] = np.asarray(embedding, dtype=np.float32)
+
+    missing = [item for uuid, item in uuid_map.items() if uuid not in embeddings]
+    if missing:
+        for uuid, embedding in (await get_embeddings(driver, missing)).items():
+            embeddings[uuid] = np.asarray(embedding, dtype=np.float32)
+
+    return {uuid: embeddings[uuid] for uuid in uuid_map if uuid in embeddings}
+
+
+async def edge_search(
+    driver: GraphDriver,
+    cross_encoder: CrossEncoderClient,
+    query: str,
+    query_vector: list[float],
+    group_ids: list[str] | None,
+    config: EdgeSearchConfig | None,
+    search_filter: SearchFilters,
+    center_node_uuid: str | None = None,
+    bfs_origin_node_uuids: list[str] | None = None,
+    limit=DEFAULT_SEARCH_LIMIT,
+    reranker_min_score: float = 0,
+) -> tuple[list[EntityEdge], list[float]]:
+    if config is None:
+        return [], []
+
+    search_config = SearchConfig(edge_config=config, limit=limit)
+    plan = build_search_plan(search_config, bfs_origin_node_uuids, center_node_uuid)
+    candidates = await execute_search_plan(
+        driver,
+        plan,
+        query,
+        query_vector,
+        group_ids,
+        search_config,
+        search_filter,
+        bfs_origin_node_uuids,
+    )
+
+    return await rerank_edges(
+        driver,
+        cross_encoder,
+        query,
+        query_vector,
+        config,
+        candidates[SearchScope.edge],
+        center_node_uuid,
+        limit,
+        reranker_min_score,
+        plan.methods(SearchScope.edge),
+    )
+
+
+async def rerank_edges(
+    driver: GraphDriver,
+    cross_encoder: CrossEncoderClient,
+    query: str,
+    query_vector: list[float],
+    config: EdgeSearchConfig | None,
+    search_results: list[list[EntityEdge]] | list[list[EdgeSearchCandidate]],
+    center_node_uuid: str | None = None,
+    limit=DEFAULT_SEARCH_LIMIT,
+    reranker_min_score: float = 0,
+    search_methods: list[str] | None = None,
+) -> tuple[list[EntityEdge], list[float]]:
+    """
+    Rerank the results of the search methods of an edge search. search_methods names the method
+    behind each result list; without it every method gets the default fusion weight.
+    """
+    if config is None:
+        return [], []
 
-    edge_uuid_map = {edge.uuid: edge for result in search_results for edge in result}
+    weights = _fusion_weights(config.method_weights, search_methods)
+
+    edge_uuid_map: dict[str, EntityEdge | EdgeSearchCandidate] = {
+        edge.uuid: edge for result in search_results for edge in result
+    }
 
     reranked_uuids: list[str] = []
     edge_scores: list[float] = []
-    if config.reranker == EdgeReranker.rrf or config.reranker == EdgeReranker.episode_mentions:
+    if config.reranker == EdgeReranker.rrf:
         search_result_uuids = [[edge.uuid for edge in result] for result in search_results]
 
-        reranked_uuids, edge_scores = rrf(search_result_uuids, min_score=reranker_min_score)
+        reranked_uuids, edge_scores = rrf(
+            search_result_uuids, config.rrf_k, reranker_min_score, weights, limit
+        )
+    elif config.reranker == EdgeReranker.episode_mentions:
+        search_result_uuids = [[edge.uuid for edge in result] for result in search_results]
+
+        reranked_uuids, edge_scores = rrf(
+            search_result_uuids, config.rrf_k, reranker_min_score, weights
+        )
+    elif config.reranker.value in SCORE_FUSION_RERANKERS:
+        reranked_uuids, edge_scores = SCORE_FUSION_RERANKERS[config.reranker.value](
+            _scored_uuids(search_results), weights, reranker_min_score, limit
+        )
     elif config.reranker == EdgeReranker.mmr:
-        search_result_uuids_and_vectors = await get_embeddings_for_edges(
-            driver, list(edge_uuid_map.values())
+        search_result_uuids_and_vectors = await _get_mmr_embeddings(
+            driver, search_results, edge_uuid_map, 'fact_embedding', get_embeddings_for_edges
         )
         reranked_uuids, edge_scores = maximal_marginal_relevance(
             query_vector,
@@ -266,7 +784,10 @@ async def edge_search(
             reranker_min_score,
         )
     elif config.reranker == EdgeReranker.cross_encoder:
-        fact_to_uuid_map = {edge.fact: edge.uuid for edge in list(edge_uuid_map.values())[:limit]}
+        edges = await _load_search_results(
+            driver, EntityEdge, edge_uuid_map, list(edge_uuid_map)[:limit]
+        )
+        fact_to_uuid_map = {edge.fact: edge.uuid for edge in edges}
         reranked_facts = await cross_encoder.rank(query, list(fact_to_uuid_map.keys()))
         reranked_uuids = [
             fact_to_uuid_map[fact] for fact, score in reranked_facts if score >= reranker_min_score
@@ -279,7 +800,9 @@ async def edge_search(
         # use rrf as a preliminary sort
         sorted_result_uuids, node_scores = rrf(
             [[edge.uuid for edge in result] for result in search_results],
-            min_score=reranker_min_score,
+            config.rrf_k,
+            reranker_min_score,
+            weights,
         )
         sorted_results = [edge_uuid_map[uuid] for uuid in sorted_result_uuids]
 
@@ -290,19 +813,33 @@ async def edge_search(
 
         source_uuids = [source_node_uuid for source_node_uuid in source_to_edge_uuid_map]
 
-        reranked_node_uuids, edge_scores = await node_distance_reranker(
-            driver, source_uuids, center_node_uuid, min_score=reranker_min_score
+        reranked_node_uuids, node_distance_scores = await node_distance_reranker(
+            driver,
+            source_uuids,
+            center_node_uuid,
+            min_score=reranker_min_score,
+            max_depth=config.bfs_max_depth,
         )
 
-        for node_uuid in reranked_node_uuids:
-            reranked_uuids.extend(source_to_edge_uuid_map[node_uuid])
-
-    reranked_edges = [edge_uuid_map[uuid] for uuid in reranked_uuids]
+        # Every edge takes the score of its source node
+        for node_uuid, score in zip(reranked_node_uuids, node_distance_scores, strict=True):
+            edge_uuids = source_to_edge_uuid_map[node_uuid]
+            reranked_uuids.extend(edge_uuids)
+            edge_scores.extend([score] * len(edge_uuids))
 
     if config.reranker == EdgeReranker.episode_mentions:
+        # Sorting by mention count needs the episodes of every candidate
+        reranked_edges = await _load_search_results(
+            driver, EntityEdge, edge_uuid_map, reranked_uuids
+        )
         reranked_edges.sort(reverse=True, key=lambda edge: len(edge.episodes))
+    else:
+        reranked_edges = await _load_search_results(
+            driver, EntityEdge, edge_uuid_map, reranked_uuids[:limit]
+        )
 
-    return reranked_edges[:limit], edge_scores[:limit]
+    reranked_edges = reranked_edges[:limit]
+    return reranked_edges, _loaded_scores(reranked_edges, reranked_uuids, edge_scores)
 
 
 async def node_search(
@@ -321,66 +858,72 @@ async def node_search(
     if config is None:
         return [], []
 
-    # Build search tasks based on configured search methods
-    search_tasks = []
-    if NodeSearchMethod.bm25 in config.search_methods:
-        search_tasks.append(
-            node_fulltext_search(
-                driver, query, search_filter, group_ids, 2 * limit, config.use_local_indexes
-            )
-        )
-    if NodeSearchMethod.cosine_similarity in config.search_methods:
-        search_tasks.append(
-            node_similarity_search(
-                driver,
-                query_vector,
-                search_filter,
-                group_ids,
-                2 * limit,
-                config.sim_min_score,
-                config.use_local_indexes,
-            )
-        )
-    if NodeSearchMethod.bfs in config.search_methods:
-        search_tasks.append(
-            node_bfs_search(
-                driver,
-                bfs_origin_node_uuids,
-                search_filter,
-                config.bfs_max_depth,
-                group_ids,
-                2 * limit,
-            )
-        )
+    search_config = SearchConfig(node_config=config, limit=limit)
+    plan = build_search_plan(search_config, bfs_origin_node_uuids, center_node_uuid)
+    candidates = await execute_search_plan(
+        driver,
+        plan,
+        query,
+        query_vector,
+        group_ids,
+        search_config,
+        search_filter,
+        bfs_origin_node_uuids,
+    )
 
-    # Execute only the configured search methods
-    search_results: list[list[EntityNode]] = []
-    if search_tasks:
-        search_results = list(await semaphore_gather(*search_tasks))
+    return await rerank_nodes(
+        driver,
+        cross_encoder,
+        query,
+        query_vector,
+        config,
+        candidates[SearchScope.node],
+        center_node_uuid,
+        limit,
+        reranker_min_score,
+        plan.methods(SearchScope.node),
+    )
 
-    if NodeSearchMethod.bfs in config.search_methods and bfs_origin_node_uuids is None:
-        origin_node_uuids = [node.uuid for result in search_results for node in result]
-        search_results.append(
-            await node_bfs_search(
-                driver,
-                origin_node_uuids,
-                search_filter,
-                config.bfs_max_depth,
-                group_ids,
-                2 * limit,
-            )
-        )
+
+async def rerank_nodes(
+    driver: GraphDriver,
+    cross_encoder: CrossEncoderClient,
+    query: str,
+    query_vector: list[float],
+    config: NodeSearchConfig | None,
+    search_results: list[list[EntityNode]] | list[list[SearchCandidate]],
+    center_node_uuid: str | None = None,
+    limit=DEFAULT_SEARCH_LIMIT,
+    reranker_min_score: float = 0,
+    search_methods: list[str] | None = None,
+) -> tuple[list[EntityNode], list[float]]:
+    """
+    Rerank the results of the search methods of a node search. search_methods names the method
+    behind each result list; without it every method gets the default fusion weight.
+    """
+    if config is None:
+        return [], []
+
+    weights = _fusion_weights(config.method_weights, search_methods)
 
     search_result_uuids = [[node.uuid for node in result] for result in search_results]
-    node_uuid_map = {node.uuid: node for result in search_results for node in result}
+    node_uuid_map: dict[str, EntityNode | SearchCandidate] = {
+        node.uuid: node for result in search_results for node in result
+    }
 
     reranked_uuids: list[str] = []
     node_scores: list[float] = []
     if config.reranker == NodeReranker.rrf:
-        reranked_uuids, node_scores = rrf(search_result_uuids, min_score=reranker_min_score)
+        reranked_uuids, node_scores = rrf(
+            search_result_uuids, config.rrf_k, reranker_min_score, weights, limit
+        )
+    elif config.reranker.value in SCORE_FUSION_RERANKERS:
+        reranked_uuids, node_scores = SCORE_FUSION_RERANKERS[config.reranker.value](
+            _scored_uuids(search_results), weights, reranker_min_score, limit
+        )
     elif config.reranker == NodeReranker.mmr:
-        search_result_uuids_and_vectors = await get_embeddings_for_nodes(
-            driver, list(node_uuid_map.values())
+        search_result_uuids_and_vectors = await _get_mmr_embeddings(
+            driver, search_results, node_uuid_map, 'name_embedding', get_embeddings_for_nodes
         )
 
         reranked_uuids, node_scores = maximal_marginal_relevance(
@@ -390,7 +933,8 @@ async def node_search(
             reranker_min_score,
         )
     elif config.reranker == NodeReranker.cross_encoder:
-        name_to_uuid_map = {node.name: node.uuid for node in list(node_uuid_map.values())}
+        nodes = await _load_search_results(driver, EntityNode, node_uuid_map, list(node_uuid_map))
+        name_to_uuid_map = {node.name: node.uuid for node in nodes}
 
         reranked_node_names = await cross_encoder.rank(query, list(name_to_uuid_map.keys()))
         reranked_uuids = [
@@ -401,21 +945,24 @@ async def node_search(
         node_scores = [score for _, score in reranked_node_names if score >= reranker_min_score]
     elif config.reranker == NodeReranker.episode_mentions:
         reranked_uuids, node_scores = await episode_mentions_reranker(
-            driver, search_result_uuids, min_score=reranker_min_score
+            driver, search_result_uuids, min_score=reranker_min_score, limit=limit
         )
     elif config.reranker == NodeReranker.node_distance:
         if center_node_uuid is None:
             raise SearchRerankerError('No center node provided for Node Distance reranker')
         reranked_uuids, node_scores = await node_distance_reranker(
             driver,
-            rrf(search_result_uuids, min_score=reranker_min_score)[0],
+            rrf(search_result_uuids, config.rrf_k, reranker_min_score, weights)[0],
             center_node_uuid,
             min_score=reranker_min_score,
+            max_depth=config.bfs_max_depth,
         )
 
-    reranked_nodes = [node_uuid_map[uuid] for uuid in reranked_uuids]
+    reranked_nodes = await _load_search_results(
+        driver, EntityNode, node_uuid_map, reranked_uuids[:limit]
+    )
 
-    return reranked_nodes[:limit], node_scores[:limit]
+    return reranked_nodes, _loaded_scores(reranked_nodes, reranked_uuids, node_scores)
 
 
 async def episode_search(
@@ -431,16 +978,39 @@ async def episode_search(
 ) -> tuple[list[EpisodicNode], list[float]]:
     if config is None:
         return [], []
-    search_results: list[list[EpisodicNode]] = list(
-        await semaphore_gather(
-            *[
-                episode_fulltext_search(
-                    driver, query, search_filter, group_ids, 2 * limit, config.use_local_indexes
-                ),
-            ]
-        )
+
+    search_config = SearchConfig(episode_config=config, limit=limit)
+    candidates = await execute_search_plan(
+        driver,
+        build_search_plan(search_config),
+        query,
+        _query_vector,
+        group_ids,
+        search_config,
+        search_filter,
+    )
+
+    return await rerank_episodes(
+        cross_encoder,
+        query,
+        config,
+        candidates[SearchScope.episode],
+        limit,
+        reranker_min_score,
     )
 
+
+async def rerank_episodes(
+    cross_encoder: CrossEncoderClient,
+    query: str,
+    config: EpisodeSearchConfig | None,
+    search_results: list[list[EpisodicNode]],
+    limit=DEFAULT_SEARCH_LIMIT,
+    reranker_min_score: float = 0,
+) -> tuple[list[EpisodicNode], list[float]]:
+    if config is None:
+        return [], []
+
     search_result_uuids = [[episode.uuid for episode in result] for result in search_results]
     episode_uuid_map = {episode.uuid: episode for result in search_results for episode in result}
 
@@ -482,17 +1052,42 @@ async def community_search(
     if config is None:
         return [], []
 
-    search_results: list[list[CommunityNode]] = list(
-        await semaphore_gather(
-            *[
-                community_fulltext_search(driver, query, group_ids, 2 * limit),
-                community_similarity_search(
-                    driver, query_vector, group_ids, 2 * limit, config.sim_min_score
-                ),
-            ]
-        )
+    search_config = SearchConfig(community_config=config, limit=limit)
+    candidates = await execute_search_plan(
+        driver,
+        build_search_plan(search_config),
+        query,
+        query_vector,
+        group_ids,
+        search_config,
+        SearchFilters(),
     )
 
+    return await rerank_communities(
+        driver,
+        cross_encoder,
+        query,
+        query_vector,
+        config,
+        candidates[SearchScope.community],
+        limit,
+        reranker_min_score,
+    )
+
+
+async def rerank_communities(
+    driver: GraphDriver,
+    cross_encoder: CrossEncoderClient,
+    query: str,
+    query_vector: list[float],
+    config: CommunitySearchConfig | None,
+    search_results: list[list[CommunityNode]],
+    limit=DEFAULT_SEARCH_LIMIT,
+    reranker_min_score: float = 0,
+) -> tuple[list[CommunityNode], list[float]]:
+    if config is None:
+        return [], []
+
     search_result_uuids = [[community.uuid for community in result] for result in search_results]
     community_uuid_map = {
         community.uuid: community for result in search_results for community in result
@@ -0,0 +1,194 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from graphiti_core.driver.driver import GraphDriver
+    from graphiti_core.search.search_config import SearchConfig, SearchResults
+    from graphiti_core.search.search_filters import SearchFilters
+
+DEFAULT_SEARCH_CACHE_TTL = 60.0
+DEFAULT_SEARCH_CACHE_MAX_ENTRIES = 1024
+# Bound on the edges, nodes, episodes and communities held across all entries; cached results
+# carry no embeddings, so the number of items approximates their memory
+DEFAULT_SEARCH_CACHE_MAX_ITEMS = 50_000
+
+# Entries for searches that are not scoped to any group_id are invalidated by every write
+_ALL_GROUPS = None
+
+
+class SearchCache:
+    """
+    In-memory LRU cache of search results with a TTL and per-group_id invalidation.
+
+    Attach a cache to a driver (`Graphiti(..., search_cache=SearchCache())`) and repeated searches
+    with the same normalized query, group_ids, config, filters, center node and BFS origins are
+    served from memory. Writes made through the driver invalidate the entries of the group_ids
+    they touch.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_SEARCH_CACHE_TTL,
+        max_entries: int = DEFAULT_SEARCH_CACHE_MAX_ENTRIES,
+        max_items: int = DEFAULT_SEARCH_CACHE_MAX_ITEMS,
+    ):
+        if max_entries < 1:
+            raise ValueError(f'max_entries must be at least 1, got: {max_entries}')
+        if max_items < 1:
+            raise ValueError(f'max_items must be at least 1, got: {max_items}')
+
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_items = max_items
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: OrderedDict[Hashable, tuple[float, tuple[str | None, ...], Any, int]] = (
+            OrderedDict()
+        )
+        self._keys_by_group: dict[str | None, set[Hashable]] = {}
+        self._items = 0
+        # Incremented on invalidation so that searches started before a write are not cached:
+        # per group_id for the groups a write touches, and overall for unscoped searches
+        self._group_generations: dict[str | None, int] = {}
+        self._writes = 0
+        self._clears = 0
+
+    @staticmethod
+    def make_key(
+        query: str,
+        group_ids: list[str] | None,
+        config: 'SearchConfig',
+        search_filter: 'SearchFilters',
+        center_node_uuid: str | None = None,
+        bfs_origin_node_uuids: list[str] | None = None,
+        database: str | None = None,
+    ) -> Hashable:
+        return (
+            ' '.join(query.split()),
+            tuple(sorted(group_ids)) if group_ids is not None else None,
+            config.model_dump_json(),
+            search_filter.model_dump_json(),
+            center_node_uuid,
+            tuple(bfs_origin_node_uuids) if bfs_origin_node_uuids is not None else None,
+            database,
+        )
+
+    def generation(self, group_ids: list[str] | None = None) -> Hashable:
+        """Snapshot to pass to set, which skips storing results if the groups were written since."""
+        if not group_ids:
+            return self._writes
+
+        return self._clears, tuple(
+            self._group_generations.get(group_id, 0) for group_id in sorted(set(group_ids))
+        )
+
+    def get(self, key: Hashable) -> 'SearchResults | None':
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, _, results, _ = entry
+        if expires_at < monotonic():
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return results.model_copy(deep=True)
+
+    def set(
+        self,
+        key: Hashable,
+        group_ids: list[str] | None,
+        results: 'SearchResults',
+        generation: Hashable | None = None,
+    ):
+        if generation is not None and generation != self.generation(group_ids):
+            # The searched groups changed while the search was running
+            return
+
+        groups: tuple[str | None, ...] = tuple(group_ids) if group_ids else (_ALL_GROUPS,)
+        items = (
+            len(results.edges)
+            + len(results.nodes)
+            + len(results.episodes)
+            + len(results.communities)
+        )
+        self._remove(key)
+        self._entries[key] = (monotonic() + self.ttl, groups, results.model_copy(deep=True), items)
+        self._items += items
+        for group_id in groups:
+            self._keys_by_group.setdefault(group_id, set()).add(key)
+
+        while len(self._entries) > self.max_entries or (
+            self._items > self.max_items and len(self._entries) > 1
+        ):
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+
+    def invalidate(self, group_ids: Iterable[str | None] | None = None):
+        """Drop entries for the given group_ids, or every entry if group_ids is None."""
+        self._writes += 1
+
+        if group_ids is None:
+            self._clears += 1
+            self.clear()
+            return
+
+        keys: set[Hashable] = set(self._keys_by_group.get(_ALL_GROUPS, ()))
+        for group_id in set(group_ids):
+            self._group_generations[group_id] = self._group_generations.get(group_id, 0) + 1
+            keys.update(self._keys_by_group.get(group_id, ()))
+
+        for key in keys:
+            self._remove(key)
+
+    def clear(self):
+        self._entries.clear()
+        self._keys_by_group.clear()
+        self._items = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: Hashable):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        self._items -= entry[3]
+        for group_id in entry[1]:
+            keys = self._keys_by_group.get(group_id)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_group[group_id]
+
+
+def invalidate_search_cache(driver: 'GraphDriver', group_ids: Iterable[str | None] | None = None):
+    """Invalidate the driver's search cache, if any, for the group_ids touched by a write."""
+    search_cache = driver.search_cache
+    if search_cache is not None:
+        search_cache.invalidate(group_ids)
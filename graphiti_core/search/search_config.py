@@ -23,6 +23,7 @@ from graphiti_core.nodes import CommunityNode, EntityNode, EpisodicNode
 from graphiti_core.search.search_utils import (
     DEFAULT_MIN_SCORE,
     DEFAULT_MMR_LAMBDA,
+    DEFAULT_RRF_K,
     MAX_SEARCH_DEPTH,
     USE_HNSW,
 )
@@ -53,6 +54,9 @@ class CommunitySearchMethod(Enum):
 
 class EdgeReranker(Enum):
     rrf = 'reciprocal_rank_fusion'
+    comb_sum = 'comb_sum'
+    comb_mnz = 'comb_mnz'
+    linear = 'linear_combination'
     node_distance = 'node_distance'
     episode_mentions = 'episode_mentions'
     mmr = 'mmr'
@@ -61,6 +65,9 @@ class EdgeReranker(Enum):
 
 class NodeReranker(Enum):
     rrf = 'reciprocal_rank_fusion'
+    comb_sum = 'comb_sum'
+    comb_mnz = 'comb_mnz'
+    linear = 'linear_combination'
     node_distance = 'node_distance'
     episode_mentions = 'episode_mentions'
     mmr = 'mmr'
@@ -84,6 +91,17 @@ class EdgeSearchConfig(BaseModel):
     sim_min_score: float = Field(default=DEFAULT_MIN_SCORE)
     mmr_lambda: float = Field(default=DEFAULT_MMR_LAMBDA)
     bfs_max_depth: int = Field(default=MAX_SEARCH_DEPTH)
+    use_local_indexes: bool = Field(default=USE_HNSW)
+    two_phase: bool = Field(
+        default=False,
+        description='fetch only ids and scores from the search methods and load full records '
+        'for the final results',
+    )
+    rrf_k: int = Field(default=DEFAULT_RRF_K, description='rank constant of reciprocal rank fusion')
+    method_weights: dict[EdgeSearchMethod, float] = Field(
+        default_factory=dict,
+        description='fusion weight of each search method, 1.0 when not set',
+    )
 
 
 class NodeSearchConfig(BaseModel):
@@ -93,6 +111,16 @@ class NodeSearchConfig(BaseModel):
     mmr_lambda: float = Field(default=DEFAULT_MMR_LAMBDA)
     bfs_max_depth: int = Field(default=MAX_SEARCH_DEPTH)
     use_local_indexes: bool = Field(default=USE_HNSW)
+    two_phase: bool = Field(
+        default=False,
+        description='fetch only ids and scores from the search methods and load full records '
+        'for the final results',
+    )
+    rrf_k: int = Field(default=DEFAULT_RRF_K, description='rank constant of reciprocal rank fusion')
+    method_weights: dict[NodeSearchMethod, float] = Field(
+        default_factory=dict,
+        description='fusion weight of each search method, 1.0 when not set',
+    )
 
 
 class EpisodeSearchConfig(BaseModel):
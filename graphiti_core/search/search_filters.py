@@ -21,6 +21,7 @@ from typing import Any
 from pydantic import BaseModel, Field
 
 from graphiti_core.driver.driver import GraphProvider
+from graphiti_core.graph_queries import query_template
 
 
 class ComparisonOperator(Enum):
@@ -58,19 +59,29 @@ def node_search_filter_query_constructor(
     filters: SearchFilters,
     provider: GraphProvider,
 ) -> tuple[list[str], dict[str, Any]]:
-    filter_queries: list[str] = []
     filter_params: dict[str, Any] = {}
 
-    if filters.node_labels is not None:
+    node_labels = tuple(filters.node_labels) if filters.node_labels is not None else None
+    if node_labels is not None and provider == GraphProvider.KUZU:
+        filter_params['labels'] = filters.node_labels
+
+    return list(_node_search_filter_queries(provider, node_labels)), filter_params
+
+
+@query_template
+def _node_search_filter_queries(
+    provider: GraphProvider, node_labels: tuple[str, ...] | None
+) -> tuple[str, ...]:
+    filter_queries: list[str] = []
+
+    if node_labels is not None:
         if provider == GraphProvider.KUZU:
             node_label_filter = 'list_has_all(n.labels, $labels)'
-            filter_params['labels'] = filters.node_labels
         else:
-            node_labels = '|'.join(filters.node_labels)
-            node_label_filter = 'n:' + node_labels
+            node_label_filter = 'n:' + '|'.join(node_labels)
         filter_queries.append(node_label_filter)
 
-    return filter_queries, filter_params
+    return tuple(filter_queries)
 
 
 def date_filter_query_constructor(
@@ -86,151 +97,94 @@ def date_filter_query_constructor(
     return query
 
 
-def edge_search_filter_query_constructor(
-    filters: SearchFilters,
+DateFilterShape = tuple[tuple[ComparisonOperator, ...], ...]
+
+EDGE_DATE_FILTER_FIELDS = ('valid_at', 'invalid_at', 'created_at', 'expired_at')
+
+
+def _date_filter_shape(date_filters: list[list[DateFilter]] | None) -> DateFilterShape | None:
+    # The filter text only depends on the comparison operators, never on the dates themselves
+    if date_filters is None:
+        return None
+    return tuple(
+        tuple(date_filter.comparison_operator for date_filter in or_list)
+        for or_list in date_filters
+    )
+
+
+def _date_filter_query(field: str, shape: DateFilterShape) -> str:
+    date_filter = '('
+    for i, or_list in enumerate(shape):
+        and_filters = [
+            date_filter_query_constructor(f'e.{field}', f'${field}_{j}', operator)
+            for j, operator in enumerate(or_list)
+        ]
+        date_filter += ' AND '.join(and_filters)
+
+        if i == len(shape) - 1:
+            date_filter += ')'
+        else:
+            date_filter += ' OR '
+
+    return date_filter
+
+
+@query_template
+def _edge_search_filter_queries(
     provider: GraphProvider,
-) -> tuple[list[str], dict[str, Any]]:
+    has_edge_types: bool,
+    node_labels: tuple[str, ...] | None,
+    date_shapes: tuple[DateFilterShape | None, ...],
+) -> tuple[str, ...]:
     filter_queries: list[str] = []
-    filter_params: dict[str, Any] = {}
 
-    if filters.edge_types is not None:
-        edge_types = filters.edge_types
+    if has_edge_types:
         filter_queries.append('e.name in $edge_types')
-        filter_params['edge_types'] = edge_types
 
-    if filters.node_labels is not None:
+    if node_labels is not None:
         if provider == GraphProvider.KUZU:
             node_label_filter = (
                 'list_has_all(n.labels, $labels) AND list_has_all(m.labels, $labels)'
             )
-            filter_params['labels'] = filters.node_labels
         else:
-            node_labels = '|'.join(filters.node_labels)
-            node_label_filter = 'n:' + node_labels + ' AND m:' + node_labels
+            labels = '|'.join(node_labels)
+            node_label_filter = 'n:' + labels + ' AND m:' + labels
         filter_queries.append(node_label_filter)
 
-    if filters.valid_at is not None:
-        valid_at_filter = '('
-        for i, or_list in enumerate(filters.valid_at):
-            for j, date_filter in enumerate(or_list):
-                if date_filter.comparison_operator not in [
-                    ComparisonOperator.is_null,
-                    ComparisonOperator.is_not_null,
-                ]:
-                    filter_params['valid_at_' + str(j)] = date_filter.date
-
-            and_filters = [
-                date_filter_query_constructor(
-                    'e.valid_at', f'$valid_at_{j}', date_filter.comparison_operator
-                )
-                for j, date_filter in enumerate(or_list)
-            ]
-            and_filter_query = ''
-            for j, and_filter in enumerate(and_filters):
-                and_filter_query += and_filter
-                if j != len(and_filters) - 1:
-                    and_filter_query += ' AND '
-
-            valid_at_filter += and_filter_query
-
-            if i == len(filters.valid_at) - 1:
-                valid_at_filter += ')'
-            else:
-                valid_at_filter += ' OR '
-
-        filter_queries.append(valid_at_filter)
-
-    if filters.invalid_at is not None:
-        invalid_at_filter = '('
-        for i, or_list in enumerate(filters.invalid_at):
-            for j, date_filter in enumerate(or_list):
-                if date_filter.comparison_operator not in [
-                    ComparisonOperator.is_null,
-                    ComparisonOperator.is_not_null,
-                ]:
-                    filter_params['invalid_at_' + str(j)] = date_filter.date
-
-            and_filters = [
-                date_filter_query_constructor(
-                    'e.invalid_at', f'$invalid_at_{j}', date_filter.comparison_operator
-                )
-                for j, date_filter in enumerate(or_list)
-            ]
-            and_filter_query = ''
-            for j, and_filter in enumerate(and_filters):
-                and_filter_query += and_filter
-                if j != len(and_filters) - 1:
-                    and_filter_query += ' AND '
-
-            invalid_at_filter += and_filter_query
-
-            if i == len(filters.invalid_at) - 1:
-                invalid_at_filter += ')'
-            else:
-                invalid_at_filter += ' OR '
-
-        filter_queries.append(invalid_at_filter)
-
-    if filters.created_at is not None:
-        created_at_filter = '('
-        for i, or_list in enumerate(filters.created_at):
-            for j, date_filter in enumerate(or_list):
-                if date_filter.comparison_operator not in [
-                    ComparisonOperator.is_null,
-                    ComparisonOperator.is_not_null,
-                ]:
-                    filter_params['created_at_' + str(j)] = date_filter.date
-
-            and_filters = [
-                date_filter_query_constructor(
-                    'e.created_at', f'$created_at_{j}', date_filter.comparison_operator
-                )
-                for j, date_filter in enumerate(or_list)
-            ]
-            and_filter_query = ''
-            for j, and_filter in enumerate(and_filters):
-                and_filter_query += and_filter
-                if j != len(and_filters) - 1:
-                    and_filter_query += ' AND '
-
-            created_at_filter += and_filter_query
-
-            if i == len(filters.created_at) - 1:
-                created_at_filter += ')'
-            else:
-                created_at_filter += ' OR '
-
-        filter_queries.append(created_at_filter)
-
-    if filters.expired_at is not None:
-        expired_at_filter = '('
-        for i, or_list in enumerate(filters.expired_at):
+    for field, shape in zip(EDGE_DATE_FILTER_FIELDS, date_shapes, strict=True):
+        if shape is not None:
+            filter_queries.append(_date_filter_query(field, shape))
+
+    return tuple(filter_queries)
+
+
+def edge_search_filter_query_constructor(
+    filters: SearchFilters,
+    provider: GraphProvider,
+) -> tuple[list[str], dict[str, Any]]:
+    filter_params: dict[str, Any] = {}
+
+    if filters.edge_types is not None:
+        filter_params['edge_types'] = filters.edge_types
+
+    node_labels = tuple(filters.node_labels) if filters.node_labels is not None else None
+    if node_labels is not None and provider == GraphProvider.KUZU:
+        filter_params['labels'] = filters.node_labels
+
+    date_shapes: list[DateFilterShape | None] = []
+    for field in EDGE_DATE_FILTER_FIELDS:
+        date_filters: list[list[DateFilter]] | None = getattr(filters, field)
+        date_shapes.append(_date_filter_shape(date_filters))
+        for or_list in date_filters or []:
             for j, date_filter in enumerate(or_list):
                 if date_filter.comparison_operator not in [
                     ComparisonOperator.is_null,
                     ComparisonOperator.is_not_null,
                 ]:
-                    filter_params['expired_at_' + str(j)] = date_filter.date
-
-            and_filters = [
-                date_filter_query_constructor(
-                    'e.expired_at', f'$expired_at_{j}', date_filter.comparison_operator
-                )
-                for j, date_filter in enumerate(or_list)
-            ]
-            and_filter_query = ''
-            for j, and_filter in enumerate(and_filters):
-                and_filter_query += and_filter
-                if j != len(and_filters) - 1:
-                    and_filter_query += ' AND '
-
-            expired_at_filter += and_filter_query
-
-            if i == len(filters.expired_at) - 1:
-                expired_at_filter += ')'
-            else:
-                expired_at_filter += ' OR '
-
-        filter_queries.append(expired_at_filter)
-
-    return filter_queries, filter_params
+                    filter_params[f'{field}_{j}'] = date_filter.date
+
+    filter_queries = _edge_search_filter_queries(
+        provider, filters.edge_types is not None, node_labels, tuple(date_shapes)
+    )
+
+    return list(filter_queries), filter_params
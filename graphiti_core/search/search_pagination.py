@@ -0,0 +1,211 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import logging
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Hashable
+from time import monotonic
+from uuid import uuid4
+
+from pydantic import BaseModel, Field
+
+from graphiti_core.graphiti_types import GraphitiClients
+from graphiti_core.search.search import search
+from graphiti_core.search.search_cache import SearchCache
+from graphiti_core.search.search_config import SearchConfig, SearchResults
+from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.utils.rate_limiter import Priority, request_priority
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEARCH_SESSION_TTL = 300.0
+DEFAULT_MAX_SEARCH_SESSIONS = 256
+DEFAULT_MAX_PAGINATED_RESULTS = 100
+
+
+class SearchPage(BaseModel):
+    results: SearchResults = Field(default_factory=SearchResults)
+    offset: int = Field(default=0, description='position of the first result of this page')
+    cursor: str | None = Field(default=None, description='cursor of the next page, if any')
+
+
+class SearchSessionCache:
+    """
+    Short-lived store of fully ranked search results, so that later pages of a paginated search
+    are sliced from memory instead of rerunning every query and the fusion.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_SEARCH_SESSION_TTL,
+        max_sessions: int = DEFAULT_MAX_SEARCH_SESSIONS,
+    ):
+        if max_sessions < 1:
+            raise ValueError(f'max_sessions must be at least 1, got: {max_sessions}')
+
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self._sessions: OrderedDict[str, tuple[float, Hashable, SearchResults]] = OrderedDict()
+
+    def get(self, session_id: str, request_key: Hashable) -> SearchResults | None:
+        session = self._sessions.get(session_id)
+        if session is None:
+            return None
+
+        expires_at, key, results = session
+        if expires_at < monotonic() or key != request_key:
+            # Expired, or the cursor was issued for a different search
+            del self._sessions[session_id]
+            return None
+
+        self._sessions.move_to_end(session_id)
+        return results
+
+    def create(self, request_key: Hashable, results: SearchResults) -> str:
+        session_id = uuid4().hex
+        self._sessions[session_id] = (monotonic() + self.ttl, request_key, results)
+
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+
+        return session_id
+
+    def clear(self):
+        self._sessions.clear()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+def _parse_cursor(cursor: str) -> tuple[str, int]:
+    session_id, _, offset = cursor.partition(':')
+    if not session_id or not offset.isdigit():
+        raise ValueError(f'Invalid search cursor: {cursor}')
+
+    return session_id, int(offset)
+
+
+def _slice_results(results: SearchResults, offset: int, page_size: int) -> SearchResults:
+    end = offset + page_size
+    return SearchResults(
+        edges=results.edges[offset:end],
+        edge_reranker_scores=results.edge_reranker_scores[offset:end],
+        nodes=results.nodes[offset:end],
+        node_reranker_scores=results.node_reranker_scores[offset:end],
+        episodes=results.episodes[offset:end],
+        episode_reranker_scores=results.episode_reranker_scores[offset:end],
+        communities=results.communities[offset:end],
+        community_reranker_scores=results.community_reranker_scores[offset:end],
+    )
+
+
+def _result_count(results: SearchResults) -> int:
+    return max(
+        len(results.edges), len(results.nodes), len(results.episodes), len(results.communities)
+    )
+
+
+async def search_page(
+    clients: GraphitiClients,
+    session_cache: SearchSessionCache,
+    query: str,
+    group_ids: list[str] | None,
+    config: SearchConfig,
+    search_filter: SearchFilters,
+    center_node_uuid: str | None = None,
+    bfs_origin_node_uuids: list[str] | None = None,
+    page_size: int | None = None,
+    max_results: int = DEFAULT_MAX_PAGINATED_RESULTS,
+    cursor: str | None = None,
+) -> SearchPage:
+    """
+    Return one page of search results in score order.
+
+    The first call ranks up to max_results results per scope and keeps them in the session cache;
+    pass the returned cursor, together with the same search arguments, to get the next page. If
+    the session has expired the ranking is recomputed and the page is sliced at the same offset.
+    """
+    page_size = page_size if page_size is not None else config.limit
+    if page_size < 1:
+        raise ValueError(f'page_size must be at least 1, got: {page_size}')
+
+    request_key = (
+        SearchCache.make_key(
+            query, group_ids, config, search_filter, center_node_uuid, bfs_origin_node_uuids
+        ),
+        max_results,
+    )
+
+    session_id, offset = _parse_cursor(cursor) if cursor is not None else (None, 0)
+    results = session_cache.get(session_id, request_key) if session_id is not None else None
+    if results is None:
+        if session_id is not None:
+            logger.debug(f'search session {session_id} expired, recomputing results')
+
+        results = await search(
+            clients,
+            query,
+            group_ids,
+            config.model_copy(update={'limit': max_results}),
+            search_filter,
+            center_node_uuid,
+            bfs_origin_node_uuids,
+        )
+        session_id = session_cache.create(request_key, results)
+
+    next_offset = offset + page_size
+    return SearchPage(
+        results=_slice_results(results, offset, page_size),
+        offset=offset,
+        cursor=f'{session_id}:{next_offset}' if next_offset < _result_count(results) else None,
+    )
+
+
+async def search_pages(
+    clients: GraphitiClients,
+    session_cache: SearchSessionCache,
+    query: str,
+    group_ids: list[str] | None,
+    config: SearchConfig,
+    search_filter: SearchFilters,
+    center_node_uuid: str | None = None,
+    bfs_origin_node_uuids: list[str] | None = None,
+    page_size: int | None = None,
+    max_results: int = DEFAULT_MAX_PAGINATED_RESULTS,
+    cursor: str | None = None,
+) -> AsyncIterator[SearchPage]:
+    """Iterate over the pages of a search, starting at cursor, in score order."""
+    while True:
+        # The priority is set per page, it must not stay set in the caller's context across yields
+        with request_priority(Priority.search):
+            page = await search_page(
+                clients,
+                session_cache,
+                query,
+                group_ids,
+                config,
+                search_filter,
+                center_node_uuid,
+                bfs_origin_node_uuids,
+                page_size,
+                max_results,
+                cursor,
+            )
+        yield page
+
+        if page.cursor is None:
+            return
+        cursor = page.cursor
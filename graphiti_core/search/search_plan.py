@@ -0,0 +1,214 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+from graphiti_core.errors import SearchRerankerError
+from graphiti_core.search.search_config import (
+    CommunityReranker,
+    CommunitySearchMethod,
+    EdgeReranker,
+    EdgeSearchMethod,
+    EpisodeSearchMethod,
+    NodeReranker,
+    NodeSearchMethod,
+    SearchConfig,
+)
+
+
+class SearchScope(Enum):
+    edge = 'edge'
+    node = 'node'
+    episode = 'episode'
+    community = 'community'
+
+
+class SearchStep(BaseModel):
+    scope: SearchScope
+    method: str = Field(description='search method value, e.g. bm25 or cosine_similarity')
+    stage: int = Field(
+        default=0,
+        description='0 for independent queries, 1 for BFS seeded by the results of stage 0',
+    )
+    seed_scopes: list[SearchScope] = Field(
+        default_factory=list,
+        description='scopes whose stage 0 results seed a stage 1 BFS, in order of preference',
+    )
+
+
+class SearchPlan(BaseModel):
+    """
+    Execution plan for a SearchConfig.
+
+    Lists only the queries that the configuration needs. Independent queries of every scope run
+    concurrently in stage 0; BFS steps without explicit origins run in stage 1, seeded by the
+    stage 0 results. The query is only embedded when a cosine search or MMR reranker needs it.
+    """
+
+    steps: list[SearchStep] = Field(default_factory=list)
+    embed_query: bool = False
+    rerankers: dict[SearchScope, str] = Field(default_factory=dict)
+
+    def scopes(self) -> list[SearchScope]:
+        return list(self.rerankers)
+
+    def stage(self, stage: int) -> list[SearchStep]:
+        return [step for step in self.steps if step.stage == stage]
+
+    def methods(self, scope: SearchScope) -> list[str]:
+        """Search methods of a scope, in the order in which their results are returned."""
+        steps = sorted(self.steps, key=lambda step: step.stage)
+        return [step.method for step in steps if step.scope == scope]
+
+    def describe(self) -> str:
+        lines = [f'embed query: {self.embed_query}']
+        for scope, reranker in self.rerankers.items():
+            steps = [
+                step.method
+                if step.stage == 0
+                else f'{step.method} (stage 1, seeded by {", ".join(s.value for s in step.seed_scopes)})'
+                for step in self.steps
+                if step.scope == scope
+            ]
+            lines.append(f'{scope.value}: [{", ".join(steps)}] -> {reranker}')
+
+        return '\n'.join(lines)
+
+
+def _bfs_step(
+    scope: SearchScope,
+    other_scope: SearchScope,
+    has_own_candidates: bool,
+    bfs_origin_node_uuids: list[str] | None,
+) -> SearchStep:
+    if bfs_origin_node_uuids is not None:
+        return SearchStep(scope=scope, method=EdgeSearchMethod.bfs.value)
+
+    # Without explicit origins BFS starts from the scope's own candidates, or borrows the
+    # candidates of the other scope when it has none
+    seed_scopes = [scope, other_scope] if has_own_candidates else [other_scope]
+    return SearchStep(
+        scope=scope, method=EdgeSearchMethod.bfs.value, stage=1, seed_scopes=seed_scopes
+    )
+
+
+def build_search_plan(
+    config: SearchConfig,
+    bfs_origin_node_uuids: list[str] | None = None,
+    center_node_uuid: str | None = None,
+) -> SearchPlan:
+    plan = SearchPlan()
+
+    edge_config = config.edge_config
+    if edge_config is not None:
+        if edge_config.reranker == EdgeReranker.node_distance and center_node_uuid is None:
+            raise SearchRerankerError('No center node provided for Node Distance reranker')
+
+        methods = set(edge_config.search_methods)
+        if EdgeSearchMethod.bm25 in methods:
+            plan.steps.append(
+                SearchStep(scope=SearchScope.edge, method=EdgeSearchMethod.bm25.value)
+            )
+        if EdgeSearchMethod.cosine_similarity in methods:
+            plan.steps.append(
+                SearchStep(scope=SearchScope.edge, method=EdgeSearchMethod.cosine_similarity.value)
+            )
+        if EdgeSearchMethod.bfs in methods:
+            plan.steps.append(
+                _bfs_step(
+                    SearchScope.edge,
+                    SearchScope.node,
+                    len(methods) > 1,
+                    bfs_origin_node_uuids,
+                )
+            )
+
+        plan.embed_query |= (
+            EdgeSearchMethod.cosine_similarity in methods
+            or edge_config.reranker == EdgeReranker.mmr
+        )
+        plan.rerankers[SearchScope.edge] = edge_config.reranker.value
+
+    node_config = config.node_config
+    if node_config is not None:
+        if node_config.reranker == NodeReranker.node_distance and center_node_uuid is None:
+            raise SearchRerankerError('No center node provided for Node Distance reranker')
+
+        methods = set(node_config.search_methods)
+        if NodeSearchMethod.bm25 in methods:
+            plan.steps.append(
+                SearchStep(scope=SearchScope.node, method=NodeSearchMethod.bm25.value)
+            )
+        if NodeSearchMethod.cosine_similarity in methods:
+            plan.steps.append(
+                SearchStep(scope=SearchScope.node, method=NodeSearchMethod.cosine_similarity.value)
+            )
+        if NodeSearchMethod.bfs in methods:
+            plan.steps.append(
+                _bfs_step(
+                    SearchScope.node,
+                    SearchScope.edge,
+                    len(methods) > 1,
+                    bfs_origin_node_uuids,
+                )
+            )
+
+        plan.embed_query |= (
+            NodeSearchMethod.cosine_similarity in methods
+            or node_config.reranker == NodeReranker.mmr
+        )
+        plan.rerankers[SearchScope.node] = node_config.reranker.value
+
+    episode_config = config.episode_config
+    if episode_config is not None:
+        if EpisodeSearchMethod.bm25 in episode_config.search_methods:
+            plan.steps.append(
+                SearchStep(scope=SearchScope.episode, method=EpisodeSearchMethod.bm25.value)
+            )
+        plan.rerankers[SearchScope.episode] = episode_config.reranker.value
+
+    community_config = config.community_config
+    if community_config is not None:
+        methods = set(community_config.search_methods)
+        if CommunitySearchMethod.bm25 in methods:
+            plan.steps.append(
+                SearchStep(scope=SearchScope.community, method=CommunitySearchMethod.bm25.value)
+            )
+        if CommunitySearchMethod.cosine_similarity in methods:
+            plan.steps.append(
+                SearchStep(
+                    scope=SearchScope.community,
+                    method=CommunitySearchMethod.cosine_similarity.value,
+                )
+            )
+
+        plan.embed_query |= (
+            CommunitySearchMethod.cosine_similarity in methods
+            or community_config.reranker == CommunityReranker.mmr
+        )
+        plan.rerankers[SearchScope.community] = community_config.reranker.value
+
+    # Drop BFS steps that no stage 0 query can seed
+    seeded_scopes = {step.scope for step in plan.stage(0)}
+    plan.steps = [
+        step
+        for step in plan.steps
+        if step.stage == 0 or any(scope in seeded_scopes for scope in step.seed_scopes)
+    ]
+
+    return plan
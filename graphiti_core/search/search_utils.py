@@ -14,11 +14,15 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import heapq
 import logging
 import os
+import string
 from collections import defaultdict
+from collections.abc import Sequence
+from functools import lru_cache
 from time import time
-from typing import Any
+from typing import Any, NamedTuple
 
 import numpy as np
 from numpy._typing import NDArray
@@ -30,10 +34,11 @@ from graphiti_core.graph_queries import (
     get_nodes_query,
     get_relationships_query,
     get_vector_cosine_func_query,
+    get_vector_index_query,
+    query_template,
 )
 from graphiti_core.helpers import (
     lucene_sanitize,
-    normalize_l2,
     semaphore_gather,
 )
 from graphiti_core.models.edges.edge_db_queries import get_entity_edge_return_query
@@ -62,8 +67,124 @@ USE_HNSW = os.getenv('USE_HNSW', '').lower() in ('true', '1', 'yes')
 RELEVANT_SCHEMA_LIMIT = 10
 DEFAULT_MIN_SCORE = 0.6
 DEFAULT_MMR_LAMBDA = 0.5
+DEFAULT_RRF_K = 1
 MAX_SEARCH_DEPTH = 3
 MAX_QUERY_LENGTH = 128
+# Lucene's default English stop words. The fulltext indexes keep stop words, so they only add
+# noise to the BM25 scores of a query
+FULLTEXT_STOPWORDS = frozenset(
+    {
+        'a',
+        'an',
+        'and',
+        'are',
+        'as',
+        'at',
+        'be',
+        'but',
+        'by',
+        'for',
+        'if',
+        'in',
+        'into',
+        'is',
+        'it',
+        'no',
+        'not',
+        'of',
+        'on',
+        'or',
+        'such',
+        'that',
+        'the',
+        'their',
+        'then',
+        'there',
+        'these',
+        'they',
+        'this',
+        'to',
+        'was',
+        'will',
+        'with',
+    }
+)
+# Native vector indexes are queried before filters are applied, so fetch extra neighbours
+VECTOR_INDEX_OVERSAMPLING = 10
+
+
+# Candidates carry only what the rerankers need; the *_candidates search functions return them
+# so that full records are loaded only for the final results. Neptune searches still fetch full
+# records and the candidates are read from them.
+class SearchCandidate(NamedTuple):
+    """A node found by a search method, before its full record is loaded."""
+
+    uuid: str
+    score: float | None = None
+    embedding: NDArray[np.float32] | None = None
+
+
+class EdgeSearchCandidate(NamedTuple):
+    """An edge found by a search method, before its full record is loaded."""
+
+    uuid: str
+    source_node_uuid: str
+    target_node_uuid: str
+    score: float | None = None
+    embedding: NDArray[np.float32] | None = None
+
+
+def _edge_return_query(
+    provider: GraphProvider, ids_only: bool, scored: bool = True, with_embeddings: bool = False
+) -> str:
+    embedding_query = ', e.fact_embedding AS fact_embedding' if with_embeddings else ''
+    if not ids_only:
+        return get_entity_edge_return_query(provider) + embedding_query
+
+    return (
+        """
+        e.uuid AS uuid,
+        n.uuid AS source_node_uuid,
+        m.uuid AS target_node_uuid
+        """
+        + (', score AS score' if scored else '')
+        + embedding_query
+    )
+
+
+def _node_return_query(
+    provider: GraphProvider, ids_only: bool, scored: bool = True, with_embeddings: bool = False
+) -> str:
+    embedding_query = ', n.name_embedding AS name_embedding' if with_embeddings else ''
+    if not ids_only:
+        return get_entity_node_return_query(provider) + embedding_query
+
+    return 'n.uuid AS uuid' + (', score AS score' if scored else '') + embedding_query
+
+
+def to_float32_embedding(embedding: Any) -> NDArray[np.float32] | None:
+    if embedding is None:
+        return None
+
+    return np.asarray(embedding, dtype=np.float32)
+
+
+def get_search_candidate_from_record(record: Any) -> SearchCandidate:
+    return SearchCandidate(
+        uuid=record['uuid'],
+        score=record.get('score'),
+        embedding=to_float32_embedding(record.get('name_embedding')),
+    )
+
+
+def get_edge_search_candidate_from_record(record: Any) -> EdgeSearchCandidate:
+    return EdgeSearchCandidate(
+        uuid=record['uuid'],
+        source_node_uuid=record['source_node_uuid'],
+        target_node_uuid=record['target_node_uuid'],
+        score=record.get('score'),
+        embedding=to_float32_embedding(record.get('fact_embedding')),
+    )
 
 
 def calculate_cosine_similarity(vector1: list[float], vector2: list[float]) -> float:
@@ -80,31 +201,45 @@ def calculate_cosine_similarity(vector1: list[float], vector2: list[float]) -> f
     return dot_product / (norm_vector1 * norm_vector2)
 
 
+@lru_cache(maxsize=4096)
+def _fulltext_terms(query: str) -> tuple[str, ...]:
+    """Split a query into sanitized Lucene terms, without stop words and punctuation-only tokens."""
+    tokens = [token for token in query.split() if any(char.isalnum() for char in token)]
+    terms = [
+        token
+        for token in tokens
+        if token.strip(string.punctuation).lower() not in FULLTEXT_STOPWORDS
+    ]
+
+    # Keep queries made only of stop words, e.g. "to be or not to be", searchable
+    return tuple(lucene_sanitize(term) for term in terms or tokens)
+
+
+@lru_cache(maxsize=1024)
+def _fulltext_group_filter(group_ids: tuple[str, ...], fulltext_syntax: str) -> str:
+    if not group_ids:
+        return ''
+
+    return ' OR '.join(f'{fulltext_syntax}group_id:"{g}"' for g in group_ids) + ' AND '
+
+
 def fulltext_query(query: str, group_ids: list[str] | None, driver: GraphDriver):
     if driver.provider == GraphProvider.KUZU:
         # Kuzu only supports simple queries.
-        if len(query.split(' ')) > MAX_QUERY_LENGTH:
-            return ''
-        return query
-    group_ids_filter_list = (
-        [driver.fulltext_syntax + f'group_id:"{g}"' for g in group_ids]
-        if group_ids is not None
-        else []
-    )
-    group_ids_filter = ''
-    for f in group_ids_filter_list:
-        group_ids_filter += f if not group_ids_filter else f' OR {f}'
-
-    group_ids_filter += ' AND ' if group_ids_filter else ''
+        return ' '.join(query.split()[:MAX_QUERY_LENGTH])
 
-    lucene_query = lucene_sanitize(query)
-    # If the lucene query is too long return no query
-    if len(lucene_query.split(' ')) + len(group_ids or '') >= MAX_QUERY_LENGTH:
+    # Every group_id is a clause of the query too; long queries keep their first terms
+    group_ids = group_ids or []
+    terms = _fulltext_terms(query)[: max(MAX_QUERY_LENGTH - len(group_ids) - 1, 0)]
+    if not terms:
         return ''
 
-    full_query = group_ids_filter + '(' + lucene_query + ')'
-
-    return full_query
+    return (
+        _fulltext_group_filter(tuple(group_ids), driver.fulltext_syntax)
+        + '('
+        + ' '.join(terms)
+        + ')'
+    )
 
 
 async def get_episodes_by_mentions(
@@ -164,29 +299,50 @@ async def get_communities_by_nodes(
     return communities
 
 
-async def edge_fulltext_search(
+@query_template
+def _edge_fulltext_search_query(
+    provider: GraphProvider, filter_query: str, ids_only: bool = False
+) -> str:
+    match_query = """
+    YIELD relationship AS rel, score
+    MATCH (n:Entity)-[e:RELATES_TO {uuid: rel.uuid}]->(m:Entity)
+    """
+    if provider == GraphProvider.KUZU:
+        match_query = """
+        YIELD node, score
+        MATCH (n:Entity)-[:RELATES_TO]->(e:RelatesToNode_ {uuid: node.uuid})-[:RELATES_TO]->(m:Entity)
+        """
+
+    return (
+        get_relationships_query('edge_name_and_fact', limit=0, provider=provider)
+        + match_query
+        + filter_query
+        + """
+        WITH e, score, n, m
+        RETURN
+        """
+        + _edge_return_query(provider, ids_only)
+        + """
+        ORDER BY score DESC
+        LIMIT $limit
+        """
+    )
+
+
+async def _edge_fulltext_search_records(
     driver: GraphDriver,
     query: str,
     search_filter: SearchFilters,
     group_ids: list[str] | None = None,
     limit=RELEVANT_SCHEMA_LIMIT,
-) -> list[EntityEdge]:
+    ids_only: bool = False,
+) -> list[Any]:
     # fulltext search over facts
     fuzzy_query = fulltext_query(query, group_ids, driver)
 
     if fuzzy_query == '':
         return []
 
-    match_query = """
-    YIELD relationship AS rel, score
-    MATCH (n:Entity)-[e:RELATES_TO {uuid: rel.uuid}]->(m:Entity)
-    """
-    if driver.provider == GraphProvider.KUZU:
-        match_query = """
-        YIELD node, score
-        MATCH (n:Entity)-[:RELATES_TO]->(e:RelatesToNode_ {uuid: node.uuid})-[:RELATES_TO]->(m:Entity)
-        """
-
     filter_queries, filter_params = edge_search_filter_query_constructor(
         search_filter, driver.provider
     )
@@ -247,20 +403,7 @@ async def edge_fulltext_search(
         else:
             return []
     else:
-        query = (
-            get_relationships_query('edge_name_and_fact', limit=limit, provider=driver.provider)
-            + match_query
-            + filter_query
-            + """
-            WITH e, score, n, m
-            RETURN
-            """
-            + get_entity_edge_return_query(driver.provider)
-            + """
-            ORDER BY score DESC
-            LIMIT $limit
-            """
-        )
+        query = _edge_fulltext_search_query(driver.provider, filter_query, ids_only)
 
         records, _, _ = await driver.execute_query(
             query,
@@ -270,29 +413,191 @@ async def edge_fulltext_search(
             **filter_params,
         )
 
-    edges = [get_entity_edge_from_record(record, driver.provider) for record in records]
-
-    return edges
+    return records
 
 
-async def edge_similarity_search(
+async def edge_fulltext_search(
     driver: GraphDriver,
-    search_vector: list[float],
-    source_node_uuid: str | None,
-    target_node_uuid: str | None,
+    query: str,
     search_filter: SearchFilters,
     group_ids: list[str] | None = None,
-    limit: int = RELEVANT_SCHEMA_LIMIT,
-    min_score: float = DEFAULT_MIN_SCORE,
+    limit=RELEVANT_SCHEMA_LIMIT,
 ) -> list[EntityEdge]:
+    records = await _edge_fulltext_search_records(driver, query, search_filter, group_ids, limit)
+
+    return [get_entity_edge_from_record(record, driver.provider) for record in records]
+
+
+async def edge_fulltext_search_candidates(
+    driver: GraphDriver,
+    query: str,
+    search_filter: SearchFilters,
+    group_ids: list[str] | None = None,
+    limit=RELEVANT_SCHEMA_LIMIT,
+) -> list[EdgeSearchCandidate]:
+    records = await _edge_fulltext_search_records(
+        driver, query, search_filter, group_ids, limit, ids_only=True
+    )
+
+    return [get_edge_search_candidate_from_record(record) for record in records]
+
+
+@query_template
+def _edge_similarity_search_query(
+    provider: GraphProvider,
+    filter_query: str,
+    search_vector_var: str,
+    ids_only: bool = False,
+    with_embeddings: bool = False,
+) -> str:
     match_query = """
         MATCH (n:Entity)-[e:RELATES_TO]->(m:Entity)
     """
-    if driver.provider == GraphProvider.KUZU:
+    if provider == GraphProvider.KUZU:
         match_query = """
             MATCH (n:Entity)-[:RELATES_TO]->(e:RelatesToNode_)-[:RELATES_TO]->(m:Entity)
         """
 
+    return (
+        match_query
+        + filter_query
+        + """
+        WITH DISTINCT e, n, m, """
+        + get_vector_cosine_func_query('e.fact_embedding', search_vector_var, provider)
+        + """ AS score
+        WHERE score > $min_score
+        RETURN
+        """
+        + _edge_return_query(provider, ids_only, with_embeddings=with_embeddings)
+        + """
+        ORDER BY score DESC
+        LIMIT $limit
+        """
+    )
+
+
+@query_template
+def _vector_index_neighbours_query(provider: GraphProvider, label: str, attribute: str) -> str:
+    return (
+        get_vector_index_query(label, attribute, provider)
+        + """
+        RETURN count(*) AS neighbour_count, min(score) AS lowest_score
+        """
+    )
+
+
+async def _vector_index_exhausted(
+    driver: GraphDriver,
+    label: str,
+    attribute: str,
+    search_vector: list[float],
+    vector_k: int,
+    min_score: float,
+) -> bool:
+    """
+    Whether the vector_k nearest neighbours hold every match above min_score, i.e. the index
+    returned fewer than vector_k neighbours or its furthest neighbour already scores too low.
+    """
+    try:
+        records, _, _ = await driver.execute_query(
+            _vector_index_neighbours_query(driver.provider, label, attribute),
+            search_vector=search_vector,
+            vector_k=vector_k,
+            routing_='r',
+        )
+    except Exception as e:
+        logger.warning(f'Vector index search failed, falling back to brute force: {e}')
+        return False
+
+    neighbour_count = records[0]['neighbour_count']
+    lowest_score = records[0]['lowest_score']
+    return neighbour_count < vector_k or (lowest_score is not None and lowest_score <= min_score)
+
+
+async def _vector_index_search(
+    driver: GraphDriver,
+    label: str,
+    attribute: str,
+    query: str,
+    search_vector: list[float],
+    limit: int,
+    min_score: float,
+    filter_params: dict[str, Any],
+) -> list[dict[str, Any]] | None:
+    """
+    Run a similarity search against the native vector index of label.attribute.
+
+    Returns None if the index is unavailable (e.g. indices were never built), or if the index
+    may have cut off matches, in which case callers fall back to a brute-force cosine scan. The
+    index is queried for the nearest neighbours across all groups before the group_id and search
+    filters apply, so fewer than limit results are only final when those neighbours hold every
+    match above min_score.
+    """
+    vector_k = limit * VECTOR_INDEX_OVERSAMPLING
+    try:
+        records, _, _ = await driver.execute_query(
+            query,
+            search_vector=search_vector,
+            vector_k=vector_k,
+            limit=limit,
+            min_score=min_score,
+            routing_='r',
+            **filter_params,
+        )
+    except Exception as e:
+        logger.warning(f'Vector index search failed, falling back to brute force: {e}')
+        return None
+
+    if len(records) < limit and not await _vector_index_exhausted(
+        driver, label, attribute, search_vector, vector_k, min_score
+    ):
+        logger.debug(
+            f'Vector index search returned {len(records)} of {limit} results after filtering, '
+            'falling back to brute force'
+        )
+        return None
+
+    return records
+
+
+@query_template
+def _edge_vector_index_search_query(
+    provider: GraphProvider,
+    filter_query: str,
+    ids_only: bool = False,
+    with_embeddings: bool = False,
+) -> str:
+    return (
+        get_vector_index_query('RELATES_TO', 'fact_embedding', provider)
+        + """
+        WHERE score > $min_score
+        WITH relationship AS e, startNode(relationship) AS n, endNode(relationship) AS m, score
+        """
+        + filter_query
+        + """
+        RETURN
+        """
+        + _edge_return_query(provider, ids_only, with_embeddings=with_embeddings)
+        + """
+        ORDER BY score DESC
+        LIMIT $limit
+        """
+    )
+
+
+async def _edge_similarity_search_records(
+    driver: GraphDriver,
+    search_vector: list[float],
+    source_node_uuid: str | None,
+    target_node_uuid: str | None,
+    search_filter: SearchFilters,
+    group_ids: list[str] | None = None,
+    limit: int = RELEVANT_SCHEMA_LIMIT,
+    min_score: float = DEFAULT_MIN_SCORE,
+    use_local_indexes: bool = False,
+    ids_only: bool = False,
+    with_embeddings: bool = False,
+) -> list[Any]:
     filter_queries, filter_params = edge_search_filter_query_constructor(
         search_filter, driver.provider
     )
@@ -380,62 +685,100 @@ async def edge_similarity_search(
         else:
             return []
     else:
-        query = (
-            match_query
-            + filter_query
-            + """
-            WITH DISTINCT e, n, m, """
-            + get_vector_cosine_func_query('e.fact_embedding', search_vector_var, driver.provider)
-            + """ AS score
-            WHERE score > $min_score
-            RETURN
-            """
-            + get_entity_edge_return_query(driver.provider)
-            + """
-            ORDER BY score DESC
-            LIMIT $limit
-            """
-        )
+        records = None
+        if driver.provider == GraphProvider.FALKORDB and use_local_indexes:
+            records = await _vector_index_search(
+                driver,
+                'RELATES_TO',
+                'fact_embedding',
+                _edge_vector_index_search_query(
+                    driver.provider, filter_query, ids_only, with_embeddings
+                ),
+                search_vector,
+                limit,
+                min_score,
+                filter_params,
+            )
 
-        records, _, _ = await driver.execute_query(
-            query,
-            search_vector=search_vector,
-            limit=limit,
-            min_score=min_score,
-            routing_='r',
-            **filter_params,
-        )
+        if records is None:
+            query = _edge_similarity_search_query(
+                driver.provider, filter_query, search_vector_var, ids_only, with_embeddings
+            )
 
-    edges = [get_entity_edge_from_record(record, driver.provider) for record in records]
+            records, _, _ = await driver.execute_query(
+                query,
+                search_vector=search_vector,
+                limit=limit,
+                min_score=min_score,
+                routing_='r',
+                **filter_params,
+            )
 
-    return edges
+    return records
 
 
-async def edge_bfs_search(
+async def edge_similarity_search(
     driver: GraphDriver,
-    bfs_origin_node_uuids: list[str] | None,
-    bfs_max_depth: int,
+    search_vector: list[float],
+    source_node_uuid: str | None,
+    target_node_uuid: str | None,
     search_filter: SearchFilters,
     group_ids: list[str] | None = None,
     limit: int = RELEVANT_SCHEMA_LIMIT,
+    min_score: float = DEFAULT_MIN_SCORE,
+    use_local_indexes: bool = False,
+    with_embeddings: bool = False,
 ) -> list[EntityEdge]:
-    # vector similarity search over embedded facts
-    if bfs_origin_node_uuids is None or len(bfs_origin_node_uuids) == 0:
-        return []
+    records = await _edge_similarity_search_records(
+        driver,
+        search_vector,
+        source_node_uuid,
+        target_node_uuid,
+        search_filter,
+        group_ids,
+        limit,
+        min_score,
+        use_local_indexes,
+        with_embeddings=with_embeddings,
+    )
 
-    filter_queries, filter_params = edge_search_filter_query_constructor(
-        search_filter, driver.provider
+    return [get_entity_edge_from_record(record, driver.provider) for record in records]
+
+
+async def edge_similarity_search_candidates(
+    driver: GraphDriver,
+    search_vector: list[float],
+    source_node_uuid: str | None,
+    target_node_uuid: str | None,
+    search_filter: SearchFilters,
+    group_ids: list[str] | None = None,
+    limit: int = RELEVANT_SCHEMA_LIMIT,
+    min_score: float = DEFAULT_MIN_SCORE,
+    use_local_indexes: bool = False,
+    with_embeddings: bool = False,
+) -> list[EdgeSearchCandidate]:
+    records = await _edge_similarity_search_records(
+        driver,
+        search_vector,
+        source_node_uuid,
+        target_node_uuid,
+        search_filter,
+        group_ids,
+        limit,
+        min_score,
+        use_local_indexes,
+        ids_only=True,
+        with_embeddings=with_embeddings,
     )
 
-    if group_ids is not None:
-        filter_queries.append('e.group_id IN $group_ids')
-        filter_params['group_ids'] = group_ids
+    return [get_edge_search_candidate_from_record(record) for record in records]
 
-    filter_query = ''
-    if filter_queries:
-        filter_query = ' WHERE ' + (' AND '.join(filter_queries))
 
-    if driver.provider == GraphProvider.KUZU:
+@query_template
+def _edge_bfs_search_queries(
+    provider: GraphProvider, filter_query: str, bfs_max_depth: int, ids_only: bool = False
+) -> tuple[str, ...]:
+    if provider == GraphProvider.KUZU:
         # Kuzu stores entity edges twice with an intermediate node, so we need to match them
         # separately for the correct BFS depth.
         depth = bfs_max_depth * 2 - 1
@@ -456,92 +799,165 @@ async def edge_bfs_search(
                 MATCH (n:Entity)-[:RELATES_TO]->(e:RelatesToNode_ {{uuid: relNode.uuid}})-[:RELATES_TO]->(m:Entity)
             """)
 
-        records = []
-        for match_query in match_queries:
-            sub_records, _, _ = await driver.execute_query(
-                match_query
-                + filter_query
-                + """
-                RETURN DISTINCT
-                """
-                + get_entity_edge_return_query(driver.provider)
-                + """
-                LIMIT $limit
-                """,
-                bfs_origin_node_uuids=bfs_origin_node_uuids,
-                limit=limit,
-                routing_='r',
-                **filter_params,
-            )
-            records.extend(sub_records)
-    else:
-        if driver.provider == GraphProvider.NEPTUNE:
-            query = (
-                f"""
-                UNWIND $bfs_origin_node_uuids AS origin_uuid
-                MATCH path = (origin {{uuid: origin_uuid}})-[:RELATES_TO|MENTIONS *1..{bfs_max_depth}]->(n:Entity)
-                WHERE origin:Entity OR origin:Episodic
-                UNWIND relationships(path) AS rel
-                MATCH (n:Entity)-[e:RELATES_TO {{uuid: rel.uuid}}]-(m:Entity)
-                """
-                + filter_query
-                + """
-                RETURN DISTINCT
-                    e.uuid AS uuid,
-                    e.group_id AS group_id,
-                    startNode(e).uuid AS source_node_uuid,
-                    endNode(e).uuid AS target_node_uuid,
-                    e.created_at AS created_at,
-                    e.name AS name,
-                    e.fact AS fact,
-                    split(e.episodes, ',') AS episodes,
-                    e.expired_at AS expired_at,
-                    e.valid_at AS valid_at,
-                    e.invalid_at AS invalid_at,
-                    properties(e) AS attributes
-                LIMIT $limit
-                """
-            )
-        else:
-            query = (
-                f"""
-                UNWIND $bfs_origin_node_uuids AS origin_uuid
-                MATCH path = (origin {{uuid: origin_uuid}})-[:RELATES_TO|MENTIONS*1..{bfs_max_depth}]->(:Entity)
-                UNWIND relationships(path) AS rel
-                MATCH (n:Entity)-[e:RELATES_TO {{uuid: rel.uuid}}]-(m:Entity)
-                """
-                + filter_query
-                + """
-                RETURN DISTINCT
-                """
-                + get_entity_edge_return_query(driver.provider)
-                + """
-                LIMIT $limit
-                """
-            )
+        return tuple(
+            match_query
+            + filter_query
+            + """
+            RETURN DISTINCT
+            """
+            + _edge_return_query(provider, ids_only, scored=False)
+            + """
+            LIMIT $limit
+            """
+            for match_query in match_queries
+        )
 
-        records, _, _ = await driver.execute_query(
+    if provider == GraphProvider.NEPTUNE:
+        return (
+            f"""
+            UNWIND $bfs_origin_node_uuids AS origin_uuid
+            MATCH path = (origin {{uuid: origin_uuid}})-[:RELATES_TO|MENTIONS *1..{bfs_max_depth}]->(n:Entity)
+            WHERE origin:Entity OR origin:Episodic
+            UNWIND relationships(path) AS rel
+            MATCH (n:Entity)-[e:RELATES_TO {{uuid: rel.uuid}}]-(m:Entity)
+            """
+            + filter_query
+            + """
+            RETURN DISTINCT
+                e.uuid AS uuid,
+                e.group_id AS group_id,
+                startNode(e).uuid AS source_node_uuid,
+                endNode(e).uuid AS target_node_uuid,
+                e.created_at AS created_at,
+                e.name AS name,
+                e.fact AS fact,
+                split(e.episodes, ',') AS episodes,
+                e.expired_at AS expired_at,
+                e.valid_at AS valid_at,
+                e.invalid_at AS invalid_at,
+                properties(e) AS attributes
+            LIMIT $limit
+            """,
+        )
+
+    return (
+        f"""
+        UNWIND $bfs_origin_node_uuids AS origin_uuid
+        MATCH path = (origin {{uuid: origin_uuid}})-[:RELATES_TO|MENTIONS*1..{bfs_max_depth}]->(:Entity)
+        UNWIND relationships(path) AS rel
+        MATCH (n:Entity)-[e:RELATES_TO {{uuid: rel.uuid}}]-(m:Entity)
+        """
+        + filter_query
+        + """
+        RETURN DISTINCT
+        """
+        + _edge_return_query(provider, ids_only, scored=False)
+        + """
+        LIMIT $limit
+        """,
+    )
+
+
+async def _edge_bfs_search_records(
+    driver: GraphDriver,
+    bfs_origin_node_uuids: list[str] | None,
+    bfs_max_depth: int,
+    search_filter: SearchFilters,
+    group_ids: list[str] | None = None,
+    limit: int = RELEVANT_SCHEMA_LIMIT,
+    ids_only: bool = False,
+) -> list[Any]:
+    # vector similarity search over embedded facts
+    if bfs_origin_node_uuids is None or len(bfs_origin_node_uuids) == 0:
+        return []
+
+    filter_queries, filter_params = edge_search_filter_query_constructor(
+        search_filter, driver.provider
+    )
+
+    if group_ids is not None:
+        filter_queries.append('e.group_id IN $group_ids')
+        filter_params['group_ids'] = group_ids
+
+    filter_query = ''
+    if filter_queries:
+        filter_query = ' WHERE ' + (' AND '.join(filter_queries))
+
+    records = []
+    for query in _edge_bfs_search_queries(driver.provider, filter_query, bfs_max_depth, ids_only):
+        sub_records, _, _ = await driver.execute_query(
             query,
             bfs_origin_node_uuids=bfs_origin_node_uuids,
-            depth=bfs_max_depth,
             limit=limit,
             routing_='r',
             **filter_params,
         )
+        records.extend(sub_records)
+
+    return records
+
+
+async def edge_bfs_search(
+    driver: GraphDriver,
+    bfs_origin_node_uuids: list[str] | None,
+    bfs_max_depth: int,
+    search_filter: SearchFilters,
+    group_ids: list[str] | None = None,
+    limit: int = RELEVANT_SCHEMA_LIMIT,
+) -> list[EntityEdge]:
+    records = await _edge_bfs_search_records(
+        driver, bfs_origin_node_uuids, bfs_max_depth, search_filter, group_ids, limit
+    )
 
-    edges = [get_entity_edge_from_record(record, driver.provider) for record in records]
+    return [get_entity_edge_from_record(record, driver.provider) for record in records]
 
-    return edges
 
+async def edge_bfs_search_candidates(
+    driver: GraphDriver,
+    bfs_origin_node_uuids: list[str] | None,
+    bfs_max_depth: int,
+    search_filter: SearchFilters,
+    group_ids: list[str] | None = None,
+    limit: int = RELEVANT_SCHEMA_LIMIT,
+) -> list[EdgeSearchCandidate]:
+    records = await _edge_bfs_search_records(
+        driver, bfs_origin_node_uuids, bfs_max_depth, search_filter, group_ids, limit, ids_only=True
+    )
 
-async def node_fulltext_search(
+    return [get_edge_search_candidate_from_record(record) for record in records]
+
+
+@query_template
+def _node_fulltext_search_query(
+    provider: GraphProvider, filter_query: str, index_name: str, ids_only: bool = False
+) -> str:
+    yield_query = 'YIELD node AS n, score'
+    if provider == GraphProvider.KUZU:
+        yield_query = 'WITH node AS n, score'
+
+    return (
+        get_nodes_query(index_name, '$query', limit=0, provider=provider)
+        + yield_query
+        + filter_query
+        + """
+        WITH n, score
+        ORDER BY score DESC
+        LIMIT $limit
+        RETURN
+        """
+        + _node_return_query(provider, ids_only)
+    )
+
+
+async def _node_fulltext_search_records(
     driver: GraphDriver,
     query: str,
     search_filter: SearchFilters,
     group_ids: list[str] | None = None,
     limit=RELEVANT_SCHEMA_LIMIT,
     use_local_indexes: bool = False,
-) -> list[EntityNode]:
+    ids_only: bool = False,
+) -> list[Any]:
     # BM25 search to get top nodes
     fuzzy_query = fulltext_query(query, group_ids, driver)
     if fuzzy_query == '':
@@ -559,10 +975,6 @@ async def node_fulltext_search(
     if filter_queries:
         filter_query = ' WHERE ' + (' AND '.join(filter_queries))
 
-    yield_query = 'YIELD node AS n, score'
-    if driver.provider == GraphProvider.KUZU:
-        yield_query = 'WITH node AS n, score'
-
     if driver.provider == GraphProvider.NEPTUNE:
         res = driver.run_aoss_query('node_name_and_summary', query, limit=limit)  # pyright: ignore reportAttributeAccessIssue
         if res['hits']['total']['value'] > 0:
@@ -596,24 +1008,14 @@ async def node_fulltext_search(
         else:
             return []
     else:
+        # Per-group fulltext indexes only exist on Neo4j (see build_dynamic_indexes)
         index_name = (
             'node_name_and_summary'
-            if not use_local_indexes
+            if not use_local_indexes or driver.provider != GraphProvider.NEO4J
             else 'node_name_and_summary_'
             + (group_ids[0].replace('-', '') if group_ids is not None else '')
         )
-        query = (
-            get_nodes_query(index_name, '$query', limit=limit, provider=driver.provider)
-            + yield_query
-            + filter_query
-            + """
-            WITH n, score
-            ORDER BY score DESC
-            LIMIT $limit
-            RETURN
-            """
-            + get_entity_node_return_query(driver.provider)
-        )
+        query = _node_fulltext_search_query(driver.provider, filter_query, index_name, ids_only)
 
         records, _, _ = await driver.execute_query(
             query,
@@ -623,12 +1025,118 @@ async def node_fulltext_search(
             **filter_params,
         )
 
-    nodes = [get_entity_node_from_record(record, driver.provider) for record in records]
+    return records
 
-    return nodes
 
+async def node_fulltext_search(
+    driver: GraphDriver,
+    query: str,
+    search_filter: SearchFilters,
+    group_ids: list[str] | None = None,
+    limit=RELEVANT_SCHEMA_LIMIT,
+    use_local_indexes: bool = False,
+) -> list[EntityNode]:
+    records = await _node_fulltext_search_records(
+        driver, query, search_filter, group_ids, limit, use_local_indexes
+    )
+
+    return [get_entity_node_from_record(record, driver.provider) for record in records]
 
-async def node_similarity_search(
+
+async def node_fulltext_search_candidates(
+    driver: GraphDriver,
+    query: str,
+    search_filter: SearchFilters,
+    group_ids: list[str] | None = None,
+    limit=RELEVANT_SCHEMA_LIMIT,
+    use_local_indexes: bool = False,
+) -> list[SearchCandidate]:
+    records = await _node_fulltext_search_records(
+        driver, query, search_filter, group_ids, limit, use_local_indexes, ids_only=True
+    )
+
+    return [get_search_candidate_from_record(record) for record in records]
+
+
+@query_template
+def _node_vector_index_search_query(
+    provider: GraphProvider,
+    filter_query: str,
+    index_name: str,
+    ids_only: bool = False,
+    with_embeddings: bool = False,
+) -> str:
+    return (
+        f"""
+        CALL db.index.vector.queryNodes('{index_name}', $limit, $search_vector) YIELD node AS n, score
+        """
+        + filter_query
+        + """
+        AND score > $min_score
+        RETURN
+        """
+        + _node_return_query(provider, ids_only, with_embeddings=with_embeddings)
+        + """
+        ORDER BY score DESC
+        LIMIT $limit
+        """
+    )
+
+
+@query_template
+def _node_similarity_search_query(
+    provider: GraphProvider,
+    filter_query: str,
+    search_vector_var: str,
+    ids_only: bool = False,
+    with_embeddings: bool = False,
+) -> str:
+    return (
+        """
+        MATCH (n:Entity)
+        """
+        + filter_query
+        + """
+        WITH n, """
+        + get_vector_cosine_func_query('n.name_embedding', search_vector_var, provider)
+        + """ AS score
+        WHERE score > $min_score
+        RETURN
+        """
+        + _node_return_query(provider, ids_only, with_embeddings=with_embeddings)
+        + """
+        ORDER BY score DESC
+        LIMIT $limit
+        """
+    )
+
+
+@query_template
+def _node_native_vector_index_search_query(
+    provider: GraphProvider,
+    filter_query: str,
+    ids_only: bool = False,
+    with_embeddings: bool = False,
+) -> str:
+    return (
+        get_vector_index_query('Entity', 'name_embedding', provider)
+        + """
+        WHERE score > $min_score
+        WITH node AS n, score
+        """
+        + filter_query
+        + """
+        RETURN
+        """
+        + _node_return_query(provider, ids_only, with_embeddings=with_embeddings)
+        + """
+        ORDER BY score DESC
+        LIMIT $limit
+        """
+    )
+
+
+async def _node_similarity_search_records(
     driver: GraphDriver,
     search_vector: list[float],
     search_filter: SearchFilters,
@@ -636,7 +1144,9 @@ async def node_similarity_search(
     limit=RELEVANT_SCHEMA_LIMIT,
     min_score: float = DEFAULT_MIN_SCORE,
     use_local_indexes: bool = False,
-) -> list[EntityNode]:
+    ids_only: bool = False,
+    with_embeddings: bool = False,
+) -> list[Any]:
     filter_queries, filter_params = node_search_filter_query_constructor(
         search_filter, driver.provider
     )
@@ -712,20 +1222,8 @@ async def node_similarity_search(
         index_name = 'group_entity_vector_' + (
             group_ids[0].replace('-', '') if group_ids is not None else ''
         )
-        query = (
-            f"""
-                    CALL db.index.vector.queryNodes('{index_name}', {limit}, $search_vector) YIELD node AS n, score
-                    """
-            + filter_query
-            + """
-                    AND score > $min_score
-                    RETURN
-                    """
-            + get_entity_node_return_query(driver.provider)
-            + """
-                    ORDER BY score DESC
-                    LIMIT $limit
-                    """
+        query = _node_vector_index_search_query(
+            driver.provider, filter_query, index_name, ids_only, with_embeddings
         )
 
         records, _, _ = await driver.execute_query(
@@ -738,48 +1236,500 @@ async def node_similarity_search(
         )
 
     else:
-        query = (
-            """
-                MATCH (n:Entity)
-                """
-            + filter_query
-            + """
-            WITH n, """
-            + get_vector_cosine_func_query('n.name_embedding', search_vector_var, driver.provider)
-            + """ AS score
-            WHERE score > $min_score
-            RETURN
+        records = None
+        if driver.provider == GraphProvider.FALKORDB and use_local_indexes:
+            records = await _vector_index_search(
+                driver,
+                'Entity',
+                'name_embedding',
+                _node_native_vector_index_search_query(
+                    driver.provider, filter_query, ids_only, with_embeddings
+                ),
+                search_vector,
+                limit,
+                min_score,
+                filter_params,
+            )
+
+        if records is None:
+            query = _node_similarity_search_query(
+                driver.provider, filter_query, search_vector_var, ids_only, with_embeddings
+            )
+
+            records, _, _ = await driver.execute_query(
+                query,
+                search_vector=search_vector,
+                limit=limit,
+                min_score=min_score,
+                routing_='r',
+                **filter_params,
+            )
+
+    return records
+
+
+async def node_similarity_search(
+    driver: GraphDriver,
+    search_vector: list[float],
+    search_filter: SearchFilters,
+    group_ids: list[str] | None = None,
+    limit=RELEVANT_SCHEMA_LIMIT,
+    min_score: float = DEFAULT_MIN_SCORE,
+    use_local_indexes: bool = False,
+    with_embeddings: bool = False,
+) -> list[EntityNode]:
+    records = await _node_similarity_search_records(
+        driver,
+        search_vector,
+        search_filter,
+        group_ids,
+        limit,
+        min_score,
+        use_local_indexes,
+        with_embeddings=with_embeddings,
+    )
+
+    return [get_entity_node_from_record(record, driver.provider) for record in records]
+
+
+async def node_similarity_search_candidates(
+    driver: GraphDriver,
+    search_vector: list[float],
+    search_filter: SearchFilters,
+    group_ids: list[str] | None = None,
+    limit=RELEVANT_SCHEMA_LIMIT,
+    min_score: float = DEFAULT_MIN_SCORE,
+    use_local_indexes: bool = False,
+    with_embeddings: bool = False,
+) -> list[SearchCandidate]:
+    records = await _node_similarity_search_records(
+        driver,
+        search_vector,
+        search_filter,
+        group_ids,
+        limit,
+        min_score,
+        use_local_indexes,
+        ids_only=True,
+        with_embeddings=with_embeddings,
+    )
+
+    return [get_search_candidate_from_record(record) for record in records]
+
+
+@query_template
+def _node_bfs_search_queries(
+    provider: GraphProvider, filter_query: str, bfs_max_depth: int, ids_only: bool = False
+) -> tuple[str, ...]:
+    match_queries = [
+        f"""
+        UNWIND $bfs_origin_node_uuids AS origin_uuid
+        MATCH (origin {{uuid: origin_uuid}})-[:RELATES_TO|MENTIONS*1..{bfs_max_depth}]->(n:Entity)
+        WHERE n.group_id = origin.group_id
+        """
+    ]
+
+    if provider == GraphProvider.NEPTUNE:
+        match_queries = [
+            f"""
+            UNWIND $bfs_origin_node_uuids AS origin_uuid
+            MATCH (origin {{uuid: origin_uuid}})-[e:RELATES_TO|MENTIONS*1..{bfs_max_depth}]->(n:Entity)
+            WHERE origin:Entity OR origin.Episode
+            AND n.group_id = origin.group_id
             """
-            + get_entity_node_return_query(driver.provider)
-            + """
-            ORDER BY score DESC
-            LIMIT $limit
+        ]
+
+    if provider == GraphProvider.KUZU:
+        depth = bfs_max_depth * 2
+        match_queries = [
             """
-        )
+            UNWIND $bfs_origin_node_uuids AS origin_uuid
+            MATCH (origin:Episodic {uuid: origin_uuid})-[:MENTIONS]->(n:Entity)
+            WHERE n.group_id = origin.group_id
+            """,
+            f"""
+            UNWIND $bfs_origin_node_uuids AS origin_uuid
+            MATCH (origin:Entity {{uuid: origin_uuid}})-[:RELATES_TO*2..{depth}]->(n:Entity)
+            WHERE n.group_id = origin.group_id
+            """,
+        ]
+        if bfs_max_depth > 1:
+            depth = (bfs_max_depth - 1) * 2
+            match_queries.append(f"""
+                UNWIND $bfs_origin_node_uuids AS origin_uuid
+                MATCH (origin:Episodic {{uuid: origin_uuid}})-[:MENTIONS]->(:Entity)-[:RELATES_TO*2..{depth}]->(n:Entity)
+                WHERE n.group_id = origin.group_id
+            """)
 
-        records, _, _ = await driver.execute_query(
+    return tuple(
+        match_query
+        + filter_query
+        + """
+        RETURN
+        """
+        + _node_return_query(provider, ids_only, scored=False)
+        + """
+        LIMIT $limit
+        """
+        for match_query in match_queries
+    )
+
+
+async def _node_bfs_search_records(
+    driver: GraphDriver,
+    bfs_origin_node_uuids: list[str] | None,
+    search_filter: SearchFilters,
+    bfs_max_depth: int,
+    group_ids: list[str] | None = None,
+    limit: int = RELEVANT_SCHEMA_LIMIT,
+    ids_only: bool = False,
+) -> list[Any]:
+    if bfs_origin_node_uuids is None or len(bfs_origin_node_uuids) == 0 or bfs_max_depth < 1:
+        return []
+
+    filter_queries, filter_params = node_search_filter_query_constructor(
+        search_filter, driver.provider
+    )
+
+    if group_ids is not None:
+        filter_queries.append('n.group_id IN $group_ids')
+        filter_queries.append('origin.group_id IN $group_ids')
+        filter_params['group_ids'] = group_ids
+
+    filter_query = ''
+    if filter_queries:
+        filter_query = ' AND ' + (' AND '.join(filter_queries))
+
+    records = []
+    for query in _node_bfs_search_queries(driver.provider, filter_query, bfs_max_depth, ids_only):
+        sub_records, _, _ = await driver.execute_query(
             query,
-            search_vector=search_vector,
+            bfs_origin_node_uuids=bfs_origin_node_uuids,
             limit=limit,
-            min_score=min_score,
             routing_='r',
             **filter_params,
         )
+        records.extend(sub_records)
 
-    nodes = [get_entity_node_from_record(record, driver.provider) for record in records]
+    return records
 
-    return nodes
+
+async def node_bfs_search(
+    driver: GraphDriver,
+    bfs_origin_node_uuids: list[str] | None,
+    search_filter: SearchFilters,
+    bfs_max_depth: int,
+    group_ids: list[str] | None = None,
+    limit: int = RELEVANT_SCHEMA_LIMIT,
+) -> list[EntityNode]:
+    records = await _node_bfs_search_records(
+        driver, bfs_origin_node_uuids, search_filter, bfs_max_depth, group_ids, limit
+    )
+
+    return [get_entity_node_from_record(record, driver.provider) for record in records]
+
+
+async def node_bfs_search_candidates(
+    driver: GraphDriver,
+    bfs_origin_node_uuids: list[str] | None,
+    search_filter: SearchFilters,
+    bfs_max_depth: int,
+    group_ids: list[str] | None = None,
+    limit: int = RELEVANT_SCHEMA_LIMIT,
+) -> list[SearchCandidate]:
+    records = await _node_bfs_search_records(
+        driver, bfs_origin_node_uuids, search_filter, bfs_max_depth, group_ids, limit, ids_only=True
+    )
+
+    return [get_search_candidate_from_record(record) for record in records]
+
+
+# Batched searches run one search method for many queries in a single UNWIND query and return
+# the candidates of each query in query order. The similarity searches scan the graph once and
+# score every candidate against all query vectors, like the single query searches do without
+# use_local_indexes; search_batch runs cosine steps that use a vector index per query instead.
+# They are available on Neo4j and FalkorDB.
+BATCH_SEARCH_PROVIDERS = (GraphProvider.NEO4J, GraphProvider.FALKORDB)
+
+
+def _edge_candidate_map(with_embeddings: bool = False) -> str:
+    return (
+        '{uuid: e.uuid, source_node_uuid: n.uuid, target_node_uuid: m.uuid, score: score'
+        + (', fact_embedding: e.fact_embedding' if with_embeddings else '')
+        + '}'
+    )
+
+
+def _node_candidate_map(with_embeddings: bool = False) -> str:
+    return (
+        '{uuid: n.uuid, score: score'
+        + (', name_embedding: n.name_embedding' if with_embeddings else '')
+        + '}'
+    )
+
+
+def _batched_records(records: list[Any], query_count: int) -> list[list[Any]]:
+    results: list[list[Any]] = [[] for _ in range(query_count)]
+    for record in records:
+        results[record['query_index']] = record['matches']
+
+    return results
+
+
+def _check_batch_search_provider(driver: GraphDriver):
+    if driver.provider not in BATCH_SEARCH_PROVIDERS:
+        raise ValueError(f'Batched search is not supported for {driver.provider.value}')
+
+
+@query_template
+def _edge_fulltext_search_batch_query(provider: GraphProvider, filter_query: str) -> str:
+    return (
+        """
+        UNWIND $queries AS search_query
+        """
+        + get_relationships_query(
+            'edge_name_and_fact', limit=0, provider=provider, query='search_query.query'
+        )
+        + """
+        YIELD relationship AS rel, score
+        MATCH (n:Entity)-[e:RELATES_TO {uuid: rel.uuid}]->(m:Entity)
+        """
+        + filter_query
+        + """
+        WITH search_query, e, n, m, score
+        ORDER BY score DESC
+        WITH search_query, collect("""
+        + _edge_candidate_map()
+        + """)[..$limit] AS matches
+        RETURN search_query.index AS query_index, matches
+        """
+    )
+
+
+async def edge_fulltext_search_batch_candidates(
+    driver: GraphDriver,
+    queries: list[str],
+    search_filter: SearchFilters,
+    group_ids: list[str] | None = None,
+    limit=RELEVANT_SCHEMA_LIMIT,
+) -> list[list[EdgeSearchCandidate]]:
+    _check_batch_search_provider(driver)
+
+    search_queries = [
+        {'index': i, 'query': fulltext_query(query, group_ids, driver)}
+        for i, query in enumerate(queries)
+    ]
+    search_queries = [search_query for search_query in search_queries if search_query['query']]
+    if not search_queries:
+        return [[] for _ in queries]
+
+    filter_queries, filter_params = edge_search_filter_query_constructor(
+        search_filter, driver.provider
+    )
+
+    if group_ids is not None:
+        filter_queries.append('e.group_id IN $group_ids')
+        filter_params['group_ids'] = group_ids
+
+    filter_query = ''
+    if filter_queries:
+        filter_query = ' WHERE ' + (' AND '.join(filter_queries))
+
+    records, _, _ = await driver.execute_query(
+        _edge_fulltext_search_batch_query(driver.provider, filter_query),
+        queries=search_queries,
+        limit=limit,
+        routing_='r',
+        **filter_params,
+    )
+
+    return [
+        [get_edge_search_candidate_from_record(record) for record in result]
+        for result in _batched_records(records, len(queries))
+    ]
+
+
+@query_template
+def _edge_similarity_search_batch_query(
+    provider: GraphProvider, filter_query: str, with_embeddings: bool = False
+) -> str:
+    return (
+        """
+        MATCH (n:Entity)-[e:RELATES_TO]->(m:Entity)
+        """
+        + filter_query
+        + """
+        WITH DISTINCT e, n, m
+        UNWIND $search_vectors AS search_vector
+        WITH search_vector, e, n, m, """
+        + get_vector_cosine_func_query('e.fact_embedding', 'search_vector.vector', provider)
+        + """ AS score
+        WHERE score > $min_score
+        WITH search_vector, e, n, m, score
+        ORDER BY score DESC
+        WITH search_vector, collect("""
+        + _edge_candidate_map(with_embeddings)
+        + """)[..$limit] AS matches
+        RETURN search_vector.index AS query_index, matches
+        """
+    )
+
+
+async def edge_similarity_search_batch_candidates(
+    driver: GraphDriver,
+    search_vectors: list[list[float]],
+    search_filter: SearchFilters,
+    group_ids: list[str] | None = None,
+    limit: int = RELEVANT_SCHEMA_LIMIT,
+    min_score: float = DEFAULT_MIN_SCORE,
+    with_embeddings: bool = False,
+) -> list[list[EdgeSearchCandidate]]:
+    _check_batch_search_provider(driver)
+    if not search_vectors:
+        return []
+
+    filter_queries, filter_params = edge_search_filter_query_constructor(
+        search_filter, driver.provider
+    )
+
+    if group_ids is not None:
+        filter_queries.append('e.group_id IN $group_ids')
+        filter_params['group_ids'] = group_ids
+
+    filter_query = ''
+    if filter_queries:
+        filter_query = ' WHERE ' + (' AND '.join(filter_queries))
+
+    records, _, _ = await driver.execute_query(
+        _edge_similarity_search_batch_query(driver.provider, filter_query, with_embeddings),
+        search_vectors=[
+            {'index': i, 'vector': search_vector} for i, search_vector in enumerate(search_vectors)
+        ],
+        limit=limit,
+        min_score=min_score,
+        routing_='r',
+        **filter_params,
+    )
+
+    return [
+        [get_edge_search_candidate_from_record(record) for record in result]
+        for result in _batched_records(records, len(search_vectors))
+    ]
+
+
+@query_template
+def _node_fulltext_search_batch_query(
+    provider: GraphProvider, filter_query: str, index_name: str
+) -> str:
+    return (
+        """
+        UNWIND $queries AS search_query
+        """
+        + get_nodes_query(index_name, 'search_query.query', limit=0, provider=provider)
+        + """
+        YIELD node AS n, score
+        """
+        + filter_query
+        + """
+        WITH search_query, n, score
+        ORDER BY score DESC
+        WITH search_query, collect("""
+        + _node_candidate_map()
+        + """)[..$limit] AS matches
+        RETURN search_query.index AS query_index, matches
+        """
+    )
+
+
+async def node_fulltext_search_batch_candidates(
+    driver: GraphDriver,
+    queries: list[str],
+    search_filter: SearchFilters,
+    group_ids: list[str] | None = None,
+    limit=RELEVANT_SCHEMA_LIMIT,
+    use_local_indexes: bool = False,
+) -> list[list[SearchCandidate]]:
+    _check_batch_search_provider(driver)
+
+    search_queries = [
+        {'index': i, 'query': fulltext_query(query, group_ids, driver)}
+        for i, query in enumerate(queries)
+    ]
+    search_queries = [search_query for search_query in search_queries if search_query['query']]
+    if not search_queries:
+        return [[] for _ in queries]
+
+    filter_queries, filter_params = node_search_filter_query_constructor(
+        search_filter, driver.provider
+    )
+
+    if group_ids is not None:
+        filter_queries.append('n.group_id IN $group_ids')
+        filter_params['group_ids'] = group_ids
+
+    filter_query = ''
+    if filter_queries:
+        filter_query = ' WHERE ' + (' AND '.join(filter_queries))
+
+    # Per-group fulltext indexes only exist on Neo4j (see build_dynamic_indexes)
+    index_name = (
+        'node_name_and_summary'
+        if not use_local_indexes or driver.provider != GraphProvider.NEO4J
+        else 'node_name_and_summary_'
+        + (group_ids[0].replace('-', '') if group_ids is not None else '')
+    )
+
+    records, _, _ = await driver.execute_query(
+        _node_fulltext_search_batch_query(driver.provider, filter_query, index_name),
+        queries=search_queries,
+        limit=limit,
+        routing_='r',
+        **filter_params,
+    )
+
+    return [
+        [get_search_candidate_from_record(record) for record in result]
+        for result in _batched_records(records, len(queries))
+    ]
+
+
+@query_template
+def _node_similarity_search_batch_query(
+    provider: GraphProvider, filter_query: str, with_embeddings: bool = False
+) -> str:
+    return (
+        """
+        MATCH (n:Entity)
+        """
+        + filter_query
+        + """
+        WITH n
+        UNWIND $search_vectors AS search_vector
+        WITH search_vector, n, """
+        + get_vector_cosine_func_query('n.name_embedding', 'search_vector.vector', provider)
+        + """ AS score
+        WHERE score > $min_score
+        WITH search_vector, n, score
+        ORDER BY score DESC
+        WITH search_vector, collect("""
+        + _node_candidate_map(with_embeddings)
+        + """)[..$limit] AS matches
+        RETURN search_vector.index AS query_index, matches
+        """
+    )
 
 
-async def node_bfs_search(
+async def node_similarity_search_batch_candidates(
     driver: GraphDriver,
-    bfs_origin_node_uuids: list[str] | None,
+    search_vectors: list[list[float]],
     search_filter: SearchFilters,
-    bfs_max_depth: int,
     group_ids: list[str] | None = None,
-    limit: int = RELEVANT_SCHEMA_LIMIT,
-) -> list[EntityNode]:
-    if bfs_origin_node_uuids is None or len(bfs_origin_node_uuids) == 0 or bfs_max_depth < 1:
+    limit=RELEVANT_SCHEMA_LIMIT,
+    min_score: float = DEFAULT_MIN_SCORE,
+    with_embeddings: bool = False,
+) -> list[list[SearchCandidate]]:
+    _check_batch_search_provider(driver)
+    if not search_vectors:
         return []
 
     filter_queries, filter_params = node_search_filter_query_constructor(
@@ -788,75 +1738,50 @@ async def node_bfs_search(
 
     if group_ids is not None:
         filter_queries.append('n.group_id IN $group_ids')
-        filter_queries.append('origin.group_id IN $group_ids')
         filter_params['group_ids'] = group_ids
 
     filter_query = ''
     if filter_queries:
-        filter_query = ' AND ' + (' AND '.join(filter_queries))
-
-    match_queries = [
-        f"""
-        UNWIND $bfs_origin_node_uuids AS origin_uuid
-        MATCH (origin {{uuid: origin_uuid}})-[:RELATES_TO|MENTIONS*1..{bfs_max_depth}]->(n:Entity)
-        WHERE n.group_id = origin.group_id
-        """
-    ]
-
-    if driver.provider == GraphProvider.NEPTUNE:
-        match_queries = [
-            f"""
-            UNWIND $bfs_origin_node_uuids AS origin_uuid
-            MATCH (origin {{uuid: origin_uuid}})-[e:RELATES_TO|MENTIONS*1..{bfs_max_depth}]->(n:Entity)
-            WHERE origin:Entity OR origin.Episode
-            AND n.group_id = origin.group_id
-            """
-        ]
+        filter_query = ' WHERE ' + (' AND '.join(filter_queries))
 
-    if driver.provider == GraphProvider.KUZU:
-        depth = bfs_max_depth * 2
-        match_queries = [
-            """
-            UNWIND $bfs_origin_node_uuids AS origin_uuid
-            MATCH (origin:Episodic {uuid: origin_uuid})-[:MENTIONS]->(n:Entity)
-            WHERE n.group_id = origin.group_id
-            """,
-            f"""
-            UNWIND $bfs_origin_node_uuids AS origin_uuid
-            MATCH (origin:Entity {{uuid: origin_uuid}})-[:RELATES_TO*2..{depth}]->(n:Entity)
-            WHERE n.group_id = origin.group_id
-            """,
-        ]
-        if bfs_max_depth > 1:
-            depth = (bfs_max_depth - 1) * 2
-            match_queries.append(f"""
-                UNWIND $bfs_origin_node_uuids AS origin_uuid
-                MATCH (origin:Episodic {{uuid: origin_uuid}})-[:MENTIONS]->(:Entity)-[:RELATES_TO*2..{depth}]->(n:Entity)
-                WHERE n.group_id = origin.group_id
-            """)
+    records, _, _ = await driver.execute_query(
+        _node_similarity_search_batch_query(driver.provider, filter_query, with_embeddings),
+        search_vectors=[
+            {'index': i, 'vector': search_vector} for i, search_vector in enumerate(search_vectors)
+        ],
+        limit=limit,
+        min_score=min_score,
+        routing_='r',
+        **filter_params,
+    )
 
-    records = []
-    for match_query in match_queries:
-        sub_records, _, _ = await driver.execute_query(
-            match_query
-            + filter_query
-            + """
-            RETURN
-            """
-            + get_entity_node_return_query(driver.provider)
-            + """
-            LIMIT $limit
-            """,
-            bfs_origin_node_uuids=bfs_origin_node_uuids,
-            limit=limit,
-            routing_='r',
-            **filter_params,
-        )
-        records.extend(sub_records)
+    return [
+        [get_search_candidate_from_record(record) for record in result]
+        for result in _batched_records(records, len(search_vectors))
+    ]
 
-    nodes = [get_entity_node_from_record(record, driver.provider) for record in records]
 
-    return nodes
+@query_template
+def _episode_fulltext_search_query(
+    provider: GraphProvider, group_filter_query: str, index_name: str
+) -> str:
+    return (
+        get_nodes_query(index_name, '$query', limit=0, provider=provider)
+        + """
+        YIELD node AS episode, score
+        MATCH (e:Episodic)
+        WHERE e.uuid = episode.uuid
+        """
+        + group_filter_query
+        + """
+        RETURN
+        """
+        + EPISODIC_NODE_RETURN
+        + """
+        ORDER BY score DESC
+        LIMIT $limit
+        """
+    )
 
 
 async def episode_fulltext_search(
@@ -915,29 +1840,14 @@ async def episode_fulltext_search(
         else:
             return []
     else:
+        # Per-group fulltext indexes only exist on Neo4j (see build_dynamic_indexes)
         index_name = (
             'episode_content'
-            if not use_local_indexes
+            if not use_local_indexes or driver.provider != GraphProvider.NEO4J
             else 'episode_content_'
             + (group_ids[0].replace('-', '') if group_ids is not None else '')
         )
-        query = (
-            get_nodes_query(index_name, '$query', limit=limit, provider=driver.provider)
-            + """
-            YIELD node AS episode, score
-            MATCH (e:Episodic)
-            WHERE e.uuid = episode.uuid
-            """
-            + group_filter_query
-            + """
-            RETURN
-            """
-            + EPISODIC_NODE_RETURN
-            + """
-            ORDER BY score DESC
-            LIMIT $limit
-            """
-        )
+        query = _episode_fulltext_search_query(driver.provider, group_filter_query, index_name)
 
         records, _, _ = await driver.execute_query(
             query, query=fuzzy_query, limit=limit, routing_='r', **filter_params
@@ -948,6 +1858,30 @@ async def episode_fulltext_search(
     return episodes
 
 
+@query_template
+def _community_fulltext_search_query(provider: GraphProvider, group_filter_query: str) -> str:
+    yield_query = 'YIELD node AS c, score'
+    if provider == GraphProvider.KUZU:
+        yield_query = 'WITH node AS c, score'
+
+    return (
+        get_nodes_query('community_name', '$query', limit=0, provider=provider)
+        + yield_query
+        + """
+        WITH c, score
+        """
+        + group_filter_query
+        + """
+        RETURN
+        """
+        + COMMUNITY_NODE_RETURN
+        + """
+        ORDER BY score DESC
+        LIMIT $limit
+        """
+    )
+
+
 async def community_fulltext_search(
     driver: GraphDriver,
     query: str,
@@ -965,10 +1899,6 @@ async def community_fulltext_search(
         group_filter_query = 'WHERE c.group_id IN $group_ids'
         filter_params['group_ids'] = group_ids
 
-    yield_query = 'YIELD node AS c, score'
-    if driver.provider == GraphProvider.KUZU:
-        yield_query = 'WITH node AS c, score'
-
     if driver.provider == GraphProvider.NEPTUNE:
         res = driver.run_aoss_query('community_name', query, limit=limit)  # pyright: ignore reportAttributeAccessIssue
         if res['hits']['total']['value'] > 0:
@@ -1003,22 +1933,7 @@ async def community_fulltext_search(
         else:
             return []
     else:
-        query = (
-            get_nodes_query('community_name', '$query', limit=limit, provider=driver.provider)
-            + yield_query
-            + """
-            WITH c, score
-            """
-            + group_filter_query
-            + """
-            RETURN
-            """
-            + COMMUNITY_NODE_RETURN
-            + """
-            ORDER BY score DESC
-            LIMIT $limit
-            """
-        )
+        query = _community_fulltext_search_query(driver.provider, group_filter_query)
 
         records, _, _ = await driver.execute_query(
             query, query=fuzzy_query, limit=limit, routing_='r', **filter_params
@@ -1029,12 +1944,58 @@ async def community_fulltext_search(
     return communities
 
 
+@query_template
+def _community_similarity_search_query(
+    provider: GraphProvider, group_filter_query: str, search_vector_var: str
+) -> str:
+    return (
+        """
+        MATCH (c:Community)
+        """
+        + group_filter_query
+        + """
+        WITH c,
+        """
+        + get_vector_cosine_func_query('c.name_embedding', search_vector_var, provider)
+        + """ AS score
+        WHERE score > $min_score
+        RETURN
+        """
+        + COMMUNITY_NODE_RETURN
+        + """
+        ORDER BY score DESC
+        LIMIT $limit
+        """
+    )
+
+
+@query_template
+def _community_vector_index_search_query(provider: GraphProvider, group_filter_query: str) -> str:
+    return (
+        get_vector_index_query('Community', 'name_embedding', provider)
+        + """
+        WHERE score > $min_score
+        WITH node AS c, score
+        """
+        + group_filter_query
+        + """
+        RETURN
+        """
+        + COMMUNITY_NODE_RETURN
+        + """
+        ORDER BY score DESC
+        LIMIT $limit
+        """
+    )
+
+
 async def community_similarity_search(
     driver: GraphDriver,
     search_vector: list[float],
     group_ids: list[str] | None = None,
     limit=RELEVANT_SCHEMA_LIMIT,
     min_score=DEFAULT_MIN_SCORE,
+    use_local_indexes: bool = False,
 ) -> list[CommunityNode]:
     # vector similarity search over entity names
     query_params: dict[str, Any] = {}
@@ -1101,38 +2062,36 @@ async def community_similarity_search(
         else:
             return []
     else:
-        search_vector_var = '$search_vector'
-        if driver.provider == GraphProvider.KUZU:
-            search_vector_var = f'CAST($search_vector AS FLOAT[{len(search_vector)}])'
+        records = None
+        if driver.provider == GraphProvider.FALKORDB and use_local_indexes:
+            records = await _vector_index_search(
+                driver,
+                'Community',
+                'name_embedding',
+                _community_vector_index_search_query(driver.provider, group_filter_query),
+                search_vector,
+                limit,
+                min_score,
+                query_params,
+            )
 
-        query = (
-            """
-                MATCH (c:Community)
-                """
-            + group_filter_query
-            + """
-            WITH c,
-            """
-            + get_vector_cosine_func_query('c.name_embedding', search_vector_var, driver.provider)
-            + """ AS score
-            WHERE score > $min_score
-            RETURN
-            """
-            + COMMUNITY_NODE_RETURN
-            + """
-            ORDER BY score DESC
-            LIMIT $limit
-            """
-        )
+        if records is None:
+            search_vector_var = '$search_vector'
+            if driver.provider == GraphProvider.KUZU:
+                search_vector_var = f'CAST($search_vector AS FLOAT[{len(search_vector)}])'
 
-        records, _, _ = await driver.execute_query(
-            query,
-            search_vector=search_vector,
-            limit=limit,
-            min_score=min_score,
-            routing_='r',
-            **query_params,
-        )
+            query = _community_similarity_search_query(
+                driver.provider, group_filter_query, search_vector_var
+            )
+
+            records, _, _ = await driver.execute_query(
+                query,
+                search_vector=search_vector,
+                limit=limit,
+                min_score=min_score,
+                routing_='r',
+                **query_params,
+            )
 
     communities = [get_community_node_from_record(record) for record in records]
 
@@ -1739,142 +2698,274 @@ async def get_edge_invalidation_candidates(
     return invalidation_edges
 
 
+def _top_k(
+    scores: dict[str, float], limit: int | None, min_score: float
+) -> tuple[list[str], list[float]]:
+    scored_uuids = [term for term in scores.items() if term[1] >= min_score]
+    if limit is not None and limit < len(scored_uuids):
+        # nlargest is stable like sort, so ties keep the order in which the uuids were found
+        scored_uuids = heapq.nlargest(limit, scored_uuids, key=lambda term: term[1])
+    else:
+        scored_uuids.sort(reverse=True, key=lambda term: term[1])
+
+    return [uuid for uuid, _ in scored_uuids], [score for _, score in scored_uuids]
+
+
 # takes in a list of rankings of uuids
 def rrf(
-    results: list[list[str]], rank_const=1, min_score: float = 0
+    results: list[list[str]],
+    rank_const=DEFAULT_RRF_K,
+    min_score: float = 0,
+    weights: list[float] | None = None,
+    limit: int | None = None,
 ) -> tuple[list[str], list[float]]:
     scores: dict[str, float] = defaultdict(float)
-    for result in results:
+    for j, result in enumerate(results):
+        weight = weights[j] if weights is not None else 1.0
         for i, uuid in enumerate(result):
-            scores[uuid] += 1 / (i + rank_const)
+            scores[uuid] += weight / (i + rank_const)
 
-    scored_uuids = [term for term in scores.items()]
-    scored_uuids.sort(reverse=True, key=lambda term: term[1])
+    return _top_k(scores, limit, min_score)
 
-    sorted_uuids = [term[0] for term in scored_uuids]
 
-    return [uuid for uuid in sorted_uuids if scores[uuid] >= min_score], [
-        scores[uuid] for uuid in sorted_uuids if scores[uuid] >= min_score
-    ]
+def _normalized_scores(result: list[tuple[str, float | None]], min_max: bool) -> dict[str, float]:
+    """
+    Scale the scores of one result list to [0, 1], by min-max or by the maximum score. Lists
+    without scores, e.g. BFS results, are scored by rank instead.
+    """
+    scores: dict[str, float] = {}
+    if any(score is None for _, score in result):
+        for i, (uuid, _) in enumerate(result):
+            scores.setdefault(uuid, (len(result) - i) / len(result))
+        return scores
+
+    raw_scores = [score for _, score in result if score is not None]
+    max_score = max(raw_scores, default=0.0)
+    min_score = min(raw_scores, default=0.0) if min_max else 0.0
+    score_range = max_score - min_score
+    for uuid, score in result:
+        if score is None or uuid in scores:
+            continue
+        scores[uuid] = (score - min_score) / score_range if score_range > 0 else 1.0
+
+    return scores
+
+
+def _comb_scores(
+    results: list[list[tuple[str, float | None]]],
+    weights: list[float] | None,
+    min_max: bool,
+) -> tuple[dict[str, float], dict[str, int]]:
+    scores: dict[str, float] = defaultdict(float)
+    hits: dict[str, int] = defaultdict(int)
+    for j, result in enumerate(results):
+        weight = weights[j] if weights is not None else 1.0
+        for uuid, score in _normalized_scores(result, min_max).items():
+            scores[uuid] += weight * score
+            hits[uuid] += 1
 
+    return scores, hits
 
-async def node_distance_reranker(
-    driver: GraphDriver,
-    node_uuids: list[str],
-    center_node_uuid: str,
+
+def comb_sum(
+    results: list[list[tuple[str, float | None]]],
+    weights: list[float] | None = None,
+    min_score: float = 0,
+    limit: int | None = None,
+) -> tuple[list[str], list[float]]:
+    """CombSUM: weighted sum of the min-max normalized scores of every method."""
+    scores, _ = _comb_scores(results, weights, min_max=True)
+    return _top_k(scores, limit, min_score)
+
+
+def comb_mnz(
+    results: list[list[tuple[str, float | None]]],
+    weights: list[float] | None = None,
+    min_score: float = 0,
+    limit: int | None = None,
+) -> tuple[list[str], list[float]]:
+    """CombMNZ: CombSUM multiplied by the number of methods that found the result."""
+    scores, hits = _comb_scores(results, weights, min_max=True)
+    return _top_k({uuid: score * hits[uuid] for uuid, score in scores.items()}, limit, min_score)
+
+
+def linear_combination(
+    results: list[list[tuple[str, float | None]]],
+    weights: list[float] | None = None,
     min_score: float = 0,
+    limit: int | None = None,
 ) -> tuple[list[str], list[float]]:
-    # filter out node_uuid center node node uuid
-    filtered_uuids = list(filter(lambda node_uuid: node_uuid != center_node_uuid, node_uuids))
-    scores: dict[str, float] = {center_node_uuid: 0.0}
-
-    query = """
-    UNWIND $node_uuids AS node_uuid
-    MATCH (center:Entity {uuid: $center_uuid})-[:RELATES_TO]-(n:Entity {uuid: node_uuid})
-    RETURN 1 AS score, node_uuid AS uuid
     """
+    Convex blend of the scores of every method, each divided by the best score of its method, so
+    that the gaps between raw scores are kept. A method that missed a result contributes 0.
+    """
+    scores, _ = _comb_scores(results, weights, min_max=False)
+    total_weight = sum(weights) if weights is not None else float(len(results))
+    if total_weight > 0:
+        scores = {uuid: score / total_weight for uuid, score in scores.items()}
+
+    return _top_k(scores, limit, min_score)
+
+
+async def _get_entity_neighbors(driver: GraphDriver, node_uuids: list[str]) -> set[str]:
     if driver.provider == GraphProvider.KUZU:
         query = """
         UNWIND $node_uuids AS node_uuid
-        MATCH (center:Entity {uuid: $center_uuid})-[:RELATES_TO]->(e:RelatesToNode_)-[:RELATES_TO]->(n:Entity {uuid: node_uuid})
-        RETURN 1 AS score, node_uuid AS uuid
+        MATCH (n:Entity {uuid: node_uuid})-[:RELATES_TO]-(:RelatesToNode_)-[:RELATES_TO]-(m:Entity)
+        RETURN DISTINCT m.uuid AS uuid
+        """
+    else:
+        query = """
+        UNWIND $node_uuids AS node_uuid
+        MATCH (n:Entity {uuid: node_uuid})-[:RELATES_TO]-(m:Entity)
+        RETURN DISTINCT m.uuid AS uuid
         """
 
-    # Find the shortest path to center node
-    results, header, _ = await driver.execute_query(
-        query,
-        node_uuids=filtered_uuids,
-        center_uuid=center_node_uuid,
-        routing_='r',
-    )
-    if driver.provider == GraphProvider.FALKORDB:
-        results = [dict(zip(header, row, strict=True)) for row in results]
+    results, _, _ = await driver.execute_query(query, node_uuids=node_uuids, routing_='r')
+
+    return {result['uuid'] for result in results}
 
-    for result in results:
-        uuid = result['uuid']
-        score = result['score']
-        scores[uuid] = score
 
-    for uuid in filtered_uuids:
-        if uuid not in scores:
-            scores[uuid] = float('inf')
+async def get_hop_distances(
+    driver: GraphDriver,
+    center_node_uuids: list[str],
+    node_uuids: list[str],
+    max_depth: int = MAX_SEARCH_DEPTH,
+) -> dict[str, int]:
+    """
+    Return the number of RELATES_TO hops from the nearest center node to each of node_uuids,
+    for the nodes within max_depth hops. Runs a breadth-first search from all centers at once,
+    with one neighborhood query per hop, and stops as soon as every node has been reached.
+    """
+    distances = {uuid: 0 for uuid in center_node_uuids}
+    remaining = set(node_uuids) - set(distances)
+    frontier = list(distances)
 
-    # rerank on shortest distance
-    filtered_uuids.sort(key=lambda cur_uuid: scores[cur_uuid])
+    for depth in range(1, max_depth + 1):
+        if not remaining or not frontier:
+            break
 
-    # add back in filtered center uuid if it was filtered out
-    if center_node_uuid in node_uuids:
-        scores[center_node_uuid] = 0.1
-        filtered_uuids = [center_node_uuid] + filtered_uuids
+        neighbors = await _get_entity_neighbors(driver, frontier)
+        frontier = [uuid for uuid in neighbors if uuid not in distances]
+        for uuid in frontier:
+            distances[uuid] = depth
+        remaining.difference_update(frontier)
 
-    return [uuid for uuid in filtered_uuids if (1 / scores[uuid]) >= min_score], [
-        1 / scores[uuid] for uuid in filtered_uuids if (1 / scores[uuid]) >= min_score
-    ]
+    return {uuid: distances[uuid] for uuid in node_uuids if uuid in distances}
 
 
-async def episode_mentions_reranker(
-    driver: GraphDriver, node_uuids: list[list[str]], min_score: float = 0
+async def node_distance_reranker(
+    driver: GraphDriver,
+    node_uuids: list[str],
+    center_node_uuid: str | list[str],
+    min_score: float = 0,
+    max_depth: int = MAX_SEARCH_DEPTH,
 ) -> tuple[list[str], list[float]]:
-    # use rrf as a preliminary ranker
-    sorted_uuids, _ = rrf(node_uuids)
+    """
+    Rerank nodes by their hop distance to the nearest center node, with a score of 1 / distance.
+    Center nodes come first, nodes further than max_depth hops away last with a score of 0; ties
+    keep the order of node_uuids.
+    """
+    center_node_uuids = (
+        [center_node_uuid] if isinstance(center_node_uuid, str) else center_node_uuid
+    )
+    distances = await get_hop_distances(driver, center_node_uuids, node_uuids, max_depth)
+
     scores: dict[str, float] = {}
+    for uuid in node_uuids:
+        distance = distances.get(uuid)
+        if distance is None:
+            scores[uuid] = 0.0
+        else:
+            # Center nodes are kept ahead of their direct neighbors
+            scores[uuid] = 1 / distance if distance > 0 else 10.0
 
-    # Find the shortest path to center node
-    results, _, _ = await driver.execute_query(
-        """
-        UNWIND $node_uuids AS node_uuid
-        MATCH (episode:Episodic)-[r:MENTIONS]->(n:Entity {uuid: node_uuid})
-        RETURN count(*) AS score, n.uuid AS uuid
-        """,
-        node_uuids=sorted_uuids,
-        routing_='r',
-    )
+    reranked_uuids = sorted(dict.fromkeys(node_uuids), key=lambda uuid: -scores[uuid])
 
-    for result in results:
-        scores[result['uuid']] = result['score']
+    return [uuid for uuid in reranked_uuids if scores[uuid] >= min_score], [
+        scores[uuid] for uuid in reranked_uuids if scores[uuid] >= min_score
+    ]
 
-    for uuid in sorted_uuids:
-        if uuid not in scores:
-            scores[uuid] = float('inf')
 
-    # rerank on shortest distance
-    sorted_uuids.sort(key=lambda cur_uuid: scores[cur_uuid])
+async def get_mention_counts(driver: GraphDriver, node_uuids: list[str]) -> dict[str, int]:
+    """
+    Return the number of episodes that mention each node. The counts are read from the
+    mention_count property maintained by add_nodes_and_edges_bulk; MENTIONS edges are only
+    counted for nodes without it, e.g. nodes saved on their own since.
+    """
+    counts: dict[str, int] = {}
+    missing_uuids = node_uuids
+    if driver.provider != GraphProvider.KUZU:
+        results, _, _ = await driver.execute_query(
+            """
+            UNWIND $node_uuids AS node_uuid
+            MATCH (n:Entity {uuid: node_uuid})
+            RETURN n.uuid AS uuid, n.mention_count AS mention_count
+            """,
+            node_uuids=node_uuids,
+            routing_='r',
+        )
+        counts = {
+            result['uuid']: result['mention_count']
+            for result in results
+            if result['mention_count'] is not None
+        }
+        missing_uuids = [uuid for uuid in node_uuids if uuid not in counts]
 
-    return [uuid for uuid in sorted_uuids if scores[uuid] >= min_score], [
-        scores[uuid] for uuid in sorted_uuids if scores[uuid] >= min_score
-    ]
+    if missing_uuids:
+        results, _, _ = await driver.execute_query(
+            """
+            UNWIND $node_uuids AS node_uuid
+            MATCH (episode:Episodic)-[r:MENTIONS]->(n:Entity {uuid: node_uuid})
+            RETURN count(*) AS mention_count, n.uuid AS uuid
+            """,
+            node_uuids=missing_uuids,
+            routing_='r',
+        )
+        for result in results:
+            counts[result['uuid']] = result['mention_count']
+
+    return counts
+
+
+async def episode_mentions_reranker(
+    driver: GraphDriver,
+    node_uuids: list[list[str]],
+    min_score: float = 0,
+    limit: int | None = None,
+) -> tuple[list[str], list[float]]:
+    """Rank nodes by the number of episodes that mention them, most mentioned first."""
+    # use rrf as a preliminary ranker, which orders equally mentioned nodes
+    sorted_uuids, _ = rrf(node_uuids)
+    counts = await get_mention_counts(driver, sorted_uuids)
+
+    return _top_k({uuid: float(counts.get(uuid, 0)) for uuid in sorted_uuids}, limit, min_score)
 
 
 def maximal_marginal_relevance(
     query_vector: list[float],
-    candidates: dict[str, list[float]],
+    candidates: dict[str, list[float]] | dict[str, NDArray[np.float32]],
     mmr_lambda: float = DEFAULT_MMR_LAMBDA,
     min_score: float = -2.0,
 ) -> tuple[list[str], list[float]]:
     start = time()
-    query_array = np.array(query_vector)
-    candidate_arrays: dict[str, NDArray] = {}
-    for uuid, embedding in candidates.items():
-        candidate_arrays[uuid] = normalize_l2(embedding)
-
-    uuids: list[str] = list(candidate_arrays.keys())
-
-    similarity_matrix = np.zeros((len(uuids), len(uuids)))
-
-    for i, uuid_1 in enumerate(uuids):
-        for j, uuid_2 in enumerate(uuids[:i]):
-            u = candidate_arrays[uuid_1]
-            v = candidate_arrays[uuid_2]
-            similarity = np.dot(u, v)
-
-            similarity_matrix[i, j] = similarity
-            similarity_matrix[j, i] = similarity
-
-    mmr_scores: dict[str, float] = {}
-    for i, uuid in enumerate(uuids):
-        max_sim = np.max(similarity_matrix[i, :])
-        mmr = mmr_lambda * np.dot(query_array, candidate_arrays[uuid]) + (mmr_lambda - 1) * max_sim
-        mmr_scores[uuid] = mmr
+    uuids: list[str] = list(candidates.keys())
+    if len(uuids) == 0:
+        return [], []
+
+    query_array = np.asarray(query_vector, dtype=np.float32)
+    candidate_matrix = np.stack([np.asarray(candidates[uuid], dtype=np.float32) for uuid in uuids])
+    norms = np.linalg.norm(candidate_matrix, axis=1, keepdims=True)
+    candidate_matrix = np.divide(candidate_matrix, norms, out=candidate_matrix, where=norms != 0)
+
+    similarity_matrix = candidate_matrix @ candidate_matrix.T
+    np.fill_diagonal(similarity_matrix, 0)
+    max_sims = similarity_matrix.max(axis=1)
+    mmr_values = mmr_lambda * (candidate_matrix @ query_array) + (mmr_lambda - 1) * max_sims
+
+    mmr_scores: dict[str, float] = {
+        uuid: float(mmr) for uuid, mmr in zip(uuids, mmr_values, strict=True)
+    }
 
     uuids.sort(reverse=True, key=lambda c: mmr_scores[c])
 
@@ -1887,7 +2978,7 @@ def maximal_marginal_relevance(
 
 
 async def get_embeddings_for_nodes(
-    driver: GraphDriver, nodes: list[EntityNode]
+    driver: GraphDriver, nodes: Sequence[EntityNode | SearchCandidate]
 ) -> dict[str, list[float]]:
     if driver.provider == GraphProvider.NEPTUNE:
         query = """
@@ -1957,7 +3048,7 @@ async def get_embeddings_for_communities(
 
 
 async def get_embeddings_for_edges(
-    driver: GraphDriver, edges: list[EntityEdge]
+    driver: GraphDriver, edges: Sequence[EntityEdge | EdgeSearchCandidate]
 ) -> dict[str, list[float]]:
     if driver.provider == GraphProvider.NEPTUNE:
         query = """
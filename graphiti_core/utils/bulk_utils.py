@@ -33,10 +33,12 @@ from graphiti_core.models.edges.edge_db_queries import (
     get_episodic_edge_save_bulk_query,
 )
 from graphiti_core.models.nodes.node_db_queries import (
+    ENTITY_NODE_MENTION_COUNT_UPDATE,
     get_entity_node_save_bulk_query,
     get_episode_node_save_bulk_query,
 )
 from graphiti_core.nodes import EntityNode, EpisodeType, EpisodicNode, create_entity_node_embeddings
+from graphiti_core.search.search_cache import invalidate_search_cache
 from graphiti_core.utils.datetime_utils import convert_datetimes_to_strings
 from graphiti_core.utils.maintenance.edge_operations import (
     extract_edges,
@@ -105,6 +107,15 @@ async def add_nodes_and_edges_bulk(
     finally:
         await session.close()
 
+    invalidate_search_cache(
+        driver,
+        {
+            item.group_id
+            for items in (episodic_nodes, episodic_edges, entity_nodes, entity_edges)
+            for item in items
+        },
+    )
+
 
 async def add_nodes_and_edges_bulk_tx(
     tx: GraphDriverSession,
@@ -199,6 +210,13 @@ async def add_nodes_and_edges_bulk_tx(
         )
         await tx.run(get_entity_edge_save_bulk_query(driver.provider), entity_edges=edges)
 
+        # Kuzu has no mention_count column; its reranker counts the MENTIONS edges instead
+        mentioned_node_uuids = {node.uuid for node in entity_nodes} | {
+            edge.target_node_uuid for edge in episodic_edges
+        }
+        if mentioned_node_uuids:
+            await tx.run(ENTITY_NODE_MENTION_COUNT_UPDATE, node_uuids=list(mentioned_node_uuids))
+
 
 async def extract_nodes_and_edges_bulk(
     clients: GraphitiClients,
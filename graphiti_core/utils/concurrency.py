@@ -0,0 +1,134 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import os
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any
+
+_SEMAPHORE_LIMIT = int(os.getenv('SEMAPHORE_LIMIT', 20))
+DB_CONCURRENCY_LIMIT = int(os.getenv('DB_CONCURRENCY_LIMIT', _SEMAPHORE_LIMIT))
+LLM_CONCURRENCY_LIMIT = int(os.getenv('LLM_CONCURRENCY_LIMIT', _SEMAPHORE_LIMIT))
+EMBEDDER_CONCURRENCY_LIMIT = int(os.getenv('EMBEDDER_CONCURRENCY_LIMIT', _SEMAPHORE_LIMIT))
+
+# Pools whose slot the current task already holds, so nested calls do not wait on themselves
+_held_pools: ContextVar[frozenset[int]] = ContextVar('concurrency_held_pools', default=frozenset())
+
+
+class ConcurrencyPool:
+    """
+    Bounds the in-flight operations of one kind of work, e.g. database queries, across every
+    caller that shares the pool, however deeply their gathers are nested.
+    """
+
+    def __init__(self, name: str, limit: int):
+        if limit < 1:
+            raise ValueError(f'limit must be at least 1, got: {limit}')
+
+        self.name = name
+        self.limit = limit
+        self.in_flight = 0
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.completed = 0
+
+        self._semaphore: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # Pools are shared across Graphiti calls, so they may outlive the event loop they were used on
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.limit)
+            self._loop = loop
+            self.in_flight = 0
+            self.queue_depth = 0
+        return self._semaphore
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[None]:
+        held = _held_pools.get()
+        if id(self) in held:
+            yield
+            return
+
+        semaphore = self._get_semaphore()
+        self.queue_depth += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        try:
+            await semaphore.acquire()
+        finally:
+            self.queue_depth -= 1
+
+        self.in_flight += 1
+        held_token = _held_pools.set(held | {id(self)})
+        try:
+            yield
+        finally:
+            _held_pools.reset(held_token)
+            self.in_flight -= 1
+            self.completed += 1
+            semaphore.release()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            'limit': self.limit,
+            'in_flight': self.in_flight,
+            'queue_depth': self.queue_depth,
+            'max_queue_depth': self.max_queue_depth,
+            'completed': self.completed,
+        }
+
+
+class ConcurrencyPools:
+    """Separate pools for database, LLM and embedder work."""
+
+    def __init__(
+        self,
+        db_limit: int = DB_CONCURRENCY_LIMIT,
+        llm_limit: int = LLM_CONCURRENCY_LIMIT,
+        embedder_limit: int = EMBEDDER_CONCURRENCY_LIMIT,
+    ):
+        self.db = ConcurrencyPool('db', db_limit)
+        self.llm = ConcurrencyPool('llm', llm_limit)
+        self.embedder = ConcurrencyPool('embedder', embedder_limit)
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        return {pool.name: pool.stats() for pool in (self.db, self.llm, self.embedder)}
+
+
+# Used by clients and drivers that are not given the pools of a Graphiti instance
+default_concurrency_pools = ConcurrencyPools()
+
+
+def pooled(method: Callable, pool: str) -> Callable:
+    """
+    Wrap an async client or driver method so that every call holds a slot of the instance's
+    concurrency_pool, or of the default pool of that kind when it has none.
+    """
+
+    @wraps(method)
+    async def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+        concurrency_pool = getattr(self, 'concurrency_pool', None) or getattr(
+            default_concurrency_pools, pool
+        )
+        async with concurrency_pool.acquire():
+            return await method(self, *args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,184 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+from collections import Counter
+from difflib import SequenceMatcher
+from hashlib import sha256
+
+import numpy as np
+
+from graphiti_core.edges import EntityEdge
+from graphiti_core.helpers import normalize_l2
+from graphiti_core.nodes import EntityNode
+
+NODE_DEDUPE_COSINE_THRESHOLD = float(os.getenv('NODE_DEDUPE_COSINE_THRESHOLD', 0.98))
+# Fuzzy name matching is disabled unless a threshold is configured
+NODE_DEDUPE_FUZZY_THRESHOLD: float | None = (
+    float(os.environ['NODE_DEDUPE_FUZZY_THRESHOLD'])
+    if os.getenv('NODE_DEDUPE_FUZZY_THRESHOLD')
+    else None
+)
+EDGE_DEDUPE_COSINE_THRESHOLD = float(os.getenv('EDGE_DEDUPE_COSINE_THRESHOLD', 0.98))
+
+
+class DedupeMetrics:
+    """Counts how duplicates were resolved, per stage, e.g. exact, cosine, fuzzy or llm."""
+
+    def __init__(self):
+        self.counts: Counter[str] = Counter()
+
+    def record(self, stage: str, count: int = 1):
+        if count > 0:
+            self.counts[stage] += count
+
+    @property
+    def short_circuited(self) -> int:
+        """Number of resolutions made without an LLM call."""
+        return sum(count for stage, count in self.counts.items() if stage != 'llm')
+
+    def reset(self):
+        self.counts.clear()
+
+
+node_dedupe_metrics = DedupeMetrics()
+edge_dedupe_metrics = DedupeMetrics()
+
+
+def normalize_name(name: str) -> str:
+    return ' '.join(name.lower().split())
+
+
+def _specific_labels(node: EntityNode) -> set[str]:
+    return {label for label in node.labels if label != 'Entity'}
+
+
+def labels_match(node: EntityNode, other: EntityNode) -> bool:
+    """Nodes match unless both carry a specific entity type and they share none."""
+    labels, other_labels = _specific_labels(node), _specific_labels(other)
+    return not labels or not other_labels or not labels.isdisjoint(other_labels)
+
+
+def resolve_nodes_deterministically(
+    extracted_nodes: list[EntityNode],
+    existing_nodes: list[EntityNode],
+    cosine_threshold: float = NODE_DEDUPE_COSINE_THRESHOLD,
+    fuzzy_threshold: float | None = NODE_DEDUPE_FUZZY_THRESHOLD,
+) -> dict[int, tuple[int, str]]:
+    """
+    Resolve obvious duplicates without an LLM call.
+
+    Each extracted node is matched, in order, on its normalized name, on the cosine similarity of
+    the name embeddings above cosine_threshold, and optionally on a fuzzy name ratio at or above
+    fuzzy_threshold, against existing nodes with matching labels. Several existing nodes with the
+    same normalized name are ambiguous and left to the LLM.
+
+    Returns a map from the index of each resolved extracted node to the index of its duplicate in
+    existing_nodes and the stage that resolved it.
+    """
+    existing_by_name: dict[str, list[int]] = {}
+    for j, existing_node in enumerate(existing_nodes):
+        existing_by_name.setdefault(normalize_name(existing_node.name), []).append(j)
+
+    existing_embeddings = {
+        j: normalize_l2(existing_node.name_embedding)
+        for j, existing_node in enumerate(existing_nodes)
+        if existing_node.name_embedding
+    }
+
+    resolutions: dict[int, tuple[int, str]] = {}
+    for i, node in enumerate(extracted_nodes):
+        name = normalize_name(node.name)
+        candidates = [
+            j for j, existing_node in enumerate(existing_nodes) if labels_match(node, existing_node)
+        ]
+        if not candidates:
+            continue
+
+        exact_matches = [j for j in existing_by_name.get(name, []) if j in candidates]
+        if len(exact_matches) == 1:
+            resolutions[i] = (exact_matches[0], 'exact')
+            continue
+        if exact_matches:
+            continue
+
+        if node.name_embedding:
+            embedding = normalize_l2(node.name_embedding)
+            similarities = [
+                (float(np.dot(embedding, existing_embeddings[j])), j)
+                for j in candidates
+                if j in existing_embeddings
+            ]
+            if similarities:
+                similarity, j = max(similarities)
+                if similarity > cosine_threshold:
+                    resolutions[i] = (j, 'cosine')
+                    continue
+
+        if fuzzy_threshold is not None:
+            ratio, j = max(
+                (SequenceMatcher(None, name, normalize_name(existing_nodes[j].name)).ratio(), j)
+                for j in candidates
+            )
+            if ratio >= fuzzy_threshold:
+                resolutions[i] = (j, 'fuzzy')
+
+    return resolutions
+
+
+def edge_fact_key(edge: EntityEdge) -> tuple[str, str, str]:
+    """Key of an edge on its endpoints and the hash of its normalized fact."""
+    fact = normalize_name(edge.fact).rstrip('.')
+    return edge.source_node_uuid, edge.target_node_uuid, sha256(fact.encode()).hexdigest()
+
+
+def find_duplicate_edge(
+    extracted_edge: EntityEdge,
+    related_edges: list[EntityEdge],
+    cosine_threshold: float = EDGE_DEDUPE_COSINE_THRESHOLD,
+) -> tuple[int, str] | None:
+    """
+    Find an existing edge that repeats the extracted fact between the same source and target.
+
+    Returns the index of the duplicate in related_edges and the stage that found it, exact for
+    an identical normalized fact or cosine for fact embeddings above cosine_threshold.
+    """
+    key = edge_fact_key(extracted_edge)
+    same_endpoints = [
+        i
+        for i, edge in enumerate(related_edges)
+        if (edge.source_node_uuid, edge.target_node_uuid) == key[:2]
+    ]
+
+    for i in same_endpoints:
+        if edge_fact_key(related_edges[i]) == key:
+            return i, 'exact'
+
+    if not extracted_edge.fact_embedding:
+        return None
+
+    embedding = normalize_l2(extracted_edge.fact_embedding)
+    similarities = [
+        (float(np.dot(embedding, normalize_l2(related_edges[i].fact_embedding or []))), i)
+        for i in same_endpoints
+        if related_edges[i].fact_embedding
+    ]
+    if similarities:
+        similarity, i = max(similarities)
+        if similarity > cosine_threshold:
+            return i, 'cosine'
+
+    return None
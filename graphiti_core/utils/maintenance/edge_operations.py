@@ -15,8 +15,11 @@ limitations under the License.
 """
 
 import logging
+import os
+from collections.abc import Sequence
 from datetime import datetime
 from time import time
+from typing import Any
 
 from pydantic import BaseModel
 from typing_extensions import LiteralString
@@ -34,14 +37,27 @@ from graphiti_core.llm_client import LLMClient
 from graphiti_core.llm_client.config import ModelSize
 from graphiti_core.nodes import CommunityNode, EntityNode, EpisodicNode
 from graphiti_core.prompts import prompt_library
-from graphiti_core.prompts.dedupe_edges import EdgeDuplicate
-from graphiti_core.prompts.extract_edges import ExtractedEdges, MissingFacts
+from graphiti_core.prompts.dedupe_edges import EdgeDuplicate, EdgeResolutions
+from graphiti_core.prompts.extract_edges import Edge, ExtractedEdges, MissingFacts
+from graphiti_core.prompts.prompt_helpers import estimate_tokens
 from graphiti_core.search.search_filters import SearchFilters
 from graphiti_core.search.search_utils import get_edge_invalidation_candidates, get_relevant_edges
 from graphiti_core.utils.datetime_utils import ensure_utc, utc_now
+from graphiti_core.utils.maintenance.dedupe_helpers import edge_dedupe_metrics, find_duplicate_edge
+from graphiti_core.utils.prompt_context import previous_episodes_context
 
 logger = logging.getLogger(__name__)
 
+EXTRACT_EDGES_MAX_TOKENS = 16384
+EDGE_RESOLUTION_TOKEN_BUDGET = int(os.getenv('EDGE_RESOLUTION_TOKEN_BUDGET', 4000))
+# Output tokens reserved per edge for its resolution
+EDGE_RESOLUTION_OUTPUT_TOKENS = 50
+
+# (extracted edge, related edges, invalidation candidates, edge types)
+EdgeResolutionItem = tuple[
+    EntityEdge, list[EntityEdge], list[EntityEdge], dict[str, type[BaseModel]] | None
+]
+
 
 def build_episodic_edges(
     entity_nodes: list[EntityNode],
@@ -118,28 +134,8 @@ async def extract_edges(
 ) -> list[EntityEdge]:
     start = time()
 
-    extract_edges_max_tokens = 16384
     llm_client = clients.llm_client
 
-    edge_type_signature_map: dict[str, tuple[str, str]] = {
-        edge_type: signature
-        for signature, edge_types in edge_type_map.items()
-        for edge_type in edge_types
-    }
-
-    edge_types_context = (
-        [
-            {
-                'fact_type_name': type_name,
-                'fact_type_signature': edge_type_signature_map.get(type_name, ('Entity', 'Entity')),
-                'fact_type_description': type_model.__doc__,
-            }
-            for type_name, type_model in edge_types.items()
-        ]
-        if edge_types is not None
-        else []
-    )
-
     # Prepare context for LLM
     context = {
         'episode_content': episode.content,
@@ -147,9 +143,9 @@ async def extract_edges(
             {'id': idx, 'name': node.name, 'entity_types': node.labels}
             for idx, node in enumerate(nodes)
         ],
-        'previous_episodes': [ep.content for ep in previous_episodes],
+        'previous_episodes': previous_episodes_context(previous_episodes, 'extract_edges', episode),
         'reference_time': episode.valid_at,
-        'edge_types': edge_types_context,
+        'edge_types': build_edge_types_context(edge_type_map, edge_types),
         'custom_prompt': '',
         'ensure_ascii': clients.ensure_ascii,
     }
@@ -160,7 +156,7 @@ async def extract_edges(
         llm_response = await llm_client.generate_response(
             prompt_library.extract_edges.edge(context),
             response_model=ExtractedEdges,
-            max_tokens=extract_edges_max_tokens,
+            max_tokens=EXTRACT_EDGES_MAX_TOKENS,
         )
         edges_data = ExtractedEdges(**llm_response).edges
 
@@ -171,7 +167,7 @@ async def extract_edges(
             reflexion_response = await llm_client.generate_response(
                 prompt_library.extract_edges.reflexion(context),
                 response_model=MissingFacts,
-                max_tokens=extract_edges_max_tokens,
+                max_tokens=EXTRACT_EDGES_MAX_TOKENS,
             )
 
             missing_facts = reflexion_response.get('missing_facts', [])
@@ -187,6 +183,40 @@ async def extract_edges(
     end = time()
     logger.debug(f'Extracted new edges: {edges_data} in {(end - start) * 1000} ms')
 
+    return build_extracted_edges(edges_data, nodes, episode, group_id)
+
+
+def build_edge_types_context(
+    edge_type_map: dict[tuple[str, str], list[str]],
+    edge_types: dict[str, type[BaseModel]] | None = None,
+) -> list[dict[str, Any]]:
+    edge_type_signature_map: dict[str, tuple[str, str]] = {
+        edge_type: signature
+        for signature, edge_types in edge_type_map.items()
+        for edge_type in edge_types
+    }
+
+    return (
+        [
+            {
+                'fact_type_name': type_name,
+                'fact_type_signature': edge_type_signature_map.get(type_name, ('Entity', 'Entity')),
+                'fact_type_description': type_model.__doc__,
+            }
+            for type_name, type_model in edge_types.items()
+        ]
+        if edge_types is not None
+        else []
+    )
+
+
+def build_extracted_edges(
+    edges_data: list[Edge],
+    nodes: Sequence[EntityNode | None],
+    episode: EpisodicNode,
+    group_id: str = '',
+) -> list[EntityEdge]:
+    """Convert extracted edges into EntityEdges; edges whose source or target is missing are skipped."""
     if len(edges_data) == 0:
         return []
 
@@ -201,13 +231,15 @@ async def extract_edges(
 
         source_node_idx = edge_data.source_entity_id
         target_node_idx = edge_data.target_entity_id
-        if not (-1 < source_node_idx < len(nodes) and -1 < target_node_idx < len(nodes)):
+        source_node = nodes[source_node_idx] if -1 < source_node_idx < len(nodes) else None
+        target_node = nodes[target_node_idx] if -1 < target_node_idx < len(nodes) else None
+        if source_node is None or target_node is None:
             logger.warning(
                 f'WARNING: source or target node not filled {edge_data.relation_type}. source_node_uuid: {source_node_idx} and target_node_uuid: {target_node_idx} '
             )
             continue
-        source_node_uuid = nodes[source_node_idx].uuid
-        target_node_uuid = nodes[edge_data.target_entity_id].uuid
+        source_node_uuid = source_node.uuid
+        target_node_uuid = target_node.uuid
 
         if valid_at:
             try:
@@ -302,27 +334,19 @@ async def resolve_extracted_edges(
         edge_types_lst.append(extracted_edge_types)
 
     # resolve edges with related edges in the graph and find invalidation candidates
-    results: list[tuple[EntityEdge, list[EntityEdge], list[EntityEdge]]] = list(
-        await semaphore_gather(
-            *[
-                resolve_extracted_edge(
-                    llm_client,
-                    extracted_edge,
-                    related_edges,
-                    existing_edges,
-                    episode,
-                    extracted_edge_types,
-                    clients.ensure_ascii,
-                )
-                for extracted_edge, related_edges, existing_edges, extracted_edge_types in zip(
-                    extracted_edges,
-                    related_edges_lists,
-                    edge_invalidation_candidates,
-                    edge_types_lst,
-                    strict=True,
-                )
-            ]
-        )
+    results = await resolve_extracted_edges_batched(
+        llm_client,
+        list(
+            zip(
+                extracted_edges,
+                related_edges_lists,
+                edge_invalidation_candidates,
+                edge_types_lst,
+                strict=True,
+            )
+        ),
+        episode,
+        clients.ensure_ascii,
     )
 
     resolved_edges: list[EntityEdge] = []
@@ -391,6 +415,19 @@ async def resolve_extracted_edge(
 
     start = time()
 
+    duplicate = _duplicate_edge_resolution(extracted_edge, related_edges)
+    if duplicate is not None:
+        return await _apply_edge_resolution(
+            llm_client,
+            extracted_edge,
+            related_edges,
+            existing_edges,
+            episode,
+            edge_types,
+            duplicate,
+            ensure_ascii,
+        )
+
     # Prepare context for LLM
     related_edges_context = [
         {'id': edge.uuid, 'fact': edge.fact} for i, edge in enumerate(related_edges)
@@ -427,6 +464,240 @@ async def resolve_extracted_edge(
         model_size=ModelSize.small,
     )
     response_object = EdgeDuplicate(**llm_response)
+    edge_dedupe_metrics.record('llm')
+
+    result = await _apply_edge_resolution(
+        llm_client,
+        extracted_edge,
+        related_edges,
+        existing_edges,
+        episode,
+        edge_types,
+        response_object,
+        ensure_ascii,
+    )
+
+    end = time()
+    logger.debug(
+        f'Resolved Edge: {extracted_edge.name} is {result[0].name}, in {(end - start) * 1000} ms'
+    )
+
+    return result
+
+
+def _edge_resolution_context(
+    extracted_edge: EntityEdge,
+    related_edges: list[EntityEdge],
+    existing_edges: list[EntityEdge],
+    edge_types: dict[str, type[BaseModel]] | None,
+) -> dict[str, Any]:
+    return {
+        'fact': extracted_edge.fact,
+        'existing_facts': [{'idx': i, 'fact': edge.fact} for i, edge in enumerate(related_edges)],
+        'invalidation_candidates': [
+            {'idx': i, 'fact': edge.fact} for i, edge in enumerate(existing_edges)
+        ],
+        'fact_types': [
+            {'fact_type_name': type_name, 'fact_type_description': type_model.__doc__}
+            for type_name, type_model in (edge_types or {}).items()
+        ],
+    }
+
+
+def _duplicate_edge_resolution(
+    extracted_edge: EntityEdge, related_edges: list[EntityEdge]
+) -> EdgeDuplicate | None:
+    """Resolve an edge that repeats an existing fact between the same nodes, without the LLM."""
+    duplicate = find_duplicate_edge(extracted_edge, related_edges)
+    if duplicate is None:
+        return None
+
+    duplicate_idx, stage = duplicate
+    edge_dedupe_metrics.record(stage)
+    return EdgeDuplicate(
+        duplicate_facts=[duplicate_idx], contradicted_facts=[], fact_type='DEFAULT'
+    )
+
+
+def _edge_resolution_batches(
+    items: list[tuple[int, EdgeResolutionItem]], token_budget: int
+) -> list[list[tuple[int, EdgeResolutionItem]]]:
+    """Greedily pack edges into batches whose estimated tokens fit the budget."""
+    batches: list[list[tuple[int, EdgeResolutionItem]]] = []
+    batch_tokens = 0
+    for i, item in items:
+        extracted_edge, related_edges, existing_edges, edge_types = item
+        item_tokens = (
+            estimate_tokens(
+                _edge_resolution_context(extracted_edge, related_edges, existing_edges, edge_types)
+            )
+            + EDGE_RESOLUTION_OUTPUT_TOKENS
+        )
+        if not batches or batch_tokens + item_tokens > token_budget:
+            batches.append([])
+            batch_tokens = 0
+
+        batches[-1].append((i, item))
+        batch_tokens += item_tokens
+
+    return batches
+
+
+async def resolve_extracted_edges_batched(
+    llm_client: LLMClient,
+    items: list[EdgeResolutionItem],
+    episode: EpisodicNode,
+    ensure_ascii: bool = True,
+    token_budget: int | None = None,
+) -> list[tuple[EntityEdge, list[EntityEdge], list[EntityEdge]]]:
+    """
+    Resolve (extracted edge, related edges, invalidation candidates, edge types) items.
+
+    Edges without candidates are kept as they are, and edges that repeat an existing fact between
+    the same nodes are resolved to it, without an LLM call. The others are packed into batches
+    under the token budget and each batch is resolved with a single LLM call. Edges that are
+    missing from a batch response fall back to resolve_extracted_edge.
+    """
+    results: list[tuple[EntityEdge, list[EntityEdge], list[EntityEdge]]] = [
+        (extracted_edge, [], []) for extracted_edge, _, _, _ in items
+    ]
+
+    duplicates: list[tuple[int, EdgeResolutionItem, EdgeDuplicate]] = []
+    pending: list[tuple[int, EdgeResolutionItem]] = []
+    for i, item in enumerate(items):
+        extracted_edge, related_edges, existing_edges, _ = item
+        if len(related_edges) == 0 and len(existing_edges) == 0:
+            continue
+
+        duplicate = _duplicate_edge_resolution(extracted_edge, related_edges)
+        if duplicate is not None:
+            duplicates.append((i, item, duplicate))
+        else:
+            pending.append((i, item))
+
+    duplicate_results = await semaphore_gather(
+        *[
+            _apply_edge_resolution(
+                llm_client,
+                extracted_edge,
+                related_edges,
+                existing_edges,
+                episode,
+                edge_types,
+                duplicate,
+                ensure_ascii,
+            )
+            for _, (
+                extracted_edge,
+                related_edges,
+                existing_edges,
+                edge_types,
+            ), duplicate in duplicates
+        ]
+    )
+    for (i, _, _), result in zip(duplicates, duplicate_results, strict=True):
+        results[i] = result
+
+    batches = _edge_resolution_batches(
+        pending, token_budget if token_budget is not None else EDGE_RESOLUTION_TOKEN_BUDGET
+    )
+    batch_results = await semaphore_gather(
+        *[
+            _resolve_extracted_edge_batch(
+                llm_client, [item for _, item in batch], episode, ensure_ascii
+            )
+            for batch in batches
+        ]
+    )
+    for batch, batch_result in zip(batches, batch_results, strict=True):
+        for (i, _), result in zip(batch, batch_result, strict=True):
+            results[i] = result
+
+    return results
+
+
+async def _resolve_extracted_edge_batch(
+    llm_client: LLMClient,
+    batch: list[EdgeResolutionItem],
+    episode: EpisodicNode,
+    ensure_ascii: bool = True,
+) -> list[tuple[EntityEdge, list[EntityEdge], list[EntityEdge]]]:
+    if len(batch) == 1:
+        extracted_edge, related_edges, existing_edges, edge_types = batch[0]
+        return [
+            await resolve_extracted_edge(
+                llm_client,
+                extracted_edge,
+                related_edges,
+                existing_edges,
+                episode,
+                edge_types,
+                ensure_ascii,
+            )
+        ]
+
+    # Edges are identified by their position in the batch, candidates by their position per edge
+    context = {
+        'new_edges': [{'id': i, **_edge_resolution_context(*item)} for i, item in enumerate(batch)],
+        'ensure_ascii': ensure_ascii,
+    }
+
+    try:
+        llm_response = await llm_client.generate_response(
+            prompt_library.dedupe_edges.resolve_edges(context),
+            response_model=EdgeResolutions,
+            model_size=ModelSize.small,
+        )
+        resolutions = EdgeResolutions(**llm_response).edge_resolutions
+    except Exception as e:
+        logger.warning(f'Batched edge resolution failed, resolving edges one by one: {e}')
+        resolutions = []
+
+    resolutions_by_id = {
+        resolution.id: resolution for resolution in resolutions if 0 <= resolution.id < len(batch)
+    }
+
+    async def resolve(
+        i: int, item: EdgeResolutionItem
+    ) -> tuple[EntityEdge, list[EntityEdge], list[EntityEdge]]:
+        extracted_edge, related_edges, existing_edges, edge_types = item
+        resolution = resolutions_by_id.get(i)
+        if resolution is None:
+            return await resolve_extracted_edge(
+                llm_client,
+                extracted_edge,
+                related_edges,
+                existing_edges,
+                episode,
+                edge_types,
+                ensure_ascii,
+            )
+
+        edge_dedupe_metrics.record('llm')
+        return await _apply_edge_resolution(
+            llm_client,
+            extracted_edge,
+            related_edges,
+            existing_edges,
+            episode,
+            edge_types,
+            resolution,
+            ensure_ascii,
+        )
+
+    return list(await semaphore_gather(*[resolve(i, item) for i, item in enumerate(batch)]))
+
+
+async def _apply_edge_resolution(
+    llm_client: LLMClient,
+    extracted_edge: EntityEdge,
+    related_edges: list[EntityEdge],
+    existing_edges: list[EntityEdge],
+    episode: EpisodicNode,
+    edge_types: dict[str, type[BaseModel]] | None,
+    response_object: EdgeDuplicate,
+    ensure_ascii: bool = True,
+) -> tuple[EntityEdge, list[EntityEdge], list[EntityEdge]]:
     duplicate_facts = response_object.duplicate_facts
 
     duplicate_fact_ids: list[int] = [i for i in duplicate_facts if 0 <= i < len(related_edges)]
@@ -466,11 +737,6 @@ async def resolve_extracted_edge(
 
             resolved_edge.attributes = edge_attributes_response
 
-    end = time()
-    logger.debug(
-        f'Resolved Edge: {extracted_edge.name} is {resolved_edge.name}, in {(end - start) * 1000} ms'
-    )
-
     now = utc_now()
 
     if resolved_edge.invalid_at and not resolved_edge.expired_at:
@@ -14,26 +14,40 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import asyncio
 import logging
+import os
 from datetime import datetime
+from typing import Any
+from weakref import WeakKeyDictionary
 
 from typing_extensions import LiteralString
 
 from graphiti_core.driver.driver import GraphDriver, GraphProvider
-from graphiti_core.graph_queries import get_fulltext_indices, get_range_indices
+from graphiti_core.embedder.client import EMBEDDING_DIM
+from graphiti_core.graph_queries import get_fulltext_indices, get_range_indices, get_vector_indices
 from graphiti_core.helpers import semaphore_gather
 from graphiti_core.models.nodes.node_db_queries import (
     EPISODIC_NODE_RETURN,
     EPISODIC_NODE_RETURN_NEPTUNE,
 )
 from graphiti_core.nodes import EpisodeType, EpisodicNode, get_episodic_node_from_record
+from graphiti_core.search.search_cache import invalidate_search_cache
 
 EPISODE_WINDOW_LEN = 3
+# Bump when the definition of the group-scoped indices in `build_dynamic_indexes` changes
+DYNAMIC_INDEX_SCHEMA_VERSION = 1
+PERSIST_DYNAMIC_INDEXES = os.getenv('PERSIST_DYNAMIC_INDEXES', '').lower() in ('true', '1', 'yes')
 
 logger = logging.getLogger(__name__)
 
+# Per-driver memo of dynamic index provisioning tasks, keyed by group_id
+_dynamic_index_tasks: WeakKeyDictionary[GraphDriver, dict[str, asyncio.Task]] = WeakKeyDictionary()
 
-async def build_indices_and_constraints(driver: GraphDriver, delete_existing: bool = False):
+
+async def build_indices_and_constraints(
+    driver: GraphDriver, delete_existing: bool = False, embedding_dim: int = EMBEDDING_DIM
+):
     if driver.provider == GraphProvider.NEPTUNE:
         await driver.create_aoss_indices()  # pyright: ignore[reportAttributeAccessIssue]
         return
@@ -76,7 +90,9 @@ async def build_indices_and_constraints(driver: GraphDriver, delete_existing: bo
                 """,
             )
 
-    index_queries: list[LiteralString] = range_indices + fulltext_indices
+    vector_indices: list[LiteralString] = get_vector_indices(driver.provider, embedding_dim)
+
+    index_queries: list[LiteralString] = range_indices + fulltext_indices + vector_indices
 
     await semaphore_gather(
         *[
@@ -114,6 +130,8 @@ async def clear_data(driver: GraphDriver, group_ids: list[str] | None = None):
         else:
             await session.execute_write(delete_group_ids)
 
+    invalidate_search_cache(driver, group_ids)
+
 
 async def retrieve_episodes(
     driver: GraphDriver,
@@ -177,42 +195,143 @@ async def retrieve_episodes(
     return list(reversed(episodes))  # Return in chronological order
 
 
-async def build_dynamic_indexes(driver: GraphDriver, group_id: str):
-    # Make sure indices exist for this group_id in Neo4j
-    if driver.provider == GraphProvider.NEO4J:
-        await driver.execute_query(
-            """CREATE FULLTEXT INDEX $episode_content IF NOT EXISTS 
-            FOR (e:"""
-            + 'Episodic_'
-            + group_id.replace('-', '')
-            + """) ON EACH [e.content, e.source, e.source_description, e.group_id]""",
-            episode_content='episode_content_' + group_id.replace('-', ''),
-        )
-        await driver.execute_query(
-            """CREATE FULLTEXT INDEX $node_name_and_summary IF NOT EXISTS FOR (n:"""
-            + 'Entity_'
-            + group_id.replace('-', '')
-            + """) ON EACH [n.name, n.summary, n.group_id]""",
-            node_name_and_summary='node_name_and_summary_' + group_id.replace('-', ''),
-        )
-        await driver.execute_query(
-            """CREATE FULLTEXT INDEX $community_name IF NOT EXISTS
-                                                     FOR (n:"""
-            + 'Community_'
-            + group_id.replace('-', '')
-            + """) ON EACH [n.name, n.group_id]""",
-            community_name='Community_' + group_id.replace('-', ''),
-        )
+def _get_dynamic_index_names(group_id: str) -> list[str]:
+    group_label = group_id.replace('-', '')
+    return [
+        'episode_content_' + group_label,
+        'node_name_and_summary_' + group_label,
+        'Community_' + group_label,
+        'group_entity_vector_' + group_label,
+    ]
+
+
+async def _get_dynamic_index_state(driver: GraphDriver, group_id: str) -> dict[str, Any] | None:
+    records, _, _ = await driver.execute_query(
+        """
+        MATCH (s:DynamicIndexState {group_id: $group_id})
+        RETURN s.schema_version AS schema_version, s.embedding_dim AS embedding_dim
+        """,
+        group_id=group_id,
+        routing_='r',
+    )
+    if not records:
+        return None
+    return {
+        'schema_version': records[0]['schema_version'],
+        'embedding_dim': records[0]['embedding_dim'],
+    }
+
+
+async def build_dynamic_indexes(
+    driver: GraphDriver,
+    group_id: str,
+    persist: bool = PERSIST_DYNAMIC_INDEXES,
+    embedding_dim: int = EMBEDDING_DIM,
+):
+    """
+    Make sure the group-scoped indices exist for this group_id (Neo4j only).
+
+    The group vector index is sized for embeddings of embedding_dim dimensions. When `persist` is
+    set, the provisioned schema version and embedding dimension are recorded in the graph so that
+    other processes can skip the DDL entirely, and indices from an older (or unrecorded) schema
+    version or another embedding dimension are dropped and recreated.
+    """
+    if driver.provider != GraphProvider.NEO4J:
+        return
+
+    if persist:
+        state = await _get_dynamic_index_state(driver, group_id)
+        if (
+            state is not None
+            and state['schema_version'] is not None
+            and state['schema_version'] >= DYNAMIC_INDEX_SCHEMA_VERSION
+            and state['embedding_dim'] == embedding_dim
+        ):
+            return
+        # Unversioned or outdated indices may have a different definition, so recreate them
+        for name in _get_dynamic_index_names(group_id):
+            await driver.execute_query('DROP INDEX $name IF EXISTS', name=name)
+
+    group_label = group_id.replace('-', '')
+    episode_index, node_index, community_index, vector_index = _get_dynamic_index_names(group_id)
+    # Schema changes are applied one at a time to avoid concurrent DDL conflicts
+    await driver.execute_query(
+        """CREATE FULLTEXT INDEX $episode_content IF NOT EXISTS
+        FOR (e:"""
+        + 'Episodic_'
+        + group_label
+        + """) ON EACH [e.content, e.source, e.source_description, e.group_id]""",
+        episode_content=episode_index,
+    )
+    await driver.execute_query(
+        """CREATE FULLTEXT INDEX $node_name_and_summary IF NOT EXISTS FOR (n:"""
+        + 'Entity_'
+        + group_label
+        + """) ON EACH [n.name, n.summary, n.group_id]""",
+        node_name_and_summary=node_index,
+    )
+    await driver.execute_query(
+        """CREATE FULLTEXT INDEX $community_name IF NOT EXISTS
+        FOR (n:"""
+        + 'Community_'
+        + group_label
+        + """) ON EACH [n.name, n.group_id]""",
+        community_name=community_index,
+    )
+    await driver.execute_query(
+        """CREATE VECTOR INDEX $group_entity_vector IF NOT EXISTS
+        FOR (n:"""
+        + 'Entity_'
+        + group_label
+        + """)
+        ON n.name_embedding
+        OPTIONS { indexConfig: {
+            `vector.dimensions`: """
+        + str(int(embedding_dim))
+        + """,
+            `vector.similarity_function`: 'cosine'
+        }}""",
+        group_entity_vector=vector_index,
+    )
+
+    if persist:
         await driver.execute_query(
-            """CREATE VECTOR INDEX $group_entity_vector IF NOT EXISTS
-                                                    FOR (n:"""
-            + 'Entity_'
-            + group_id.replace('-', '')
-            + """)
-                               ON n.embedding
-                               OPTIONS { indexConfig: {
-                                `vector.dimensions`: 1024,
-                                `vector.similarity_function`: 'cosine'
-                               }}""",
-            group_entity_vector='group_entity_vector_' + group_id.replace('-', ''),
+            """
+            MERGE (s:DynamicIndexState {group_id: $group_id})
+            SET s.schema_version = $schema_version, s.embedding_dim = $embedding_dim
+            """,
+            group_id=group_id,
+            schema_version=DYNAMIC_INDEX_SCHEMA_VERSION,
+            embedding_dim=embedding_dim,
         )
+
+
+def _log_dynamic_index_failure(task: asyncio.Task):
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f'Failed to build dynamic indexes: {task.exception()}')
+
+
+def ensure_dynamic_indexes(
+    driver: GraphDriver,
+    group_id: str,
+    persist: bool = PERSIST_DYNAMIC_INDEXES,
+    embedding_dim: int = EMBEDDING_DIM,
+) -> asyncio.Task | None:
+    """
+    Provision the dynamic indices for a group_id at most once per driver and process.
+
+    The DDL runs in a background task so that ingestion does not wait on it; concurrent callers
+    for the same group share the in-flight task, and failed attempts are retried on the next call.
+    Returns the provisioning task, or None if the provider has no dynamic indices.
+    """
+    if driver.provider != GraphProvider.NEO4J:
+        return None
+
+    tasks = _dynamic_index_tasks.setdefault(driver, {})
+    task = tasks.get(group_id)
+    if task is None or (task.done() and (task.cancelled() or task.exception() is not None)):
+        task = asyncio.create_task(build_dynamic_indexes(driver, group_id, persist, embedding_dim))
+        task.add_done_callback(_log_dynamic_index_failure)
+        tasks[group_id] = task
+
+    return task
@@ -15,11 +15,14 @@ limitations under the License.
 """
 
 import logging
+import os
+from functools import lru_cache
 from time import time
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError, create_model
 
+from graphiti_core.edges import EntityEdge
 from graphiti_core.graphiti_types import GraphitiClients
 from graphiti_core.helpers import MAX_REFLEXION_ITERATIONS, semaphore_gather
 from graphiti_core.llm_client import LLMClient
@@ -27,21 +30,39 @@ from graphiti_core.llm_client.config import ModelSize
 from graphiti_core.nodes import EntityNode, EpisodeType, EpisodicNode, create_entity_node_embeddings
 from graphiti_core.prompts import prompt_library
 from graphiti_core.prompts.dedupe_nodes import NodeDuplicate, NodeResolutions
+from graphiti_core.prompts.extract_edges import ExtractedEntitiesAndEdges
 from graphiti_core.prompts.extract_nodes import (
     EntitySummary,
     ExtractedEntities,
     ExtractedEntity,
     MissedEntities,
 )
+from graphiti_core.prompts.prompt_helpers import estimate_tokens
 from graphiti_core.search.search import search
 from graphiti_core.search.search_config import SearchResults
 from graphiti_core.search.search_config_recipes import NODE_HYBRID_SEARCH_RRF
 from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.search.search_utils import get_embeddings_for_nodes
 from graphiti_core.utils.datetime_utils import utc_now
-from graphiti_core.utils.maintenance.edge_operations import filter_existing_duplicate_of_edges
+from graphiti_core.utils.maintenance.dedupe_helpers import (
+    NODE_DEDUPE_COSINE_THRESHOLD,
+    node_dedupe_metrics,
+    resolve_nodes_deterministically,
+)
+from graphiti_core.utils.maintenance.edge_operations import (
+    EXTRACT_EDGES_MAX_TOKENS,
+    build_edge_types_context,
+    build_extracted_edges,
+    filter_existing_duplicate_of_edges,
+)
+from graphiti_core.utils.prompt_context import previous_episodes_context
 
 logger = logging.getLogger(__name__)
 
+NODE_HYDRATION_TOKEN_BUDGET = int(os.getenv('NODE_HYDRATION_TOKEN_BUDGET', 6000))
+# Output tokens reserved per node for its summary, which may be up to 250 words
+SUMMARY_OUTPUT_TOKENS = 350
+
 
 async def extract_nodes_reflexion(
     llm_client: LLMClient,
@@ -53,7 +74,7 @@ async def extract_nodes_reflexion(
     # Prepare context for LLM
     context = {
         'episode_content': episode.content,
-        'previous_episodes': [ep.content for ep in previous_episodes],
+        'previous_episodes': previous_episodes_context(previous_episodes, 'extract_nodes', episode),
         'extracted_entities': node_names,
         'ensure_ascii': ensure_ascii,
     }
@@ -80,31 +101,12 @@ async def extract_nodes(
     entities_missed = True
     reflexion_iterations = 0
 
-    entity_types_context = [
-        {
-            'entity_type_id': 0,
-            'entity_type_name': 'Entity',
-            'entity_type_description': 'Default entity classification. Use this entity type if the entity is not one of the other listed types.',
-        }
-    ]
-
-    entity_types_context += (
-        [
-            {
-                'entity_type_id': i + 1,
-                'entity_type_name': type_name,
-                'entity_type_description': type_model.__doc__,
-            }
-            for i, (type_name, type_model) in enumerate(entity_types.items())
-        ]
-        if entity_types is not None
-        else []
-    )
+    entity_types_context = _entity_types_context(entity_types)
 
     context = {
         'episode_content': episode.content,
         'episode_timestamp': episode.valid_at.isoformat(),
-        'previous_episodes': [ep.content for ep in previous_episodes],
+        'previous_episodes': previous_episodes_context(previous_episodes, 'extract_nodes', episode),
         'custom_prompt': custom_prompt,
         'entity_types': entity_types_context,
         'source_description': episode.source_description,
@@ -152,35 +154,132 @@ async def extract_nodes(
     # Convert the extracted data into EntityNode objects
     extracted_nodes = []
     for extracted_entity in filtered_extracted_entities:
-        type_id = extracted_entity.entity_type_id
-        if 0 <= type_id < len(entity_types_context):
-            entity_type_name = entity_types_context[extracted_entity.entity_type_id].get(
-                'entity_type_name'
-            )
-        else:
-            entity_type_name = 'Entity'
-
-        # Check if this entity type should be excluded
-        if excluded_entity_types and entity_type_name in excluded_entity_types:
-            logger.debug(f'Excluding entity "{extracted_entity.name}" of type "{entity_type_name}"')
-            continue
-
-        labels: list[str] = list({'Entity', str(entity_type_name)})
-
-        new_node = EntityNode(
-            name=extracted_entity.name,
-            group_id=episode.group_id,
-            labels=labels,
-            summary='',
-            created_at=utc_now(),
+        new_node = _entity_node(
+            extracted_entity, entity_types_context, episode, excluded_entity_types
         )
-        extracted_nodes.append(new_node)
-        logger.debug(f'Created new node: {new_node.name} (UUID: {new_node.uuid})')
+        if new_node is not None:
+            extracted_nodes.append(new_node)
 
     logger.debug(f'Extracted nodes: {[(n.name, n.uuid) for n in extracted_nodes]}')
     return extracted_nodes
 
 
+async def extract_nodes_and_edges(
+    clients: GraphitiClients,
+    episode: EpisodicNode,
+    previous_episodes: list[EpisodicNode],
+    edge_type_map: dict[tuple[str, str], list[str]],
+    group_id: str = '',
+    entity_types: dict[str, type[BaseModel]] | None = None,
+    excluded_entity_types: list[str] | None = None,
+    edge_types: dict[str, type[BaseModel]] | None = None,
+) -> tuple[list[EntityNode], list[EntityEdge]]:
+    """
+    Extract the entities of an episode and the facts between them in a single LLM call.
+
+    The facts refer to entities by their position in the response; they are reconciled with the
+    created nodes afterwards, and facts about blank or excluded entities are dropped. This saves
+    the round-trip of running extract_nodes before extract_edges, at the cost of the reflexion
+    passes of the separate prompts.
+    """
+    start = time()
+
+    entity_types_context = _entity_types_context(entity_types)
+    context = {
+        'episode_content': episode.content,
+        'reference_time': episode.valid_at,
+        'previous_episodes': previous_episodes_context(previous_episodes, 'extract_edges', episode),
+        'entity_types': entity_types_context,
+        'edge_types': build_edge_types_context(edge_type_map, edge_types),
+        'source_description': episode.source_description,
+        'ensure_ascii': clients.ensure_ascii,
+    }
+
+    llm_response = await clients.llm_client.generate_response(
+        prompt_library.extract_edges.entities_and_edges(context),
+        response_model=ExtractedEntitiesAndEdges,
+        max_tokens=EXTRACT_EDGES_MAX_TOKENS,
+    )
+    response_object = ExtractedEntitiesAndEdges(**llm_response)
+
+    # Nodes by position in the response, None where the entity was dropped
+    nodes_by_position = [
+        _entity_node(extracted_entity, entity_types_context, episode, excluded_entity_types)
+        if extracted_entity.name.strip()
+        else None
+        for extracted_entity in response_object.extracted_entities
+    ]
+    extracted_nodes = [node for node in nodes_by_position if node is not None]
+    extracted_edges = build_extracted_edges(
+        response_object.edges, nodes_by_position, episode, group_id
+    )
+
+    end = time()
+    logger.debug(
+        f'Extracted {len(extracted_nodes)} nodes and {len(extracted_edges)} edges in one call '
+        f'in {(end - start) * 1000} ms'
+    )
+
+    return extracted_nodes, extracted_edges
+
+
+def _entity_types_context(entity_types: dict[str, type[BaseModel]] | None) -> list[dict[str, Any]]:
+    entity_types_context: list[dict[str, Any]] = [
+        {
+            'entity_type_id': 0,
+            'entity_type_name': 'Entity',
+            'entity_type_description': 'Default entity classification. Use this entity type if the entity is not one of the other listed types.',
+        }
+    ]
+
+    entity_types_context += (
+        [
+            {
+                'entity_type_id': i + 1,
+                'entity_type_name': type_name,
+                'entity_type_description': type_model.__doc__,
+            }
+            for i, (type_name, type_model) in enumerate(entity_types.items())
+        ]
+        if entity_types is not None
+        else []
+    )
+
+    return entity_types_context
+
+
+def _entity_node(
+    extracted_entity: ExtractedEntity,
+    entity_types_context: list[dict[str, Any]],
+    episode: EpisodicNode,
+    excluded_entity_types: list[str] | None = None,
+) -> EntityNode | None:
+    type_id = extracted_entity.entity_type_id
+    if 0 <= type_id < len(entity_types_context):
+        entity_type_name = entity_types_context[extracted_entity.entity_type_id].get(
+            'entity_type_name'
+        )
+    else:
+        entity_type_name = 'Entity'
+
+    # Check if this entity type should be excluded
+    if excluded_entity_types and entity_type_name in excluded_entity_types:
+        logger.debug(f'Excluding entity "{extracted_entity.name}" of type "{entity_type_name}"')
+        return None
+
+    labels: list[str] = list({'Entity', str(entity_type_name)})
+
+    new_node = EntityNode(
+        name=extracted_entity.name,
+        group_id=episode.group_id,
+        labels=labels,
+        summary='',
+        created_at=utc_now(),
+    )
+    logger.debug(f'Created new node: {new_node.name} (UUID: {new_node.uuid})')
+    return new_node
+
+
 async def resolve_extracted_nodes(
     clients: GraphitiClients,
     extracted_nodes: list[EntityNode],
@@ -189,7 +288,6 @@ async def resolve_extracted_nodes(
     entity_types: dict[str, type[BaseModel]] | None = None,
     existing_nodes_override: list[EntityNode] | None = None,
 ) -> tuple[list[EntityNode], dict[str, str], list[tuple[EntityNode, EntityNode]]]:
-    llm_client = clients.llm_client
     driver = clients.driver
 
     search_results: list[SearchResults] = await semaphore_gather(
@@ -229,39 +327,48 @@ async def resolve_extracted_nodes(
         ],
     )
 
-    entity_types_dict: dict[str, type[BaseModel]] = entity_types if entity_types is not None else {}
-
-    # Prepare context for LLM
-    extracted_nodes_context = [
-        {
-            'id': i,
-            'name': node.name,
-            'entity_type': node.labels,
-            'entity_type_description': entity_types_dict.get(
-                next((item for item in node.labels if item != 'Entity'), '')
-            ).__doc__
-            or 'Default Entity Type',
-        }
-        for i, node in enumerate(extracted_nodes)
+    # Resolve obvious duplicates locally and send only the ambiguous nodes to the LLM
+    deterministic_resolutions = resolve_nodes_deterministically(extracted_nodes, existing_nodes)
+    unresolved = [i for i in range(len(extracted_nodes)) if i not in deterministic_resolutions]
+    if unresolved and existing_nodes and NODE_DEDUPE_COSINE_THRESHOLD < 1:
+        unresolved_nodes = [extracted_nodes[i] for i in unresolved]
+        await _load_name_embeddings(clients, unresolved_nodes, existing_nodes)
+        for k, resolution in resolve_nodes_deterministically(
+            unresolved_nodes, existing_nodes
+        ).items():
+            deterministic_resolutions[unresolved[k]] = resolution
+        unresolved = [i for i in unresolved if i not in deterministic_resolutions]
+
+    for _, stage in deterministic_resolutions.values():
+        node_dedupe_metrics.record(stage)
+
+    node_resolutions: list[NodeDuplicate] = [
+        NodeDuplicate(id=i, duplicate_idx=j, name=extracted_nodes[i].name, duplicates=[j])
+        for i, (j, _) in deterministic_resolutions.items()
     ]
+    if unresolved and existing_nodes:
+        node_dedupe_metrics.record('llm', len(unresolved))
+        node_resolutions += await _resolve_nodes_with_llm(
+            clients,
+            [extracted_nodes[i] for i in unresolved],
+            existing_nodes_context,
+            episode,
+            previous_episodes,
+            entity_types,
+            unresolved,
+        )
+    else:
+        # Without candidates every remaining node is new
+        node_resolutions += [
+            NodeDuplicate(id=i, duplicate_idx=-1, name=extracted_nodes[i].name, duplicates=[])
+            for i in unresolved
+        ]
+    node_resolutions.sort(key=lambda resolution: resolution.id)
 
-    context = {
-        'extracted_nodes': extracted_nodes_context,
-        'existing_nodes': existing_nodes_context,
-        'episode_content': episode.content if episode is not None else '',
-        'previous_episodes': [ep.content for ep in previous_episodes]
-        if previous_episodes is not None
-        else [],
-        'ensure_ascii': clients.ensure_ascii,
-    }
-
-    llm_response = await llm_client.generate_response(
-        prompt_library.dedupe_nodes.nodes(context),
-        response_model=NodeResolutions,
+    logger.debug(
+        f'Resolved {len(deterministic_resolutions)} of {len(extracted_nodes)} nodes without the LLM'
     )
 
-    node_resolutions: list[NodeDuplicate] = NodeResolutions(**llm_response).entity_resolutions
-
     resolved_nodes: list[EntityNode] = []
     uuid_map: dict[str, str] = {}
     node_duplicates: list[tuple[EntityNode, EntityNode]] = []
@@ -299,6 +406,68 @@ async def resolve_extracted_nodes(
     return resolved_nodes, uuid_map, new_node_duplicates
 
 
+async def _load_name_embeddings(
+    clients: GraphitiClients, extracted_nodes: list[EntityNode], existing_nodes: list[EntityNode]
+):
+    await create_entity_node_embeddings(
+        clients.embedder, [node for node in extracted_nodes if not node.name_embedding]
+    )
+
+    missing_nodes = [node for node in existing_nodes if not node.name_embedding]
+    if missing_nodes:
+        embeddings = await get_embeddings_for_nodes(clients.driver, missing_nodes)
+        for node in missing_nodes:
+            node.name_embedding = embeddings.get(node.uuid)
+
+
+async def _resolve_nodes_with_llm(
+    clients: GraphitiClients,
+    extracted_nodes: list[EntityNode],
+    existing_nodes_context: Any,
+    episode: EpisodicNode | None,
+    previous_episodes: list[EpisodicNode] | None,
+    entity_types: dict[str, type[BaseModel]] | None,
+    node_ids: list[int],
+) -> list[NodeDuplicate]:
+    """Resolve nodes with the dedupe_nodes prompt, returning resolutions keyed by node_ids."""
+    entity_types_dict: dict[str, type[BaseModel]] = entity_types if entity_types is not None else {}
+
+    # Prepare context for LLM
+    extracted_nodes_context = [
+        {
+            'id': i,
+            'name': node.name,
+            'entity_type': node.labels,
+            'entity_type_description': entity_types_dict.get(
+                next((item for item in node.labels if item != 'Entity'), '')
+            ).__doc__
+            or 'Default Entity Type',
+        }
+        for i, node in enumerate(extracted_nodes)
+    ]
+
+    context = {
+        'extracted_nodes': extracted_nodes_context,
+        'existing_nodes': existing_nodes_context,
+        'episode_content': episode.content if episode is not None else '',
+        'previous_episodes': previous_episodes_context(previous_episodes, 'dedupe_nodes', episode),
+        'ensure_ascii': clients.ensure_ascii,
+    }
+
+    llm_response = await clients.llm_client.generate_response(
+        prompt_library.dedupe_nodes.nodes(context),
+        response_model=NodeResolutions,
+    )
+
+    node_resolutions: list[NodeDuplicate] = NodeResolutions(**llm_response).entity_resolutions
+
+    return [
+        resolution.model_copy(update={'id': node_ids[resolution.id]})
+        for resolution in node_resolutions
+        if 0 <= resolution.id < len(node_ids)
+    ]
+
+
 async def extract_attributes_from_nodes(
     clients: GraphitiClients,
     nodes: list[EntityNode],
@@ -306,29 +475,161 @@ async def extract_attributes_from_nodes(
     previous_episodes: list[EpisodicNode] | None = None,
     entity_types: dict[str, type[BaseModel]] | None = None,
 ) -> list[EntityNode]:
+    """
+    Hydrate the summary and typed attributes of nodes.
+
+    Nodes are packed into batches under NODE_HYDRATION_TOKEN_BUDGET and each batch is hydrated
+    with a single LLM call. Nodes missing from a batch response, or whose attributes fail the
+    validation of their entity type, fall back to extract_attributes_from_node.
+    """
     llm_client = clients.llm_client
     embedder = clients.embedder
-    updated_nodes: list[EntityNode] = await semaphore_gather(
+
+    typed_nodes = [
+        (
+            node,
+            entity_types.get(next((item for item in node.labels if item != 'Entity'), ''))
+            if entity_types is not None
+            else None,
+        )
+        for node in nodes
+    ]
+
+    hydrated_batches: list[list[EntityNode]] = await semaphore_gather(
         *[
-            extract_attributes_from_node(
-                llm_client,
-                node,
-                episode,
-                previous_episodes,
-                entity_types.get(next((item for item in node.labels if item != 'Entity'), ''))
-                if entity_types is not None
-                else None,
-                clients.ensure_ascii,
+            _extract_attributes_from_node_batch(
+                llm_client, batch, episode, previous_episodes, clients.ensure_ascii
             )
-            for node in nodes
+            for batch in _node_hydration_batches(typed_nodes, NODE_HYDRATION_TOKEN_BUDGET)
         ]
     )
+    hydrated_nodes = {node.uuid: node for batch in hydrated_batches for node in batch}
+    updated_nodes = [hydrated_nodes[node.uuid] for node in nodes]
 
     await create_entity_node_embeddings(embedder, updated_nodes)
 
     return updated_nodes
 
 
+def _node_hydration_context(node: EntityNode) -> dict[str, Any]:
+    return {
+        'name': node.name,
+        'summary': node.summary,
+        'entity_types': node.labels,
+        'attributes': node.attributes,
+    }
+
+
+@lru_cache(maxsize=128)
+def _entity_hydration_model(entity_type: type[BaseModel] | None) -> type[BaseModel]:
+    if entity_type is None:
+        return EntitySummary
+
+    # Entity types may not declare a summary field, so it can sit next to the attributes
+    return create_model(
+        f'{entity_type.__name__}Hydration',
+        __base__=entity_type,
+        summary=(str, EntitySummary.model_fields['summary']),
+    )
+
+
+def _node_hydration_batches(
+    typed_nodes: list[tuple[EntityNode, type[BaseModel] | None]], token_budget: int
+) -> list[list[tuple[EntityNode, type[BaseModel] | None]]]:
+    """Greedily pack nodes into batches whose estimated prompt and output tokens fit the budget."""
+    batches: list[list[tuple[EntityNode, type[BaseModel] | None]]] = []
+    batch_tokens = 0
+    for node, entity_type in typed_nodes:
+        node_tokens = estimate_tokens(_node_hydration_context(node)) + SUMMARY_OUTPUT_TOKENS
+        if entity_type is not None:
+            node_tokens += estimate_tokens(entity_type.model_json_schema())
+
+        if not batches or batch_tokens + node_tokens > token_budget:
+            batches.append([])
+            batch_tokens = 0
+
+        batches[-1].append((node, entity_type))
+        batch_tokens += node_tokens
+
+    return batches
+
+
+async def _extract_attributes_from_node_batch(
+    llm_client: LLMClient,
+    batch: list[tuple[EntityNode, type[BaseModel] | None]],
+    episode: EpisodicNode | None = None,
+    previous_episodes: list[EpisodicNode] | None = None,
+    ensure_ascii: bool = False,
+) -> list[EntityNode]:
+    if len(batch) == 1 and batch[0][1] is None:
+        # An untyped node needs only its summary, which the single node prompt already does in one call
+        node, entity_type = batch[0]
+        return [
+            await extract_attributes_from_node(
+                llm_client, node, episode, previous_episodes, entity_type, ensure_ascii
+            )
+        ]
+
+    hydration_models = [_entity_hydration_model(entity_type) for _, entity_type in batch]
+    response_model = create_model(
+        'EntityHydrations',
+        **{f'entity_{i}': (model, ...) for i, model in enumerate(hydration_models)},  # type: ignore[call-overload]
+    )
+
+    context: dict[str, Any] = {
+        'entities': [
+            {'id': i, **_node_hydration_context(node)} for i, (node, _) in enumerate(batch)
+        ],
+        'episode_content': episode.content if episode is not None else '',
+        'previous_episodes': previous_episodes_context(
+            previous_episodes, 'extract_attributes', episode
+        ),
+        'ensure_ascii': ensure_ascii,
+    }
+
+    try:
+        llm_response = await llm_client.generate_response(
+            prompt_library.extract_nodes.extract_attributes_and_summaries(context),
+            response_model=response_model,
+            model_size=ModelSize.small,
+        )
+    except Exception as e:
+        logger.warning(f'Batched node hydration failed, hydrating nodes one by one: {e}')
+        llm_response = {}
+
+    fallback: list[tuple[EntityNode, type[BaseModel] | None]] = []
+    for i, (node, entity_type) in enumerate(batch):
+        hydration = llm_response.get(f'entity_{i}')
+        if not isinstance(hydration, dict):
+            fallback.append((node, entity_type))
+            continue
+
+        try:
+            validated = hydration_models[i].model_validate(hydration).model_dump(mode='json')
+        except ValidationError:
+            fallback.append((node, entity_type))
+            continue
+
+        node.summary = validated.get('summary', '')
+        if entity_type is not None:
+            node.attributes.update(
+                {key: value for key, value in validated.items() if key != 'summary'}
+            )
+
+    if fallback:
+        logger.debug(f'Hydrating {len(fallback)} of {len(batch)} nodes one by one')
+        await semaphore_gather(
+            *[
+                extract_attributes_from_node(
+                    llm_client, node, episode, previous_episodes, entity_type, ensure_ascii
+                )
+                for node, entity_type in fallback
+            ]
+        )
+
+    return [node for node, _ in batch]
+
+
 async def extract_attributes_from_node(
     llm_client: LLMClient,
     node: EntityNode,
@@ -347,18 +648,18 @@ async def extract_attributes_from_node(
     attributes_context: dict[str, Any] = {
         'node': node_context,
         'episode_content': episode.content if episode is not None else '',
-        'previous_episodes': [ep.content for ep in previous_episodes]
-        if previous_episodes is not None
-        else [],
+        'previous_episodes': previous_episodes_context(
+            previous_episodes, 'extract_attributes', episode
+        ),
         'ensure_ascii': ensure_ascii,
     }
 
     summary_context: dict[str, Any] = {
         'node': node_context,
         'episode_content': episode.content if episode is not None else '',
-        'previous_episodes': [ep.content for ep in previous_episodes]
-        if previous_episodes is not None
-        else [],
+        'previous_episodes': previous_episodes_context(
+            previous_episodes, 'extract_attributes', episode
+        ),
         'ensure_ascii': ensure_ascii,
     }
 
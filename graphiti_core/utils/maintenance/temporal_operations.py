@@ -26,6 +26,7 @@ from graphiti_core.prompts import prompt_library
 from graphiti_core.prompts.extract_edge_dates import EdgeDates
 from graphiti_core.prompts.invalidate_edges import InvalidatedEdges
 from graphiti_core.utils.datetime_utils import ensure_utc
+from graphiti_core.utils.prompt_context import previous_episodes_context
 
 logger = logging.getLogger(__name__)
 
@@ -40,7 +41,9 @@ async def extract_edge_dates(
     context = {
         'edge_fact': edge.fact,
         'current_episode': current_episode.content,
-        'previous_episodes': [ep.content for ep in previous_episodes],
+        'previous_episodes': previous_episodes_context(
+            previous_episodes, 'extract_edge_dates', current_episode
+        ),
         'reference_timestamp': current_episode.valid_at.isoformat(),
         'ensure_ascii': ensure_ascii,
     }
@@ -0,0 +1,83 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+
+from graphiti_core.nodes import EpisodicNode
+from graphiti_core.prompts.prompt_helpers import estimate_tokens
+
+DEFAULT_PREVIOUS_EPISODES_TOKEN_BUDGET = int(os.getenv('PREVIOUS_EPISODES_TOKEN_BUDGET', 2000))
+
+# Token budget of the previous episodes context, per prompt type. Extraction prompts need the most
+# history to resolve references; dedupe and attribute prompts are sent once per node or edge.
+PREVIOUS_EPISODES_TOKEN_BUDGETS: dict[str, int] = {
+    'extract_nodes': DEFAULT_PREVIOUS_EPISODES_TOKEN_BUDGET,
+    'extract_edges': DEFAULT_PREVIOUS_EPISODES_TOKEN_BUDGET,
+    'dedupe_nodes': DEFAULT_PREVIOUS_EPISODES_TOKEN_BUDGET // 2,
+    'extract_attributes': DEFAULT_PREVIOUS_EPISODES_TOKEN_BUDGET // 2,
+    'extract_edge_dates': DEFAULT_PREVIOUS_EPISODES_TOKEN_BUDGET // 2,
+}
+
+# Older episodes are only truncated when at least this many tokens of the budget are left
+MIN_TRUNCATED_EPISODE_TOKENS = 50
+TRUNCATION_MARKER = '...'
+
+
+def previous_episodes_context(
+    previous_episodes: list[EpisodicNode] | None,
+    prompt_type: str,
+    current_episode: EpisodicNode | None = None,
+) -> list[str]:
+    """
+    Contents of the previous episodes to include in a prompt, in chronological order.
+
+    Episodes are added from the most recent back until the token budget of the prompt type is
+    spent; the oldest episode that does not fit is cut to the remaining budget, keeping its end.
+    Episodes repeating the content of the current episode or of a more recent one are skipped.
+    """
+    if not previous_episodes:
+        return []
+
+    token_budget = PREVIOUS_EPISODES_TOKEN_BUDGETS.get(
+        prompt_type, DEFAULT_PREVIOUS_EPISODES_TOKEN_BUDGET
+    )
+
+    seen: set[str] = set()
+    if current_episode is not None:
+        seen.add(' '.join(current_episode.content.split()))
+
+    contents: list[str] = []
+    newest_first = sorted(
+        enumerate(previous_episodes), key=lambda item: (item[1].valid_at, item[0]), reverse=True
+    )
+    for _, episode in newest_first:
+        normalized = ' '.join(episode.content.split())
+        if normalized in seen:
+            continue
+        seen.add(normalized)
+
+        tokens = estimate_tokens(episode.content)
+        if tokens <= token_budget:
+            contents.append(episode.content)
+            token_budget -= tokens
+            continue
+
+        if token_budget >= MIN_TRUNCATED_EPISODE_TOKENS:
+            # estimate_tokens counts about four characters per token
+            contents.append(TRUNCATION_MARKER + episode.content[-(token_budget - 1) * 4 :])
+        break
+
+    return list(reversed(contents))
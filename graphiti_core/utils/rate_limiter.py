@@ -0,0 +1,342 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import heapq
+import logging
+import os
+from collections.abc import AsyncIterator, Callable, Mapping
+from contextlib import asynccontextmanager, contextmanager, suppress
+from contextvars import ContextVar
+from enum import IntEnum
+from functools import wraps
+from itertools import count
+from time import monotonic
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMITER_MAX_CONCURRENCY = int(
+    os.getenv('RATE_LIMITER_MAX_CONCURRENCY', os.getenv('SEMAPHORE_LIMIT', 20))
+)
+# Pause after a rate limit error that does not say how long to wait
+DEFAULT_RETRY_AFTER = 1.0
+
+
+class Priority(IntEnum):
+    """Scheduling priority of provider requests; lower values are served first."""
+
+    search = 0
+    ingestion = 1
+
+
+_priority: ContextVar[Priority] = ContextVar('rate_limiter_priority', default=Priority.ingestion)
+# Limiters whose slot the current task already holds, so nested calls do not queue twice
+_held_limiters: ContextVar[frozenset[int]] = ContextVar('rate_limiter_held', default=frozenset())
+
+
+@contextmanager
+def request_priority(priority: Priority):
+    """Schedule the provider requests made inside the block, and in tasks it starts, at priority."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def with_priority(priority: Priority) -> Callable[[Callable], Callable]:
+    """Decorate an async function so that its provider requests are scheduled at priority."""
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with request_priority(priority):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class TokenBucket:
+    """Token bucket refilled at a per minute rate; a rate of None never limits."""
+
+    def __init__(self, per_minute: float | None = None):
+        self.per_minute = per_minute
+        self._tokens = per_minute or 0.0
+        self._updated_at = monotonic()
+
+    def set_rate(self, per_minute: float | None):
+        self._refill()
+        # A bucket that was not limiting starts full
+        if self.per_minute is None:
+            self._tokens = per_minute or 0.0
+        self.per_minute = per_minute
+        if per_minute is not None:
+            self._tokens = min(self._tokens, per_minute)
+
+    def _refill(self):
+        now = monotonic()
+        if self.per_minute is not None:
+            self._tokens = min(
+                self.per_minute, self._tokens + (now - self._updated_at) * self.per_minute / 60
+            )
+        self._updated_at = now
+
+    def delay(self, tokens: float) -> float:
+        """Seconds until tokens are available; requests larger than the bucket wait for a full one."""
+        if self.per_minute is None:
+            return 0.0
+
+        self._refill()
+        missing = min(tokens, self.per_minute) - self._tokens
+        return max(0.0, missing * 60 / self.per_minute)
+
+    def consume(self, tokens: float):
+        if self.per_minute is not None:
+            self._refill()
+            self._tokens -= min(tokens, self.per_minute)
+
+
+class RateLimiter:
+    """
+    Scheduler for the requests of one provider client.
+
+    Requests wait in priority order for a concurrency slot and for the request and token buckets.
+    Concurrency follows AIMD: it grows by one slot per window of successful requests up to
+    max_concurrency, and halves on a rate limit error, which also pauses the limiter for the
+    retry-after delay and updates the bucket rates from the rate limit headers, if any.
+    """
+
+    def __init__(
+        self,
+        name: str = '',
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+        max_concurrency: int = RATE_LIMITER_MAX_CONCURRENCY,
+    ):
+        if max_concurrency < 1:
+            raise ValueError(f'max_concurrency must be at least 1, got: {max_concurrency}')
+
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.concurrency: float = max_concurrency
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.rate_limited = 0
+        self.in_flight = 0
+
+        self._paused_until = 0.0
+        self._queue: list[tuple[int, int]] = []
+        self._sequence = count()
+        self._condition: asyncio.Condition | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._queue)
+
+    def set_limits(
+        self, requests_per_minute: float | None = None, tokens_per_minute: float | None = None
+    ):
+        self.requests.set_rate(requests_per_minute)
+        self.tokens.set_rate(tokens_per_minute)
+
+    def _get_condition(self) -> asyncio.Condition:
+        # Limiters are shared per provider, so they may outlive the event loop they were used on
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+            self._queue = []
+            self.in_flight = 0
+        return self._condition
+
+    def _delay(self, tokens: float) -> float:
+        return max(
+            self._paused_until - monotonic(), self.requests.delay(1), self.tokens.delay(tokens)
+        )
+
+    async def _wait_turn(self, tokens: float, priority: Priority):
+        condition = self._get_condition()
+        entry = (int(priority), next(self._sequence))
+        async with condition:
+            heapq.heappush(self._queue, entry)
+            try:
+                while True:
+                    timeout = None
+                    if self._queue[0] == entry and self.in_flight < int(self.concurrency):
+                        timeout = self._delay(tokens)
+                        if timeout <= 0:
+                            break
+                    with suppress(asyncio.TimeoutError):
+                        await asyncio.wait_for(condition.wait(), timeout)
+            except BaseException:
+                self._queue.remove(entry)
+                heapq.heapify(self._queue)
+                condition.notify_all()
+                raise
+
+            heapq.heappop(self._queue)
+            self.requests.consume(1)
+            self.tokens.consume(tokens)
+            self.in_flight += 1
+            condition.notify_all()
+
+    async def _release(self):
+        condition = self._get_condition()
+        async with condition:
+            self.in_flight = max(0, self.in_flight - 1)
+            condition.notify_all()
+
+    def on_success(self):
+        if self.concurrency < self.max_concurrency:
+            self.concurrency = min(self.max_concurrency, self.concurrency + 1 / self.concurrency)
+
+    def on_rate_limited(self, error: BaseException):
+        self.rate_limited += 1
+        self.concurrency = max(1.0, self.concurrency / 2)
+
+        headers = _rate_limit_headers(error)
+        self._update_limits(headers)
+
+        retry_after = _retry_after(headers)
+        self._paused_until = max(self._paused_until, monotonic() + retry_after)
+        logger.warning(
+            f'{self.name} rate limited, pausing for {retry_after:.1f}s with concurrency '
+            f'{int(self.concurrency)}'
+        )
+
+    def _update_limits(self, headers: Mapping[str, str]):
+        requests_limit = _header_number(
+            headers, 'x-ratelimit-limit-requests', 'anthropic-ratelimit-requests-limit'
+        )
+        tokens_limit = _header_number(
+            headers, 'x-ratelimit-limit-tokens', 'anthropic-ratelimit-tokens-limit'
+        )
+        if requests_limit is not None:
+            self.requests.set_rate(requests_limit)
+        if tokens_limit is not None:
+            self.tokens.set_rate(tokens_limit)
+
+    @asynccontextmanager
+    async def acquire(
+        self, tokens: float = 1, priority: Priority | None = None
+    ) -> AsyncIterator[None]:
+        held = _held_limiters.get()
+        if id(self) in held:
+            yield
+            return
+
+        await self._wait_turn(tokens, priority if priority is not None else _priority.get())
+        held_token = _held_limiters.set(held | {id(self)})
+        try:
+            yield
+        except Exception as e:
+            if is_rate_limit_error(e):
+                self.on_rate_limited(e)
+            raise
+        else:
+            self.on_success()
+        finally:
+            _held_limiters.reset(held_token)
+            await self._release()
+
+
+_rate_limiters: dict[str, RateLimiter] = {}
+
+
+def get_rate_limiter(name: str) -> RateLimiter:
+    """Shared rate limiter of a provider client, created on first use."""
+    rate_limiter = _rate_limiters.get(name)
+    if rate_limiter is None:
+        rate_limiter = _rate_limiters[name] = RateLimiter(name)
+    return rate_limiter
+
+
+def _rate_limiter_name(client: Any) -> str:
+    """Name of the shared limiter of a client: its class, and its endpoint when it has one."""
+    base_url = getattr(getattr(client, 'config', None), 'base_url', None) or getattr(
+        getattr(client, 'client', None), 'base_url', None
+    )
+    name = type(client).__name__
+    return f'{name}:{base_url}' if base_url else name
+
+
+def rate_limited(method: Callable, estimate_tokens: Callable[..., float]) -> Callable:
+    """
+    Wrap a provider method so that every call goes through the client's rate_limiter, or the
+    limiter shared by the clients of its class that call the same endpoint when it has none.
+    """
+
+    @wraps(method)
+    async def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+        rate_limiter = getattr(self, 'rate_limiter', None) or get_rate_limiter(
+            _rate_limiter_name(self)
+        )
+        async with rate_limiter.acquire(estimate_tokens(*args, **kwargs)):
+            return await method(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _error_chain(error: BaseException) -> list[BaseException]:
+    chain: list[BaseException] = []
+    current: BaseException | None = error
+    while current is not None and current not in chain:
+        chain.append(current)
+        current = current.__cause__ or current.__context__
+    return chain
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    for e in _error_chain(error):
+        status = getattr(getattr(e, 'response', None), 'status_code', None)
+        if (
+            type(e).__name__ == 'RateLimitError'
+            or getattr(e, 'status_code', None) == 429
+            or getattr(e, 'code', None) == 429
+            or status == 429
+        ):
+            return True
+    return False
+
+
+def _rate_limit_headers(error: BaseException) -> Mapping[str, str]:
+    for e in _error_chain(error):
+        headers = getattr(getattr(e, 'response', None), 'headers', None)
+        if isinstance(headers, Mapping):
+            return headers
+    return {}
+
+
+def _header_number(headers: Mapping[str, str], *names: str) -> float | None:
+    for name in names:
+        try:
+            return float(headers[name])
+        except (KeyError, TypeError, ValueError):
+            continue
+    return None
+
+
+def _retry_after(headers: Mapping[str, str]) -> float:
+    retry_after_ms = _header_number(headers, 'retry-after-ms')
+    if retry_after_ms is not None:
+        return retry_after_ms / 1000
+
+    retry_after = _header_number(headers, 'retry-after')
+    return retry_after if retry_after is not None else DEFAULT_RETRY_AFTER
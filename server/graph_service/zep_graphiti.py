@@ -47,14 +47,13 @@ class ZepGraphiti(Graphiti):
 
         episodes = await EpisodicNode.get_by_group_ids(self.driver, [group_id])
 
-        for edge in edges:
-            await edge.delete(self.driver)
-
-        for node in nodes:
-            await node.delete(self.driver)
+        # Delete in bulk rather than one round-trip per edge/node/episode
+        if edges:
+            await EntityEdge.delete_by_uuids(self.driver, [edge.uuid for edge in edges])
 
-        for episode in episodes:
-            await episode.delete(self.driver)
+        node_uuids = [node.uuid for node in nodes] + [episode.uuid for episode in episodes]
+        if node_uuids:
+            await EntityNode.delete_by_uuids(self.driver, node_uuids)
 
     async def delete_entity_edge(self, uuid: str):
         try:
@@ -234,6 +234,39 @@ class TestFalkorDBConfig:
 
         assert kwargs == {'host': 'test-host', 'port': 8080}
 
+    @unittest.skipIf(not HAS_FALKORDB, 'FalkorDB is not installed')
+    def test_get_client_kwargs_with_pool_size(self):
+        """Test get_client_kwargs passes the connection pool size through."""
+        config = FalkorDBConfig(host='test-host', port=8080, max_connections=32)
+
+        kwargs = config.get_client_kwargs()
+
+        assert kwargs == {'host': 'test-host', 'port': 8080, 'max_connections': 32}
+
+    @unittest.skipIf(not HAS_FALKORDB, 'FalkorDB is not installed')
+    def test_max_connections_must_be_positive(self):
+        """Test that a non-positive pool size is rejected."""
+        with pytest.raises(ValueError):
+            FalkorDBConfig(max_connections=0)
+
+    @unittest.skipIf(not HAS_FALKORDB, 'FalkorDB is not installed')
+    @patch.dict(
+        os.environ,
+        {
+            'FALKORDB_CONNECTION_STRING': 'redis://remote-host:8000/5',
+            'FALKORDB_MAX_CONNECTIONS': '64',
+            'FALKORDB_AUTO_PIPELINE': 'true',
+        },
+        clear=True,
+    )
+    def test_from_env_pool_settings(self):
+        """Test pool settings are read from the environment alongside a connection string."""
+        config = FalkorDBConfig.from_env()
+
+        assert config.host == 'remote-host'
+        assert config.max_connections == 64
+        assert config.auto_pipeline is True
+
     @unittest.skipIf(not HAS_FALKORDB, 'FalkorDB is not installed')
     def test_get_database_name(self):
         """Test get_database_name method."""
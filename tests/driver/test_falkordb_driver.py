@@ -14,6 +14,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import asyncio
 import os
 import unittest
 from datetime import datetime, timezone
@@ -97,6 +98,51 @@ class TestFalkorDriver:
         self.mock_client.select_graph.assert_called_once_with('default_db')
         assert result is mock_graph
 
+    @unittest.skipIf(not HAS_FALKORDB, 'FalkorDB is not installed')
+    def test_get_graph_caches_handles(self):
+        """Test _get_graph selects each graph only once."""
+        self.mock_client.select_graph.side_effect = lambda name: MagicMock(name=name)
+
+        first = self.driver._get_graph('test_graph')
+        second = self.driver._get_graph('test_graph')
+        other = self.driver._get_graph('other_graph')
+
+        assert first is second
+        assert other is not first
+        assert self.mock_client.select_graph.call_count == 2
+
+    @pytest.mark.asyncio
+    @unittest.skipIf(not HAS_FALKORDB, 'FalkorDB is not installed')
+    async def test_auto_pipeline_coalesces_concurrent_queries(self):
+        """Test concurrently issued queries share a single Redis pipeline."""
+        mock_falkor_db = MagicMock()
+        mock_graph = MagicMock()
+        mock_graph.name = 'default_db'
+        mock_graph._build_params_header.side_effect = lambda params: ''
+        mock_falkor_db.select_graph.return_value = mock_graph
+
+        mock_pipeline = MagicMock()
+        mock_pipeline.execute = AsyncMock(return_value=['response1', 'response2'])
+        mock_falkor_db.connection.pipeline.return_value = mock_pipeline
+
+        driver = FalkorDriver(falkor_db=mock_falkor_db, auto_pipeline=True)
+
+        mock_result = MagicMock()
+        mock_result.header = [('col1', 'count')]
+        mock_result.result_set = [[1]]
+        mock_result.parse = AsyncMock()
+
+        with patch('graphiti_core.driver.falkordb_driver.QueryResult', return_value=mock_result):
+            results = await asyncio.gather(
+                driver.execute_query('MATCH (n:Entity) RETURN count(n) AS count'),
+                driver.execute_query('MATCH (n:Episodic) RETURN count(n) AS count'),
+            )
+
+        mock_falkor_db.connection.pipeline.assert_called_once_with(transaction=False)
+        assert mock_pipeline.execute_command.call_count == 2
+        mock_graph.query.assert_not_called()
+        assert [records for records, _, _ in results] == [[{'count': 1}], [{'count': 1}]]
+
     @pytest.mark.asyncio
     @unittest.skipIf(not HAS_FALKORDB, 'FalkorDB is not installed')
     async def test_execute_query_success(self):
@@ -117,6 +163,55 @@ class TestFalkorDriver:
         assert header == ['column1', 'column2']
         assert summary is None
 
+    @pytest.mark.asyncio
+    @unittest.skipIf(not HAS_FALKORDB, 'FalkorDB is not installed')
+    async def test_execute_batch_uses_single_pipeline(self):
+        """Test that execute_batch sends all statements through one Redis pipeline."""
+        mock_graph = MagicMock()
+        mock_graph.name = 'default_db'
+        mock_graph._build_params_header.side_effect = lambda params: ''
+        self.mock_client.select_graph.return_value = mock_graph
+
+        mock_pipeline = MagicMock()
+        mock_pipeline.execute = AsyncMock(return_value=['response1', 'response2'])
+        self.mock_client.connection.pipeline.return_value = mock_pipeline
+
+        mock_result = MagicMock()
+        mock_result.header = [('col1', 'count')]
+        mock_result.result_set = [[1]]
+        mock_result.parse = AsyncMock()
+
+        with patch(
+            'graphiti_core.driver.falkordb_driver.QueryResult', return_value=mock_result
+        ) as mock_query_result:
+            results = await self.driver.execute_batch(
+                [
+                    ('MATCH (n) RETURN count(n) AS count', {}),
+                    ('MATCH (n {uuid: $uuid}) RETURN count(n) AS count', {'uuid': '1'}),
+                ]
+            )
+
+        self.mock_client.connection.pipeline.assert_called_once_with(transaction=False)
+        assert mock_pipeline.execute_command.call_count == 2
+        mock_pipeline.execute.assert_awaited_once()
+        assert mock_query_result.call_count == 2
+        assert results == [[{'count': 1}], [{'count': 1}]]
+
+    @pytest.mark.asyncio
+    @unittest.skipIf(not HAS_FALKORDB, 'FalkorDB is not installed')
+    async def test_execute_batch_raises_pipeline_errors(self):
+        """Test that a failed statement in the pipeline is raised to the caller."""
+        mock_graph = MagicMock()
+        mock_graph._build_params_header.side_effect = lambda params: ''
+        self.mock_client.select_graph.return_value = mock_graph
+
+        mock_pipeline = MagicMock()
+        mock_pipeline.execute = AsyncMock(return_value=[ValueError('boom')])
+        self.mock_client.connection.pipeline.return_value = mock_pipeline
+
+        with pytest.raises(ValueError, match='boom'):
+            await self.driver.execute_batch([('MATCH (n) RETURN n', {})])
+
     @pytest.mark.asyncio
     @unittest.skipIf(not HAS_FALKORDB, 'FalkorDB is not installed')
     async def test_execute_query_handles_index_already_exists_error(self):
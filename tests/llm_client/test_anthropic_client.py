@@ -128,6 +128,31 @@ class TestAnthropicClientGenerateResponse:
         assert result['test_field'] == 'test_value'
         mock_async_anthropic.messages.create.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_system_prompt_is_cached(self, anthropic_client, mock_async_anthropic):
+        """Test that the system prompt is marked cacheable and cache reads are counted."""
+        content_item = MagicMock()
+        content_item.type = 'tool_use'
+        content_item.input = {'test_field': 'test_value'}
+
+        mock_response = MagicMock()
+        mock_response.content = [content_item]
+        mock_response.usage.input_tokens = 100
+        mock_response.usage.cache_read_input_tokens = 300
+        mock_response.usage.cache_creation_input_tokens = 0
+        mock_async_anthropic.messages.create.return_value = mock_response
+
+        messages = [
+            Message(role='system', content='System message'),
+            Message(role='user', content='User message'),
+        ]
+        await anthropic_client.generate_response(messages=messages, response_model=ResponseModel)
+
+        system = mock_async_anthropic.messages.create.call_args.kwargs['system']
+        assert system[0]['cache_control'] == {'type': 'ephemeral'}
+        assert system[0]['text'].startswith('System message')
+        assert anthropic_client.prompt_cache_stats.hit_rate == 0.75
+
     @pytest.mark.asyncio
     async def test_generate_response_with_text_response(
         self, anthropic_client, mock_async_anthropic
@@ -14,8 +14,16 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from graphiti_core.llm_client.client import LLMClient
+from time import monotonic
+from types import SimpleNamespace
+
+import pytest
+
+from graphiti_core.llm_client.client import LLMClient, PromptCacheStats
 from graphiti_core.llm_client.config import LLMConfig
+from graphiti_core.llm_client.errors import RateLimitError
+from graphiti_core.prompts.models import Message
+from graphiti_core.utils.rate_limiter import RateLimiter
 
 
 class MockLLMClient(LLMClient):
@@ -55,3 +63,47 @@ def test_clean_input():
 
     for input_str, expected in test_cases:
         assert client._clean_input(input_str) == expected, f'Failed for input: {repr(input_str)}'
+
+
+def test_prompt_cache_stats():
+    stats = PromptCacheStats()
+    assert stats.hit_rate == 0.0
+
+    stats.record(1000)
+    stats.record(1000, cached_tokens=500)
+
+    assert stats.hit_rate == 0.25
+    assert stats.request_hit_rate == 0.5
+
+    stats.reset()
+    assert (stats.requests, stats.input_tokens) == (0, 0)
+
+
+class ProviderRateLimitError(Exception):
+    def __init__(self, headers: dict[str, str]):
+        super().__init__('rate limited')
+        self.response = SimpleNamespace(status_code=429, headers=headers)
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_errors_retry_after_the_rate_limiter_pause():
+    class RateLimitedClient(LLMClient):
+        calls = 0
+
+        async def _generate_response(self, messages, response_model=None, *args, **kwargs):
+            RateLimitedClient.calls += 1
+            if RateLimitedClient.calls == 1:
+                raise RateLimitError() from ProviderRateLimitError({'retry-after': '0.1'})
+            return {'content': 'test'}
+
+    client = RateLimitedClient(LLMConfig())
+    client.rate_limiter = RateLimiter('test')
+
+    started_at = monotonic()
+    response = await client.generate_response([Message(role='system', content='test')])
+
+    assert response == {'content': 'test'}
+    assert RateLimitedClient.calls == 2
+    assert client.rate_limiter.rate_limited == 1
+    # Only the retry-after pause is waited, not the exponential backoff of server errors
+    assert 0.1 <= monotonic() - started_at < 1
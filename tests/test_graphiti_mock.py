@@ -450,6 +450,68 @@ async def test_remove_episode(
     assert edge_count == 3
 
 
+@pytest.mark.asyncio
+async def test_remove_episode_updates_mention_counts(graph_driver, mock_embedder):
+    if graph_driver.provider == GraphProvider.KUZU:
+        pytest.skip('Kuzu has no mention_count column')
+
+    now = datetime.now()
+    episodes = [
+        EpisodicNode(
+            name=f'test_episode_{i}',
+            group_id=group_id,
+            labels=[],
+            created_at=now,
+            source=EpisodeType.message,
+            source_description='conversation message',
+            content='Alice is here',
+            valid_at=now,
+        )
+        for i in range(2)
+    ]
+    alice_node = EntityNode(
+        name='Alice',
+        group_id=group_id,
+        labels=['Entity'],
+        created_at=now,
+        summary='Alice summary',
+    )
+    await alice_node.generate_name_embedding(mock_embedder)
+    episodic_edges = [
+        EpisodicEdge(
+            source_node_uuid=episode.uuid,
+            target_node_uuid=alice_node.uuid,
+            created_at=now,
+            group_id=group_id,
+        )
+        for episode in episodes
+    ]
+
+    await add_nodes_and_edges_bulk(
+        graph_driver, episodes, episodic_edges, [alice_node], [], mock_embedder
+    )
+
+    async def get_mention_count() -> int:
+        records, _, _ = await graph_driver.execute_query(
+            """
+            MATCH (n:Entity {uuid: $uuid})
+            RETURN n.mention_count AS mention_count
+            """,
+            uuid=alice_node.uuid,
+        )
+        return records[0]['mention_count']
+
+    assert await get_mention_count() == 2
+
+    await episodes[0].delete(graph_driver)
+    assert await get_mention_count() == 1
+
+    await EpisodicNode.delete_by_uuids(graph_driver, [episodes[1].uuid])
+    assert await get_mention_count() == 0
+
+    await alice_node.delete(graph_driver)
+
+
 @pytest.mark.asyncio
 async def test_graphiti_retrieve_episodes(
     graph_driver, mock_llm_client, mock_embedder, mock_cross_encoder_client
@@ -1982,7 +2044,7 @@ async def test_episode_mentions_reranker(graph_driver, mock_embedder):
     uuid_to_name = {entity_node_1.uuid: entity_node_1.name, entity_node_2.uuid: entity_node_2.name}
     names = [uuid_to_name[uuid] for uuid in reranked_uuids]
     assert names == [entity_node_1.name, entity_node_2.name]
-    assert np.allclose(reranked_scores, [1.0, float('inf')])
+    assert np.allclose(reranked_scores, [1.0, 0.0])
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,52 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from graphiti_core.driver.driver import GraphProvider
+from graphiti_core.nodes import EntityNode, EpisodicNode
+
+
+def _mock_driver() -> MagicMock:
+    driver = MagicMock()
+    driver.provider = GraphProvider.FALKORDB
+    driver.search_cache = None
+    driver.execute_batch = AsyncMock()
+    driver.execute_query = AsyncMock(return_value=([{'uuid': 'alice'}], None, None))
+    return driver
+
+
+@pytest.mark.asyncio
+async def test_deleting_entities_does_not_look_up_mentions():
+    driver = _mock_driver()
+
+    await EntityNode.delete_by_uuids(driver, ['alice'])
+
+    driver.execute_batch.assert_awaited_once()
+    driver.execute_query.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_deleting_episodes_updates_mention_counts():
+    driver = _mock_driver()
+
+    await EpisodicNode.delete_by_uuids(driver, ['episode'])
+
+    lookup, update = driver.execute_query.await_args_list
+    assert lookup.kwargs['episode_uuids'] == ['episode']
+    assert update.kwargs['node_uuids'] == ['alice']
@@ -1,10 +1,13 @@
 from datetime import datetime, timedelta, timezone
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from graphiti_core.edges import EntityEdge
 from graphiti_core.nodes import EpisodicNode
+from graphiti_core.prompts.dedupe_edges import EdgeResolutions
+from graphiti_core.utils.maintenance.dedupe_helpers import edge_dedupe_metrics
+from graphiti_core.utils.maintenance.edge_operations import resolve_extracted_edges_batched
 
 
 @pytest.fixture
@@ -89,6 +92,89 @@ def mock_previous_episodes():
     ]
 
 
+def _edge(uuid: str, fact: str) -> EntityEdge:
+    return EntityEdge(
+        uuid=uuid,
+        source_node_uuid='source_uuid',
+        target_node_uuid='target_uuid',
+        name='test_edge',
+        group_id='group_1',
+        fact=fact,
+        episodes=[],
+        created_at=datetime.now(timezone.utc),
+    )
+
+
+@pytest.mark.asyncio
+async def test_edges_are_resolved_in_one_call(mock_llm_client, mock_current_episode):
+    duplicated = _edge('new_1', 'Alice and Bob know each other')
+    unresolved = _edge('new_2', 'Alice likes Carol')
+    unrelated = _edge('new_3', 'Dave lives in Paris')
+    existing = _edge('existing', 'Alice knows Bob')
+
+    async def generate_response(messages, response_model=None, **kwargs):
+        if response_model is EdgeResolutions:
+            # The resolution of the second edge is missing
+            return {
+                'edge_resolutions': [
+                    {
+                        'id': 0,
+                        'duplicate_facts': [0],
+                        'contradicted_facts': [],
+                        'fact_type': 'DEFAULT',
+                    }
+                ]
+            }
+        return {'duplicate_facts': [], 'contradicted_facts': [], 'fact_type': 'DEFAULT'}
+
+    mock_llm_client.generate_response = AsyncMock(side_effect=generate_response)
+
+    results = await resolve_extracted_edges_batched(
+        mock_llm_client,
+        [
+            (duplicated, [existing], [], {}),
+            (unrelated, [], [], {}),
+            (unresolved, [existing], [], {}),
+        ],
+        mock_current_episode,
+    )
+
+    # One batched call, then a single edge call for the edge missing from the response
+    assert mock_llm_client.generate_response.await_count == 2
+    assert [resolved.uuid for resolved, _, _ in results] == ['existing', 'new_3', 'new_2']
+    assert existing.episodes == ['episode_1']
+    assert results[0][2] == [existing]
+
+
+@pytest.mark.asyncio
+async def test_repeated_facts_skip_the_llm(mock_llm_client, mock_current_episode):
+    existing = _edge('existing', 'Alice knows Bob.')
+    similar = _edge('similar', 'Alice is friends with Bob')
+    similar.fact_embedding = [1.0, 0.0]
+    reversed_edge = _edge('reversed', 'alice knows bob')
+    reversed_edge.source_node_uuid, reversed_edge.target_node_uuid = 'target_uuid', 'source_uuid'
+
+    repeated = _edge('new_1', '  alice KNOWS bob ')
+    near_repeat = _edge('new_2', 'Alice is a friend of Bob')
+    near_repeat.fact_embedding = [0.999, 0.01]
+    mock_llm_client.generate_response = AsyncMock()
+    edge_dedupe_metrics.reset()
+
+    results = await resolve_extracted_edges_batched(
+        mock_llm_client,
+        [
+            (repeated, [reversed_edge, existing], [], {}),
+            (near_repeat, [similar], [], {}),
+        ],
+        mock_current_episode,
+    )
+
+    mock_llm_client.generate_response.assert_not_called()
+    assert [resolved.uuid for resolved, _, _ in results] == ['existing', 'similar']
+    assert existing.episodes == similar.episodes == ['episode_1']
+    assert edge_dedupe_metrics.counts == {'exact': 1, 'cosine': 1}
+
+
 # Run the tests
 if __name__ == '__main__':
     pytest.main([__file__])
@@ -0,0 +1,91 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from graphiti_core.driver.driver import GraphProvider
+from graphiti_core.utils.maintenance.graph_data_operations import (
+    DYNAMIC_INDEX_SCHEMA_VERSION,
+    build_dynamic_indexes,
+    ensure_dynamic_indexes,
+)
+
+
+def _mock_driver(provider: GraphProvider = GraphProvider.NEO4J) -> MagicMock:
+    driver = MagicMock()
+    driver.provider = provider
+    driver.execute_query = AsyncMock(return_value=([], None, None))
+    return driver
+
+
+@pytest.mark.asyncio
+async def test_ensure_dynamic_indexes_provisions_each_group_once():
+    driver = _mock_driver()
+
+    first = ensure_dynamic_indexes(driver, 'group-1', persist=False)
+    second = ensure_dynamic_indexes(driver, 'group-1', persist=False)
+    assert first is second
+    await first
+
+    ensure_dynamic_indexes(driver, 'group-1', persist=False)
+    assert driver.execute_query.call_count == 4
+
+    other = ensure_dynamic_indexes(driver, 'group-2', persist=False)
+    assert other is not first
+    await other
+    assert driver.execute_query.call_count == 8
+
+
+@pytest.mark.asyncio
+async def test_ensure_dynamic_indexes_retries_after_failure():
+    driver = _mock_driver()
+    driver.execute_query.side_effect = Exception('boom')
+
+    failed = ensure_dynamic_indexes(driver, 'group', persist=False)
+    with pytest.raises(Exception, match='boom'):
+        await failed
+
+    driver.execute_query.side_effect = None
+    retried = ensure_dynamic_indexes(driver, 'group', persist=False)
+    assert retried is not failed
+    await retried
+
+
+def test_ensure_dynamic_indexes_skips_other_providers():
+    driver = _mock_driver(GraphProvider.KUZU)
+
+    assert ensure_dynamic_indexes(driver, 'group') is None
+    driver.execute_query.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_build_dynamic_indexes_skips_current_persisted_version():
+    driver = _mock_driver()
+    driver.execute_query.return_value = (
+        [{'schema_version': DYNAMIC_INDEX_SCHEMA_VERSION, 'embedding_dim': 768}],
+        None,
+        None,
+    )
+
+    await build_dynamic_indexes(driver, 'group', persist=True, embedding_dim=768)
+
+    # Only the schema version lookup is issued
+    driver.execute_query.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_dynamic_vector_index_uses_the_embedding_dimension():
+    driver = _mock_driver()
+    driver.execute_query.return_value = (
+        [{'schema_version': DYNAMIC_INDEX_SCHEMA_VERSION, 'embedding_dim': 1024}],
+        None,
+        None,
+    )
+
+    await ensure_dynamic_indexes(driver, 'group', persist=True, embedding_dim=768)
+
+    # Indices persisted for another dimension are recreated
+    queries = [call.args[0] for call in driver.execute_query.call_args_list]
+    assert any(query.startswith('DROP INDEX') for query in queries)
+    vector_index_query = next(query for query in queries if 'CREATE VECTOR INDEX' in query)
+    assert '`vector.dimensions`: 768,' in vector_index_query
+    assert driver.execute_query.call_args.kwargs['embedding_dim'] == 768
@@ -0,0 +1,224 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pydantic import BaseModel, Field
+
+from graphiti_core.nodes import EntityNode, EpisodeType, EpisodicNode
+from graphiti_core.search.search_config import SearchResults
+from graphiti_core.utils.datetime_utils import utc_now
+from graphiti_core.utils.maintenance.dedupe_helpers import (
+    node_dedupe_metrics,
+    resolve_nodes_deterministically,
+)
+from graphiti_core.utils.maintenance.node_operations import (
+    _node_hydration_batches,
+    extract_attributes_from_nodes,
+    extract_nodes_and_edges,
+    resolve_extracted_nodes,
+)
+
+
+class Person(BaseModel):
+    """A human person."""
+
+    age: int = Field(..., description='age of the person')
+
+
+def _clients(generate_response):
+    clients = MagicMock()
+    clients.ensure_ascii = False
+    clients.llm_client.generate_response = AsyncMock(side_effect=generate_response)
+    clients.embedder.create_batch = AsyncMock(side_effect=lambda texts: [[0.0] for _ in texts])
+    return clients
+
+
+@pytest.mark.asyncio
+async def test_nodes_are_hydrated_in_one_call():
+    alice = EntityNode(name='Alice', group_id='group', labels=['Entity', 'Person'])
+    paris = EntityNode(name='Paris', group_id='group', labels=['Entity'])
+
+    async def generate_response(messages, response_model=None, **kwargs):
+        return {
+            'entity_0': {'summary': 'Alice is 30', 'age': '30'},
+            'entity_1': {'summary': 'Paris is a city'},
+        }
+
+    clients = _clients(generate_response)
+    nodes = await extract_attributes_from_nodes(
+        clients, [alice, paris], entity_types={'Person': Person}
+    )
+
+    clients.llm_client.generate_response.assert_awaited_once()
+    assert [node.summary for node in nodes] == ['Alice is 30', 'Paris is a city']
+    # Attributes are taken from the validated response
+    assert nodes[0].attributes == {'age': 30}
+    assert nodes[1].attributes == {}
+
+
+@pytest.mark.asyncio
+async def test_invalid_nodes_fall_back_to_single_node_extraction():
+    alice = EntityNode(name='Alice', group_id='group', labels=['Entity', 'Person'])
+    bob = EntityNode(name='Bob', group_id='group', labels=['Entity', 'Person'])
+    carol = EntityNode(name='Carol', group_id='group', labels=['Entity', 'Person'])
+
+    async def generate_response(messages, response_model=None, **kwargs):
+        if response_model is Person:
+            return {'age': 40}
+        if response_model.__name__ == 'EntitySummary':
+            return {'summary': 'Aged 40'}
+        return {
+            'entity_0': {'summary': 'Alice is 30', 'age': 30},
+            'entity_1': {'summary': 'Bob', 'age': 'unknown'},
+            'entity_2': None,
+        }
+
+    clients = _clients(generate_response)
+    nodes = await extract_attributes_from_nodes(
+        clients, [alice, bob, carol], entity_types={'Person': Person}
+    )
+
+    # One batched call, then an attribute and a summary call each for Bob and for Carol, whose
+    # hydration is missing
+    assert clients.llm_client.generate_response.await_count == 5
+    assert [(node.summary, node.attributes) for node in nodes] == [
+        ('Alice is 30', {'age': 30}),
+        ('Aged 40', {'age': 40}),
+        ('Aged 40', {'age': 40}),
+    ]
+
+
+def test_batches_respect_token_budget():
+    nodes = [
+        (EntityNode(name=f'Entity {i}', group_id='group', labels=['Entity']), None)
+        for i in range(5)
+    ]
+
+    assert [len(batch) for batch in _node_hydration_batches(nodes, 1000)] == [2, 2, 1]
+    # A node larger than the budget still gets a batch of its own
+    assert [len(batch) for batch in _node_hydration_batches(nodes, 1)] == [1] * 5
+
+
+def _node(name: str, labels: list[str] | None = None, embedding: list[float] | None = None):
+    return EntityNode(
+        name=name, group_id='group', labels=labels or ['Entity'], name_embedding=embedding
+    )
+
+
+def test_deterministic_resolution_stages():
+    existing = [
+        _node('Alice Smith', ['Entity', 'Person']),
+        _node('Paris', ['Entity', 'City'], embedding=[1.0, 0.0]),
+        _node('Bob'),
+        _node('bob'),
+    ]
+    extracted = [
+        _node('  alice   SMITH', ['Entity', 'Person']),
+        _node('Alice Smith', ['Entity', 'Company']),
+        _node('City of Paris', embedding=[0.999, 0.01]),
+        _node('Bob'),
+        _node('Alice Smyth'),
+    ]
+
+    assert resolve_nodes_deterministically(extracted, existing) == {
+        0: (0, 'exact'),
+        2: (1, 'cosine'),
+    }
+    # Fuzzy matching only runs when configured
+    assert resolve_nodes_deterministically(extracted, existing, fuzzy_threshold=0.9)[4] == (
+        0,
+        'fuzzy',
+    )
+
+
+@pytest.mark.asyncio
+async def test_obvious_duplicates_skip_the_llm():
+    existing = _node('Alice', embedding=[1.0, 0.0])
+    extracted = _node('alice', embedding=[1.0, 0.0])
+
+    clients = MagicMock()
+    clients.llm_client.generate_response = AsyncMock()
+    node_dedupe_metrics.reset()
+
+    with (
+        patch(
+            'graphiti_core.utils.maintenance.node_operations.search',
+            AsyncMock(return_value=SearchResults()),
+        ),
+        patch(
+            'graphiti_core.utils.maintenance.node_operations.filter_existing_duplicate_of_edges',
+            AsyncMock(side_effect=lambda driver, duplicates: duplicates),
+        ),
+    ):
+        resolved_nodes, uuid_map, duplicates = await resolve_extracted_nodes(
+            clients, [extracted], existing_nodes_override=[existing]
+        )
+
+    clients.llm_client.generate_response.assert_not_called()
+    assert [node.uuid for node in resolved_nodes] == [existing.uuid]
+    assert uuid_map == {extracted.uuid: existing.uuid}
+    assert duplicates == [(extracted, existing)]
+    assert node_dedupe_metrics.counts == {'exact': 1}
+    assert node_dedupe_metrics.short_circuited == 1
+
+
+@pytest.mark.asyncio
+async def test_combined_extraction_reconciles_entity_ids():
+    episode = EpisodicNode(
+        name='episode',
+        group_id='group',
+        source=EpisodeType.message,
+        source_description='chat',
+        content='Alice: I moved to Paris with Bob',
+        valid_at=utc_now(),
+    )
+
+    async def generate_response(messages, response_model=None, **kwargs):
+        return {
+            'extracted_entities': [
+                {'name': 'Alice', 'entity_type_id': 1},
+                {'name': ' ', 'entity_type_id': 0},
+                {'name': 'Paris', 'entity_type_id': 2},
+                {'name': 'Bob', 'entity_type_id': 1},
+            ],
+            'edges': [
+                {
+                    'relation_type': 'LIVES_IN',
+                    'source_entity_id': 0,
+                    'target_entity_id': 2,
+                    'fact': 'Alice lives in Paris',
+                },
+                {
+                    'relation_type': 'KNOWS',
+                    'source_entity_id': 0,
+                    'target_entity_id': 3,
+                    'fact': 'Alice knows Bob',
+                },
+                {
+                    'relation_type': 'RELATED_TO',
+                    'source_entity_id': 1,
+                    'target_entity_id': 3,
+                    'fact': 'Unnamed',
+                },
+            ],
+        }
+
+    class City(BaseModel):
+        """A city."""
+
+    clients = _clients(generate_response)
+    nodes, edges = await extract_nodes_and_edges(
+        clients,
+        episode,
+        [],
+        {('Entity', 'Entity'): []},
+        'group',
+        entity_types={'Person': Person, 'City': City},
+        excluded_entity_types=['City'],
+    )
+
+    clients.llm_client.generate_response.assert_awaited_once()
+    assert [node.name for node in nodes] == ['Alice', 'Bob']
+    # Facts about the blank entity and the excluded Paris are dropped
+    assert [(edge.name, edge.source_node_uuid, edge.target_node_uuid) for edge in edges] == [
+        ('KNOWS', nodes[0].uuid, nodes[1].uuid)
+    ]
@@ -4,7 +4,16 @@ import pytest
 
 from graphiti_core.nodes import EntityNode
 from graphiti_core.search.search_filters import SearchFilters
-from graphiti_core.search.search_utils import hybrid_node_search
+from graphiti_core.search.search_utils import (
+    comb_mnz,
+    comb_sum,
+    episode_mentions_reranker,
+    fulltext_query,
+    hybrid_node_search,
+    linear_combination,
+    node_distance_reranker,
+    rrf,
+)
 
 
 @pytest.mark.asyncio
@@ -161,3 +170,235 @@ async def test_hybrid_node_search_with_limit_and_duplicates():
         mock_similarity_search.assert_called_with(
             mock_driver, [0.1, 0.2, 0.3], SearchFilters(), ['1'], 4
         )
+
+
+def test_edge_search_filter_query_template_is_shared_across_values():
+    from datetime import datetime, timezone
+
+    from graphiti_core.driver.driver import GraphProvider
+    from graphiti_core.search.search_filters import (
+        ComparisonOperator,
+        DateFilter,
+        edge_search_filter_query_constructor,
+    )
+
+    def build(date: datetime):
+        filters = SearchFilters(
+            valid_at=[[DateFilter(date=date, comparison_operator=ComparisonOperator.greater_than)]]
+        )
+        return edge_search_filter_query_constructor(filters, GraphProvider.NEO4J)
+
+    first_queries, first_params = build(datetime(2024, 1, 1, tzinfo=timezone.utc))
+    second_queries, second_params = build(datetime(2025, 1, 1, tzinfo=timezone.utc))
+
+    # Same filter shape yields identical query text; only the parameters differ
+    assert first_queries == second_queries
+    assert first_params['valid_at_0'] != second_params['valid_at_0']
+
+
+def test_query_template_builders_are_memoized():
+    from graphiti_core.driver.driver import GraphProvider
+    from graphiti_core.graph_queries import query_template_cache_info
+    from graphiti_core.search.search_utils import _edge_fulltext_search_query
+
+    first = _edge_fulltext_search_query(GraphProvider.NEO4J, '')
+    second = _edge_fulltext_search_query(GraphProvider.NEO4J, '')
+
+    assert first is second
+    info = query_template_cache_info()
+    assert info['graphiti_core.search.search_utils._edge_fulltext_search_query'].hits >= 1
+
+
+@pytest.mark.asyncio
+async def test_node_similarity_search_uses_falkordb_vector_index():
+    from graphiti_core.driver.driver import GraphProvider
+    from graphiti_core.search.search_utils import VECTOR_INDEX_OVERSAMPLING, node_similarity_search
+
+    mock_driver = AsyncMock()
+    mock_driver.provider = GraphProvider.FALKORDB
+    mock_driver.execute_query.side_effect = [
+        ([], None, None),
+        ([{'neighbour_count': 5 * VECTOR_INDEX_OVERSAMPLING, 'lowest_score': 0.9}], None, None),
+        ([], None, None),
+    ]
+
+    await node_similarity_search(
+        mock_driver, [0.1, 0.2], SearchFilters(), ['group'], limit=5, use_local_indexes=True
+    )
+
+    first_call, neighbours_call, fallback_call = mock_driver.execute_query.call_args_list
+    assert 'db.idx.vector.queryNodes' in first_call.args[0]
+    assert first_call.kwargs['vector_k'] == 5 * VECTOR_INDEX_OVERSAMPLING
+    # Fewer results than the limit after filtering, while every neighbour of the kNN scored above
+    # min_score, may mean the kNN missed matches of the group
+    assert 'neighbour_count' in neighbours_call.args[0]
+    assert 'vec.cosineDistance' in fallback_call.args[0]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'neighbours',
+    [
+        # The index holds fewer neighbours than were asked for
+        {'neighbour_count': 3, 'lowest_score': 0.9},
+        # The furthest neighbours already score below min_score
+        {'neighbour_count': 50, 'lowest_score': 0.2},
+    ],
+)
+async def test_exhausted_vector_index_result_is_final(neighbours):
+    from graphiti_core.driver.driver import GraphProvider
+    from graphiti_core.search.search_utils import node_similarity_search_candidates
+
+    mock_driver = AsyncMock()
+    mock_driver.provider = GraphProvider.FALKORDB
+    mock_driver.execute_query.side_effect = [
+        ([{'uuid': 'alice', 'score': 0.95}], None, None),
+        ([neighbours], None, None),
+    ]
+
+    candidates = await node_similarity_search_candidates(
+        mock_driver, [0.1, 0.2], SearchFilters(), ['group'], limit=5, use_local_indexes=True
+    )
+
+    assert [candidate.uuid for candidate in candidates] == ['alice']
+    assert mock_driver.execute_query.call_count == 2
+    assert all(
+        'vec.cosineDistance' not in call.args[0]
+        for call in mock_driver.execute_query.call_args_list
+    )
+
+
+@pytest.mark.asyncio
+async def test_edge_similarity_search_falls_back_to_brute_force():
+    from graphiti_core.driver.driver import GraphProvider
+    from graphiti_core.search.search_utils import edge_similarity_search
+
+    mock_driver = AsyncMock()
+    mock_driver.provider = GraphProvider.FALKORDB
+    mock_driver.execute_query.side_effect = [Exception('no such index'), ([], None, None)]
+
+    edges = await edge_similarity_search(
+        mock_driver, [0.1, 0.2], None, None, SearchFilters(), ['group'], use_local_indexes=True
+    )
+
+    assert edges == []
+    assert mock_driver.execute_query.call_count == 2
+    first_query = mock_driver.execute_query.call_args_list[0].args[0]
+    fallback_query = mock_driver.execute_query.call_args_list[1].args[0]
+    assert 'db.idx.vector.queryRelationships' in first_query
+    assert 'vec.cosineDistance' in fallback_query
+
+
+def test_weighted_rrf_with_top_k():
+    results = [['a', 'b', 'c'], ['c', 'b']]
+
+    # Ties keep the order in which the results were found
+    assert rrf(results) == (['c', 'a', 'b'], [pytest.approx(4 / 3), 1.0, 1.0])
+    assert rrf(results, weights=[3.0, 1.0])[0] == ['a', 'b', 'c']
+    assert rrf(results, rank_const=60, limit=2)[0] == rrf(results, rank_const=60)[0][:2]
+    assert rrf(results, min_score=1.2)[0] == ['c']
+
+
+def test_score_fusion_uses_normalized_scores():
+    bm25 = [('a', 10.0), ('b', 5.0), ('c', 0.0)]
+    cosine = [('c', 0.9), ('b', 0.5)]
+
+    assert comb_sum([bm25, cosine]) == (['a', 'c', 'b'], [1.0, 1.0, 0.5])
+    assert comb_sum([bm25, cosine], weights=[1.0, 3.0])[0] == ['c', 'a', 'b']
+    assert comb_mnz([bm25, cosine]) == (['c', 'a', 'b'], [2.0, 1.0, 1.0])
+
+    # The linear blend keeps the gap between b and c in the cosine scores
+    uuids, scores = linear_combination([bm25, cosine], limit=1)
+    assert uuids == ['b']
+    assert scores == [pytest.approx((0.5 + 0.5 / 0.9) / 2)]
+
+
+def test_score_fusion_ranks_lists_without_scores():
+    uuids, scores = comb_sum([[('a', None), ('b', None)], [('b', 1.0)]])
+
+    assert uuids == ['b', 'a']
+    assert scores == [1.5, 1.0]
+
+
+@pytest.mark.asyncio
+async def test_node_distance_reranker_scores_multi_hop_distances():
+    from graphiti_core.driver.driver import GraphProvider
+
+    # a - b - c - d, and e - f
+    adjacency = {
+        'a': ['b'],
+        'b': ['a', 'c'],
+        'c': ['b', 'd'],
+        'd': ['c'],
+        'e': ['f'],
+        'f': ['e'],
+    }
+
+    async def execute_query(query, node_uuids, **kwargs):
+        neighbors = {m for uuid in node_uuids for m in adjacency[uuid]}
+        return [{'uuid': uuid} for uuid in neighbors], None, None
+
+    mock_driver = AsyncMock()
+    mock_driver.provider = GraphProvider.NEO4J
+    mock_driver.execute_query.side_effect = execute_query
+
+    uuids, scores = await node_distance_reranker(mock_driver, ['d', 'f', 'b', 'a', 'c'], 'a')
+    assert uuids == ['a', 'b', 'c', 'd', 'f']
+    assert scores == [10.0, 1.0, 0.5, pytest.approx(1 / 3), 0.0]
+
+    # The search stops once every node is reached, and the nearest of several centers counts
+    mock_driver.execute_query.reset_mock()
+    uuids, scores = await node_distance_reranker(
+        mock_driver, ['d', 'f', 'b'], ['a', 'e'], min_score=0.5
+    )
+    assert uuids == ['f', 'b']
+    assert scores == [1.0, 1.0]
+    assert mock_driver.execute_query.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_episode_mentions_reranker_ranks_most_mentioned_first():
+    from graphiti_core.driver.driver import GraphProvider
+
+    mock_driver = AsyncMock()
+    mock_driver.provider = GraphProvider.NEO4J
+    mock_driver.execute_query.side_effect = [
+        (
+            [
+                {'uuid': 'a', 'mention_count': 1},
+                {'uuid': 'b', 'mention_count': 5},
+                {'uuid': 'c', 'mention_count': 0},
+                {'uuid': 'd', 'mention_count': None},
+            ],
+            None,
+            None,
+        ),
+        ([{'uuid': 'd', 'mention_count': 3}], None, None),
+    ]
+
+    uuids, scores = await episode_mentions_reranker(mock_driver, [['a', 'b', 'c', 'd']], limit=3)
+
+    assert uuids == ['b', 'd', 'a']
+    assert scores == [5.0, 3.0, 1.0]
+    # Only the node without a stored count is counted from its MENTIONS edges
+    assert mock_driver.execute_query.await_args.kwargs['node_uuids'] == ['d']
+
+
+def test_fulltext_query_drops_stopwords_and_escapes_operators():
+    from graphiti_core.driver.driver import GraphProvider
+
+    driver = AsyncMock()
+    driver.provider = GraphProvider.NEO4J
+    driver.fulltext_syntax = ''
+
+    assert (
+        fulltext_query('Where does Alice work AND live?', ['g1', 'g2'], driver)
+        == 'group_id:"g1" OR group_id:"g2" AND (Where does Alice work live\\?)'
+    )
+    # Queries made only of stop words are kept, with their operators escaped
+    assert fulltext_query('To be OR NOT to be', None, driver) == '(To be \\OR \\NOT to be)'
+    assert fulltext_query('? !', None, driver) == ''
+
+    # Long queries are truncated to the clause budget instead of being dropped
+    long_query = ' '.join(f'term{i}' for i in range(200))
+    assert fulltext_query(long_query, ['g1'], driver).split()[-1] == 'term125)'
@@ -0,0 +1,137 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from graphiti_core.driver.driver import GraphProvider
+from graphiti_core.edges import EntityEdge
+from graphiti_core.search.search import search_batch
+from graphiti_core.search.search_config_recipes import EDGE_HYBRID_SEARCH_RRF
+from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.search.search_utils import (
+    EdgeSearchCandidate,
+    edge_similarity_search_batch_candidates,
+)
+from graphiti_core.utils.datetime_utils import utc_now
+
+
+def _candidate(uuid: str) -> EdgeSearchCandidate:
+    return EdgeSearchCandidate(uuid=uuid, source_node_uuid='a', target_node_uuid='b', score=1.0)
+
+
+async def _get_by_uuids(driver, uuids):
+    return [
+        EntityEdge(
+            uuid=uuid,
+            group_id='group',
+            source_node_uuid='a',
+            target_node_uuid='b',
+            name='KNOWS',
+            fact=uuid,
+            created_at=utc_now(),
+        )
+        for uuid in uuids
+    ]
+
+
+@pytest.mark.asyncio
+async def test_search_batch_embeds_and_searches_all_queries_at_once():
+    clients = MagicMock()
+    clients.driver.provider = GraphProvider.NEO4J
+    clients.driver.search_cache = None
+    clients.embedder.create_batch = AsyncMock(return_value=[[1.0, 0.0], [0.0, 1.0]])
+    clients.embedder.create = AsyncMock()
+
+    with (
+        patch(
+            'graphiti_core.search.search.edge_fulltext_search_batch_candidates',
+            AsyncMock(return_value=[[_candidate('alice-bm25')], [_candidate('bob-bm25')]]),
+        ) as fulltext_batch,
+        patch(
+            'graphiti_core.search.search.edge_similarity_search_batch_candidates',
+            AsyncMock(return_value=[[_candidate('alice-cosine')], []]),
+        ) as similarity_batch,
+        patch('graphiti_core.search.search.edge_fulltext_search') as fulltext_search,
+        patch('graphiti_core.search.search.edge_similarity_search') as similarity_search,
+        patch.object(EntityEdge, 'get_by_uuids', AsyncMock(side_effect=_get_by_uuids)),
+    ):
+        results = await search_batch(
+            clients, ['alice', 'bob', '', 'alice'], None, EDGE_HYBRID_SEARCH_RRF, SearchFilters()
+        )
+
+    clients.embedder.create_batch.assert_awaited_once_with(['alice', 'bob'])
+    clients.embedder.create.assert_not_called()
+    assert fulltext_batch.await_args.args[1] == ['alice', 'bob']
+    assert similarity_batch.await_args.args[1] == [[1.0, 0.0], [0.0, 1.0]]
+    fulltext_search.assert_not_called()
+    similarity_search.assert_not_called()
+
+    assert [[edge.uuid for edge in result.edges] for result in results] == [
+        ['alice-bm25', 'alice-cosine'],
+        ['bob-bm25'],
+        [],
+        ['alice-bm25', 'alice-cosine'],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_search_batch_keeps_vector_index_searches_per_query():
+    clients = MagicMock()
+    clients.driver.provider = GraphProvider.FALKORDB
+    clients.driver.search_cache = None
+    clients.embedder.create_batch = AsyncMock(return_value=[[1.0, 0.0], [0.0, 1.0]])
+    config = EDGE_HYBRID_SEARCH_RRF.model_copy(deep=True)
+    assert config.edge_config is not None
+    config.edge_config.use_local_indexes = True
+    cosine_edges = await _get_by_uuids(clients.driver, ['cosine'])
+
+    with (
+        patch(
+            'graphiti_core.search.search.edge_fulltext_search_batch_candidates',
+            AsyncMock(return_value=[[], []]),
+        ),
+        patch(
+            'graphiti_core.search.search.edge_similarity_search_batch_candidates'
+        ) as similarity_batch,
+        patch(
+            'graphiti_core.search.search.edge_similarity_search',
+            AsyncMock(return_value=cosine_edges),
+        ) as similarity_search,
+        patch.object(EntityEdge, 'get_by_uuids', AsyncMock(side_effect=_get_by_uuids)),
+    ):
+        results = await search_batch(clients, ['alice', 'bob'], None, config, SearchFilters())
+
+    # Like search(), each query's cosine step goes through the vector index path
+    similarity_batch.assert_not_called()
+    assert similarity_search.await_count == 2
+    assert all(call.args[8] is True for call in similarity_search.await_args_list)
+    assert [[edge.uuid for edge in result.edges] for result in results] == [['cosine'], ['cosine']]
+
+
+@pytest.mark.asyncio
+async def test_similarity_search_batch_splits_records_by_query():
+    driver = AsyncMock()
+    driver.provider = GraphProvider.NEO4J
+    driver.execute_query.return_value = (
+        [
+            {
+                'query_index': 1,
+                'matches': [
+                    {'uuid': 'e1', 'source_node_uuid': 'a', 'target_node_uuid': 'b', 'score': 0.9}
+                ],
+            }
+        ],
+        None,
+        None,
+    )
+
+    results = await edge_similarity_search_batch_candidates(
+        driver, [[1.0, 0.0], [0.0, 1.0]], SearchFilters(), ['group']
+    )
+
+    assert results == [[], [EdgeSearchCandidate('e1', 'a', 'b', 0.9)]]
+    query = driver.execute_query.await_args.args[0]
+    assert query.index('MATCH') < query.index('UNWIND $search_vectors')
+    assert driver.execute_query.await_args.kwargs['search_vectors'][1] == {
+        'index': 1,
+        'vector': [0.0, 1.0],
+    }
@@ -0,0 +1,133 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from graphiti_core.edges import EntityEdge
+from graphiti_core.search.search_cache import SearchCache, invalidate_search_cache
+from graphiti_core.search.search_config import SearchConfig, SearchResults
+from graphiti_core.search.search_config_recipes import EDGE_HYBRID_SEARCH_RRF
+from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.utils.datetime_utils import utc_now
+
+
+def _key(query: str = 'alice', group_ids: list[str] | None = None, **kwargs):
+    return SearchCache.make_key(
+        query, group_ids, kwargs.pop('config', SearchConfig()), SearchFilters(), **kwargs
+    )
+
+
+def test_make_key_normalizes_query_and_group_order():
+    assert _key('  alice   bob ', ['b', 'a']) == _key('alice bob', ['a', 'b'])
+    assert _key('alice', ['a']) != _key('alice', ['b'])
+    assert _key('alice') != _key('alice', config=EDGE_HYBRID_SEARCH_RRF)
+    assert _key('alice') != _key('alice', center_node_uuid='node')
+    assert _key('alice') != _key('alice', database='other')
+
+
+def test_get_returns_copy_and_counts_hits():
+    cache = SearchCache()
+    key = _key()
+    assert cache.get(key) is None
+
+    cache.set(key, ['group'], SearchResults(edge_reranker_scores=[1.0]))
+    cached = cache.get(key)
+    assert cached is not None
+    assert cached.edge_reranker_scores == [1.0]
+
+    cached.edge_reranker_scores.append(2.0)
+    assert cache.get(key).edge_reranker_scores == [1.0]  # type: ignore[union-attr]
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_entries_expire_after_ttl():
+    cache = SearchCache(ttl=10)
+    key = _key()
+    with patch('graphiti_core.search.search_cache.monotonic', return_value=100.0):
+        cache.set(key, None, SearchResults())
+    with patch('graphiti_core.search.search_cache.monotonic', return_value=105.0):
+        assert cache.get(key) is not None
+    with patch('graphiti_core.search.search_cache.monotonic', return_value=111.0):
+        assert cache.get(key) is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = SearchCache(max_entries=2)
+    cache.set(_key('a'), None, SearchResults())
+    cache.set(_key('b'), None, SearchResults())
+    cache.get(_key('a'))
+    cache.set(_key('c'), None, SearchResults())
+
+    assert cache.get(_key('b')) is None
+    assert cache.get(_key('a')) is not None
+    assert cache.get(_key('c')) is not None
+
+
+def test_invalidate_drops_touched_groups_and_unscoped_entries():
+    cache = SearchCache()
+    cache.set(_key('a', ['g1']), ['g1'], SearchResults())
+    cache.set(_key('b', ['g2']), ['g2'], SearchResults())
+    cache.set(_key('c'), None, SearchResults())
+
+    cache.invalidate(['g1'])
+
+    assert cache.get(_key('a', ['g1'])) is None
+    assert cache.get(_key('c')) is None
+    assert cache.get(_key('b', ['g2'])) is not None
+
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_results_from_before_a_write_are_not_stored():
+    cache = SearchCache()
+    generation = cache.generation(['g1'])
+    unscoped_generation = cache.generation()
+    cache.invalidate(['g1'])
+
+    cache.set(_key(), ['g1'], SearchResults(), generation)
+    cache.set(_key('b'), None, SearchResults(), unscoped_generation)
+    assert len(cache) == 0
+
+
+def test_writes_to_other_groups_do_not_discard_results():
+    cache = SearchCache()
+    generation = cache.generation(['g1'])
+    cache.invalidate(['g2'])
+
+    cache.set(_key(), ['g1'], SearchResults(), generation)
+    assert len(cache) == 1
+
+
+def test_max_items_evicts_least_recently_used():
+    cache = SearchCache(max_items=3)
+    edge = EntityEdge(
+        source_node_uuid='alice',
+        target_node_uuid='bob',
+        name='KNOWS',
+        group_id='g1',
+        fact='Alice knows Bob',
+        created_at=utc_now(),
+    )
+    results = SearchResults(edges=[edge, edge])
+    cache.set(_key('a'), None, results)
+    cache.set(_key('b'), None, results)
+
+    assert cache.get(_key('a')) is None
+    assert len(cache) == 1
+
+
+def test_invalidate_search_cache_without_cache_is_noop():
+    driver = MagicMock()
+    driver.search_cache = None
+    invalidate_search_cache(driver, ['g1'])
+
+    driver.search_cache = SearchCache()
+    driver.search_cache.set(_key(), ['g1'], SearchResults())
+    invalidate_search_cache(driver, ['g1'])
+    assert len(driver.search_cache) == 0
+
+
+def test_max_entries_must_be_positive():
+    with pytest.raises(ValueError):
+        SearchCache(max_entries=0)
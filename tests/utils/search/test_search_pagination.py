@@ -0,0 +1,132 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from graphiti_core.nodes import EntityNode
+from graphiti_core.search.search_config import SearchResults
+from graphiti_core.search.search_config_recipes import NODE_HYBRID_SEARCH_RRF
+from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.search.search_pagination import SearchSessionCache, search_page, search_pages
+from graphiti_core.utils.rate_limiter import Priority, _priority
+
+
+def _results(count: int) -> SearchResults:
+    return SearchResults(
+        nodes=[
+            EntityNode(uuid=f'node-{i}', name=f'Node {i}', group_id='group') for i in range(count)
+        ],
+        node_reranker_scores=[float(count - i) for i in range(count)],
+    )
+
+
+@pytest.mark.asyncio
+async def test_pages_are_sliced_from_a_single_search():
+    sessions = SearchSessionCache()
+    with patch(
+        'graphiti_core.search.search_pagination.search', AsyncMock(return_value=_results(5))
+    ) as run_search:
+        pages = [
+            page
+            async for page in search_pages(
+                MagicMock(),
+                sessions,
+                'alice',
+                ['group'],
+                NODE_HYBRID_SEARCH_RRF,
+                SearchFilters(),
+                page_size=2,
+                max_results=20,
+            )
+        ]
+
+    run_search.assert_awaited_once()
+    assert run_search.await_args.args[3].limit == 20
+    assert NODE_HYBRID_SEARCH_RRF.limit != 20
+    assert [[node.uuid for node in page.results.nodes] for page in pages] == [
+        ['node-0', 'node-1'],
+        ['node-2', 'node-3'],
+        ['node-4'],
+    ]
+    assert [page.offset for page in pages] == [0, 2, 4]
+    assert pages[-1].cursor is None
+
+
+@pytest.mark.asyncio
+async def test_pages_are_searched_at_search_priority():
+    priorities: list[Priority] = []
+
+    async def run_search(*args, **kwargs):
+        priorities.append(_priority.get())
+        return _results(3)
+
+    with patch('graphiti_core.search.search_pagination.search', AsyncMock(side_effect=run_search)):
+        async for _ in search_pages(
+            MagicMock(),
+            SearchSessionCache(),
+            'alice',
+            None,
+            NODE_HYBRID_SEARCH_RRF,
+            SearchFilters(),
+            page_size=2,
+        ):
+            # The caller's own requests between pages keep their priority
+            assert _priority.get() == Priority.ingestion
+
+    assert priorities == [Priority.search]
+
+
+@pytest.mark.asyncio
+async def test_expired_or_mismatched_cursor_recomputes_at_offset():
+    sessions = SearchSessionCache()
+    with patch(
+        'graphiti_core.search.search_pagination.search', AsyncMock(return_value=_results(4))
+    ) as run_search:
+        first = await search_page(
+            MagicMock(),
+            sessions,
+            'alice',
+            None,
+            NODE_HYBRID_SEARCH_RRF,
+            SearchFilters(),
+            page_size=2,
+        )
+        assert first.cursor is not None
+
+        # A cursor used with another query does not reuse the session
+        other = await search_page(
+            MagicMock(),
+            sessions,
+            'bob',
+            None,
+            NODE_HYBRID_SEARCH_RRF,
+            SearchFilters(),
+            page_size=2,
+            cursor=first.cursor,
+        )
+
+    assert run_search.await_count == 2
+    assert [node.uuid for node in other.results.nodes] == ['node-2', 'node-3']
+    assert other.cursor is None
+
+
+@pytest.mark.asyncio
+async def test_invalid_cursor_raises():
+    with pytest.raises(ValueError):
+        await search_page(
+            MagicMock(),
+            SearchSessionCache(),
+            'alice',
+            None,
+            NODE_HYBRID_SEARCH_RRF,
+            SearchFilters(),
+            cursor='not-a-cursor',
+        )
+
+
+def test_oldest_session_is_evicted():
+    sessions = SearchSessionCache(max_sessions=1)
+    first = sessions.create('a', SearchResults())
+    sessions.create('b', SearchResults())
+
+    assert sessions.get(first, 'a') is None
+    assert len(sessions) == 1
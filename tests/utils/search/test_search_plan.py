@@ -0,0 +1,288 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from graphiti_core.edges import EntityEdge
+from graphiti_core.errors import SearchRerankerError
+from graphiti_core.nodes import EntityNode
+from graphiti_core.search.search import search
+from graphiti_core.search.search_config import (
+    EdgeReranker,
+    EdgeSearchConfig,
+    EdgeSearchMethod,
+    NodeSearchConfig,
+    NodeSearchMethod,
+    SearchConfig,
+)
+from graphiti_core.search.search_config_recipes import (
+    EDGE_HYBRID_SEARCH_NODE_DISTANCE,
+    EDGE_HYBRID_SEARCH_RRF,
+    NODE_HYBRID_SEARCH_MMR,
+)
+from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.search.search_plan import SearchScope, build_search_plan
+from graphiti_core.search.search_utils import EdgeSearchCandidate
+from graphiti_core.utils.datetime_utils import utc_now
+
+
+def test_plan_only_contains_configured_queries():
+    plan = build_search_plan(EDGE_HYBRID_SEARCH_RRF)
+
+    assert plan.scopes() == [SearchScope.edge]
+    assert [(step.scope, step.method) for step in plan.steps] == [
+        (SearchScope.edge, 'bm25'),
+        (SearchScope.edge, 'cosine_similarity'),
+    ]
+    assert plan.embed_query
+
+
+def test_plan_skips_embedding_without_cosine_or_mmr():
+    config = SearchConfig(edge_config=EdgeSearchConfig(search_methods=[EdgeSearchMethod.bm25]))
+    assert not build_search_plan(config).embed_query
+
+    # MMR needs the query vector even without a cosine search
+    assert build_search_plan(NODE_HYBRID_SEARCH_MMR).embed_query
+
+
+def test_plan_seeds_bfs_from_stage_zero_results():
+    config = SearchConfig(
+        edge_config=EdgeSearchConfig(search_methods=list(EdgeSearchMethod)),
+        node_config=NodeSearchConfig(search_methods=list(NodeSearchMethod)),
+    )
+    plan = build_search_plan(config)
+    bfs_steps = plan.stage(1)
+    assert [(step.scope, step.seed_scopes) for step in bfs_steps] == [
+        (SearchScope.edge, [SearchScope.edge, SearchScope.node]),
+        (SearchScope.node, [SearchScope.node, SearchScope.edge]),
+    ]
+
+    # Explicit origins make BFS independent
+    plan = build_search_plan(config, bfs_origin_node_uuids=['origin'])
+    assert plan.stage(1) == []
+    assert 'breadth_first_search' in [step.method for step in plan.stage(0)]
+
+
+def test_plan_drops_bfs_that_cannot_be_seeded():
+    config = SearchConfig(node_config=NodeSearchConfig(search_methods=[NodeSearchMethod.bfs]))
+    plan = build_search_plan(config)
+
+    assert plan.steps == []
+    assert plan.scopes() == [SearchScope.node]
+
+
+def test_plan_requires_center_node_for_node_distance():
+    with pytest.raises(SearchRerankerError):
+        build_search_plan(EDGE_HYBRID_SEARCH_NODE_DISTANCE)
+
+    assert build_search_plan(EDGE_HYBRID_SEARCH_NODE_DISTANCE, center_node_uuid='center').steps
+
+
+@pytest.mark.asyncio
+async def test_search_borrows_edge_results_for_node_bfs():
+    now = utc_now()
+    edge = EntityEdge(
+        uuid='edge',
+        group_id='group',
+        source_node_uuid='alice',
+        target_node_uuid='bob',
+        name='KNOWS',
+        fact='Alice knows Bob',
+        created_at=now,
+    )
+    node = EntityNode(uuid='carol', name='Carol', group_id='group')
+
+    clients = MagicMock()
+    clients.driver.search_cache = None
+    clients.embedder.create = AsyncMock()
+    config = SearchConfig(
+        edge_config=EdgeSearchConfig(search_methods=[EdgeSearchMethod.bm25]),
+        node_config=NodeSearchConfig(search_methods=[NodeSearchMethod.bfs]),
+    )
+
+    with (
+        patch(
+            'graphiti_core.search.search.edge_fulltext_search', AsyncMock(return_value=[edge])
+        ) as edge_fulltext,
+        patch(
+            'graphiti_core.search.search.node_bfs_search', AsyncMock(return_value=[node])
+        ) as node_bfs,
+    ):
+        results = await search(clients, 'alice', ['group'], config, SearchFilters())
+
+    edge_fulltext.assert_awaited_once()
+    assert node_bfs.await_args.args[1] == ['alice', 'bob']
+    clients.embedder.create.assert_not_called()
+    assert [e.uuid for e in results.edges] == ['edge']
+    assert [n.uuid for n in results.nodes] == ['carol']
+
+
+@pytest.mark.asyncio
+async def test_two_phase_search_loads_only_final_results():
+    now = utc_now()
+    candidates = [
+        EdgeSearchCandidate(uuid=f'edge-{i}', source_node_uuid='a', target_node_uuid='b', score=1.0)
+        for i in range(4)
+    ]
+
+    clients = MagicMock()
+    clients.driver.search_cache = None
+    config = SearchConfig(
+        edge_config=EdgeSearchConfig(search_methods=[EdgeSearchMethod.bm25], two_phase=True),
+        limit=2,
+    )
+
+    async def get_by_uuids(driver, uuids):
+        return [
+            EntityEdge(
+                uuid=uuid,
+                group_id='group',
+                source_node_uuid='a',
+                target_node_uuid='b',
+                name='KNOWS',
+                fact=uuid,
+                created_at=now,
+            )
+            for uuid in uuids
+        ]
+
+    with (
+        patch(
+            'graphiti_core.search.search.edge_fulltext_search_candidates',
+            AsyncMock(return_value=candidates),
+        ),
+        patch('graphiti_core.search.search.edge_fulltext_search') as full_search,
+        patch.object(EntityEdge, 'get_by_uuids', AsyncMock(side_effect=get_by_uuids)) as loader,
+    ):
+        results = await search(clients, 'alice', ['group'], config, SearchFilters())
+
+    full_search.assert_not_called()
+    loader.assert_awaited_once()
+    assert loader.await_args.args[1] == ['edge-0', 'edge-1']
+    assert [edge.uuid for edge in results.edges] == ['edge-0', 'edge-1']
+
+
+@pytest.mark.asyncio
+async def test_scores_stay_aligned_with_results_deleted_before_loading():
+    now = utc_now()
+    candidates = [
+        EdgeSearchCandidate(uuid=f'edge-{i}', source_node_uuid='a', target_node_uuid='b', score=1.0)
+        for i in range(3)
+    ]
+
+    clients = MagicMock()
+    clients.driver.search_cache = None
+    config = SearchConfig(
+        edge_config=EdgeSearchConfig(search_methods=[EdgeSearchMethod.bm25], two_phase=True),
+        limit=2,
+    )
+
+    async def get_by_uuids(driver, uuids):
+        # edge-0 was deleted after the candidates were found
+        return [
+            EntityEdge(
+                uuid=uuid,
+                group_id='group',
+                source_node_uuid='a',
+                target_node_uuid='b',
+                name='KNOWS',
+                fact=uuid,
+                created_at=now,
+            )
+            for uuid in uuids
+            if uuid != 'edge-0'
+        ]
+
+    with (
+        patch(
+            'graphiti_core.search.search.edge_fulltext_search_candidates',
+            AsyncMock(return_value=candidates),
+        ),
+        patch.object(EntityEdge, 'get_by_uuids', AsyncMock(side_effect=get_by_uuids)),
+    ):
+        results = await search(clients, 'alice', ['group'], config, SearchFilters())
+
+    assert [edge.uuid for edge in results.edges] == ['edge-1']
+    # The score of edge-1, the second RRF result
+    assert results.edge_reranker_scores == [0.5]
+
+
+@pytest.mark.asyncio
+async def test_mmr_fetches_embeddings_only_for_candidates_without_one():
+    similar = EntityNode(uuid='similar', name='Alice', group_id='group', name_embedding=[1.0, 0.0])
+    keyword = EntityNode(uuid='keyword', name='Alice Smith', group_id='group')
+
+    clients = MagicMock()
+    clients.driver.search_cache = None
+    clients.embedder.create = AsyncMock(return_value=[1.0, 0.0])
+
+    with (
+        patch(
+            'graphiti_core.search.search.node_fulltext_search',
+            AsyncMock(return_value=[keyword, similar.model_copy(update={'name_embedding': None})]),
+        ),
+        patch(
+            'graphiti_core.search.search.node_similarity_search',
+            AsyncMock(return_value=[similar]),
+        ) as similarity_search,
+        patch(
+            'graphiti_core.search.search.get_embeddings_for_nodes',
+            AsyncMock(return_value={'keyword': [0.0, 1.0]}),
+        ) as get_embeddings,
+    ):
+        results = await search(clients, 'alice', ['group'], NODE_HYBRID_SEARCH_MMR, SearchFilters())
+
+    assert similarity_search.await_args.kwargs['with_embeddings'] is True
+    assert [node.uuid for node in get_embeddings.await_args.args[1]] == ['keyword']
+    assert [node.uuid for node in results.nodes] == ['similar', 'keyword']
+    assert all(node.name_embedding is None for node in results.nodes)
+
+
+@pytest.mark.asyncio
+async def test_score_fusion_weights_results_by_search_method():
+    now = utc_now()
+
+    def candidate(uuid: str, score: float) -> EdgeSearchCandidate:
+        return EdgeSearchCandidate(
+            uuid=uuid, source_node_uuid='a', target_node_uuid='b', score=score
+        )
+
+    async def get_by_uuids(driver, uuids):
+        return [
+            EntityEdge(
+                uuid=uuid,
+                group_id='group',
+                source_node_uuid='a',
+                target_node_uuid='b',
+                name='KNOWS',
+                fact=uuid,
+                created_at=now,
+            )
+            for uuid in uuids
+        ]
+
+    clients = MagicMock()
+    clients.driver.search_cache = None
+    clients.embedder.create = AsyncMock(return_value=[1.0, 0.0])
+    config = SearchConfig(
+        edge_config=EdgeSearchConfig(
+            search_methods=[EdgeSearchMethod.cosine_similarity, EdgeSearchMethod.bm25],
+            reranker=EdgeReranker.comb_sum,
+            method_weights={EdgeSearchMethod.cosine_similarity: 3.0},
+        ),
+    )
+
+    with (
+        patch(
+            'graphiti_core.search.search.edge_fulltext_search_candidates',
+            AsyncMock(return_value=[candidate('keyword', 10.0), candidate('semantic', 1.0)]),
+        ),
+        patch(
+            'graphiti_core.search.search.edge_similarity_search_candidates',
+            AsyncMock(return_value=[candidate('semantic', 0.9), candidate('keyword', 0.7)]),
+        ),
+        patch.object(EntityEdge, 'get_by_uuids', AsyncMock(side_effect=get_by_uuids)),
+    ):
+        results = await search(clients, 'alice', ['group'], config, SearchFilters())
+
+    assert [edge.uuid for edge in results.edges] == ['semantic', 'keyword']
+    assert results.edge_reranker_scores == [3.0, 1.0]
@@ -0,0 +1,80 @@
+import asyncio
+import gc
+
+import pytest
+
+from graphiti_core.helpers import semaphore_gather
+from graphiti_core.utils.concurrency import ConcurrencyPool
+
+
+@pytest.mark.asyncio
+async def test_pool_bounds_nested_gathers():
+    pool = ConcurrencyPool('db', 2)
+    running = 0
+    max_running = 0
+
+    async def query():
+        nonlocal running, max_running
+        async with pool.acquire():
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            # Nested calls made while holding a slot do not wait on the pool again
+            async with pool.acquire():
+                pass
+            running -= 1
+
+    async def save_episode():
+        await semaphore_gather(*[query() for _ in range(4)])
+
+    await semaphore_gather(*[save_episode() for _ in range(3)])
+
+    assert max_running == 2
+    assert pool.completed == 12
+    assert pool.max_queue_depth == 10
+    assert pool.stats()['in_flight'] == 0
+
+
+@pytest.mark.asyncio
+async def test_siblings_are_cancelled_on_failure():
+    cancelled = asyncio.Event()
+
+    async def fail():
+        await asyncio.sleep(0)
+        raise ValueError('failed')
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(ValueError, match='failed'):
+        await semaphore_gather(slow(), fail())
+
+    assert cancelled.is_set()
+    assert await semaphore_gather() == []
+
+
+@pytest.mark.asyncio
+async def test_exceptions_of_all_failed_siblings_are_retrieved():
+    loop = asyncio.get_running_loop()
+    unretrieved: list[dict] = []
+    loop.set_exception_handler(lambda loop, context: unretrieved.append(context))
+
+    async def fail(value: int):
+        await asyncio.sleep(0)
+        raise ValueError(value)
+
+    try:
+        with pytest.raises(ValueError, match='1'):
+            await semaphore_gather(fail(1), fail(2), fail(3))
+
+        # Failed tasks report unretrieved exceptions when they are garbage collected
+        gc.collect()
+        await asyncio.sleep(0)
+    finally:
+        loop.set_exception_handler(None)
+
+    assert unretrieved == []
@@ -0,0 +1,45 @@
+from datetime import datetime, timedelta, timezone
+
+from graphiti_core.nodes import EpisodeType, EpisodicNode
+from graphiti_core.utils import prompt_context
+from graphiti_core.utils.prompt_context import TRUNCATION_MARKER, previous_episodes_context
+
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _episode(content: str, minutes_ago: int) -> EpisodicNode:
+    return EpisodicNode(
+        name='episode',
+        group_id='group',
+        source=EpisodeType.message,
+        source_description='chat',
+        content=content,
+        valid_at=NOW - timedelta(minutes=minutes_ago),
+    )
+
+
+def test_repeated_episodes_are_skipped():
+    current = _episode('user: hello', 0)
+    episodes = [
+        _episode('user: hi there', 3),
+        _episode('user:  hello', 2),
+        _episode('user: hi   there', 1),
+    ]
+
+    # The older copy of a repeated episode and the copy of the current one are dropped
+    assert previous_episodes_context(episodes, 'extract_nodes', current) == ['user: hi   there']
+    assert previous_episodes_context(None, 'extract_nodes') == []
+
+
+def test_oldest_episodes_are_truncated_to_the_budget(monkeypatch):
+    monkeypatch.setitem(prompt_context.PREVIOUS_EPISODES_TOKEN_BUDGETS, 'test', 200)
+    recent = _episode('b' * 400, 1)
+    older = _episode('a' * 800, 2)
+    oldest = _episode('c' * 400, 3)
+
+    contents = previous_episodes_context([oldest, older, recent], 'test')
+
+    assert len(contents) == 2
+    assert contents[1] == recent.content
+    assert contents[0].startswith(TRUNCATION_MARKER + 'a')
+    assert len(contents[0]) < len(older.content)
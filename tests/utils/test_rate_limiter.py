@@ -0,0 +1,102 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from graphiti_core.cross_encoder.client import CrossEncoderClient
+from graphiti_core.embedder.client import EmbedderClient
+from graphiti_core.utils.rate_limiter import (
+    Priority,
+    RateLimiter,
+    _rate_limiter_name,
+    get_rate_limiter,
+    request_priority,
+)
+
+
+class RateLimitError(Exception):
+    def __init__(self, headers: dict[str, str]):
+        super().__init__('rate limited')
+        self.response = SimpleNamespace(status_code=429, headers=headers)
+
+
+@pytest.mark.asyncio
+async def test_search_requests_are_served_first():
+    rate_limiter = RateLimiter('test', max_concurrency=1)
+    order: list[str] = []
+    release = asyncio.Event()
+
+    async def request(name: str, priority: Priority):
+        async with rate_limiter.acquire(priority=priority):
+            order.append(name)
+            await release.wait()
+
+    first = asyncio.create_task(request('first', Priority.ingestion))
+    await asyncio.sleep(0)
+    queued = [
+        asyncio.create_task(request('ingestion', Priority.ingestion)),
+        asyncio.create_task(request('search', Priority.search)),
+    ]
+    await asyncio.sleep(0)
+    assert rate_limiter.queue_depth == 2
+
+    release.set()
+    await asyncio.gather(first, *queued)
+
+    assert order == ['first', 'search', 'ingestion']
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_errors_halve_concurrency_and_set_limits():
+    rate_limiter = RateLimiter('test', max_concurrency=8)
+    headers = {'retry-after-ms': '10', 'x-ratelimit-limit-requests': '600'}
+
+    with pytest.raises(RateLimitError):
+        async with rate_limiter.acquire():
+            raise RateLimitError(headers)
+
+    assert rate_limiter.concurrency == 4
+    assert rate_limiter.requests.per_minute == 600
+    assert rate_limiter.rate_limited == 1
+
+    # Concurrency grows back by one slot per window of successful requests
+    for _ in range(5):
+        async with rate_limiter.acquire():
+            pass
+    assert int(rate_limiter.concurrency) == 5
+
+
+@pytest.mark.asyncio
+async def test_clients_share_a_limiter_per_class():
+    class Reranker(CrossEncoderClient):
+        async def rank(self, query: str, passages: list[str]) -> list[tuple[str, float]]:
+            return [(passage, rate_limiter.in_flight) for passage in passages]
+
+    rate_limiter = get_rate_limiter('Reranker')
+
+    with request_priority(Priority.search):
+        assert await Reranker().rank('query', ['passage']) == [('passage', 1)]
+    assert rate_limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_clients_share_a_limiter_per_endpoint():
+    class Embedder(EmbedderClient):
+        async def create(self, input_data):
+            return [float(get_rate_limiter(f'Embedder:{self.config.base_url}').in_flight)]
+
+    def embedder(base_url: str) -> Embedder:
+        client = Embedder()
+        client.config = SimpleNamespace(base_url=base_url)  # type: ignore[attr-defined]
+        return client
+
+    ollama = embedder('http://localhost:11434/v1')
+    openai = embedder('https://api.openai.com/v1')
+
+    # Each call holds a slot of the limiter of its own endpoint
+    assert await ollama.create('text') == [1.0]
+    assert await openai.create('text') == [1.0]
+    assert get_rate_limiter(_rate_limiter_name(ollama)) is not get_rate_limiter(
+        _rate_limiter_name(openai)
+    )
+    assert _rate_limiter_name(embedder('http://localhost:11434/v1')) == _rate_limiter_name(ollama)